@@ -1,65 +1,410 @@
 
 
+import html
+import inspect
+import json
+import os
+import re
+import time
+import zlib
+
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
+from _pytest.junitxml import xml_key
 
-@pytest.fixture
-def driver():
+from utils.async_flows import ExecutorAssincrono
+from utils.artifacts import TIPOS_DISPONIVEIS, ArmazemImagens, GravadorArtefatos
+from utils.browser_pool import BrowserPool
+from utils.browser_profile import CATEGORIAS_DISPONIVEIS, ESTRATEGIAS_CARREGAMENTO, PERFIS, interpretar_bloqueio
+from utils.data_source import parametrizar
+from utils.duration_history import ARQUIVO_HISTORICO, MARCADORES_RASTREADOS, HistoricoDuracoes, mini_grafico
+from utils.impact import (
+    ARQUIVO_MAPA,
+    analisar_mudancas,
+    carregar_mapa,
+    conferir_mapa,
+    encerrar_registro,
+    incorporar_registro,
+    iniciar_registro,
+    salvar_mapa,
+    selecionar,
+)
+from utils.environment import ARQUIVO_AMBIENTES, carregar_ambiente
+from utils.page_metrics import (
+    ARQUIVO_SERIE,
+    MODOS_ORCAMENTO,
+    encerrar_coleta,
+    exportar_serie,
+    iniciar_coleta,
+    resumir_por_pagina,
+)
+from utils.local_server import ServidorLocal
+from utils.logger import (
+    NIVEIS,
+    anotar_contexto,
+    arquivo_do_worker,
+    configurar as configurar_log,
+    encerrar as encerrar_log,
+    encerrar_teste,
+    formatar_linhas,
+    incorporar_linhas,
+    iniciar_teste,
+    teste_atual,
+)
+from utils.remote_grid import GridRemoto
+from utils.session_cache import CacheSessoes
+from utils.driver_binary import DIRETORIO_CACHE_PADRAO, resolver_driver
+from utils.driver_factory import NAVEGADORES, ConfiguracaoNavegador, criar_driver, interpretar_navegadores
+from utils.timing import (
+    encerrar_gravacao,
+    iniciar_gravacao,
+    maiores_ralos,
+    salvar_spans,
+    somar_totais,
+    span,
+)
+from utils.parallel import (
+    DIRETORIO_ARTEFATOS,
+    diretorio_do_worker,
+    eh_processo_principal,
+    id_do_worker,
+    indexar_artefatos,
+    modo_paralelo,
+    nodeid_sem_grupo,
+    ordenar_mais_lentos_primeiro,
+)
+from pages.base_page import BasePage
+
+ESTATISTICAS_POOL = pytest.StashKey[dict]()
+CAMINHOS_DRIVERS = pytest.StashKey[dict]()
+GRID = pytest.StashKey[object]()
+AMBIENTE = pytest.StashKey[object]()
+DIRETORIO_EXECUCAO = pytest.StashKey[str]()
+GRAVADOR_ARTEFATOS = pytest.StashKey[object]()
+REGRESSOES = pytest.StashKey[list]()
+ANALISE_IMPACTO = pytest.StashKey[object]()
+EXECUTOR_ASSINCRONO = pytest.StashKey[object]()
+LOTE_ASSINCRONO = pytest.StashKey[dict]()
+RESULTADOS_ASSINCRONOS = pytest.StashKey[dict]()
+DURACAO_NO_LOTE = pytest.StashKey[float]()
+
+# Fixtures de navegador cujas falhas geram artefatos
+FIXTURES_DE_NAVEGADOR = ("driver", "driver_melhorado", "driver_configuravel")
+
+# O que um teste "async def" pode pedir para rodar no lote concorrente (--async-sessions),
+# além dos próprios parâmetros (parametrize, @data_source)
+FIXTURES_DO_LOTE = ("sessao_assincrona", "navegador", "base_url")
+
+# Duração de cada fase (setup, call, teardown), resultado e marcadores de cada teste nesta execução
+_duracoes_da_execucao = {}
+
+# Páginas e locators que cada teste usou ({nodeid: {"arquivos": [...], "locators": [...]}})
+_mapa_da_execucao = {}
+
+# Métricas de cada navegação medida nesta execução (utils/page_metrics.py), com nodeid e navegador
+_metricas_da_execucao = []
+
+# Acima desta mediana (segundos), o --durations-trend sugere @pytest.mark.slow
+SEGUNDOS_PARA_SER_SLOW = 10.0
+
+# Tempo somado por span ({nome: [chamadas, segundos]}) de todos os testes
+_totais_spans = {}
+
+
+def _navegadores(config):
+    """Navegadores pedidos em --browser (ex: "chrome,firefox" roda a suíte nos dois)"""
+    return interpretar_navegadores(config.getoption("--browser"))
+
+
+def _caminho_driver(config, navegador="chrome"):
     """
     EXPLICAÇÃO:
-    - Esta função vai ser chamada antes de cada teste
-    - Ela prepara um navegador Chrome limpo
-    - Depois do teste, fecha tudo automaticamente
+    Resolve o driver de cada navegador uma única vez por processo.
+    Workers do xdist recebem os caminhos prontos do processo principal.
+    """
+    caminhos = config.stash.setdefault(CAMINHOS_DRIVERS, {})
+    if navegador not in caminhos:
+        workerinput = getattr(config, "workerinput", {})
+        caminhos[navegador] = workerinput.get("drivers", {}).get(navegador) or resolver_driver(
+            navegador,
+            caminho_fixo=config.getoption("--chromedriver-path") if navegador == "chrome" else None,
+            diretorio_cache=config.getoption("--driver-cache-dir"),
+        )
+    return caminhos[navegador]
+
+
+def _url_do_grid(config):
+    """Selenium Grid pedido em --grid-url ou no perfil de ambiente (None = navegadores locais)"""
+    return config.getoption("--grid-url") or config.stash[AMBIENTE].grid_url
+
+
+def _grid(config):
+    """
+    EXPLICAÇÃO:
+    Um GridRemoto por processo (conexões keep-alive divididas entre
+    todas as sessões). O limite de sessões sendo criadas ao mesmo
+    tempo vale para a execução inteira: é dividido entre os workers.
+    """
+    if GRID not in config.stash:
+        workers = getattr(config, "workerinput", {}).get("workercount", 1)
+        config.stash[GRID] = GridRemoto(
+            _url_do_grid(config),
+            max_criacoes=-(-config.getoption("--grid-max-creating") // workers),
+            tentativas=config.getoption("--grid-retries"),
+        )
+    return config.stash[GRID]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Processo principal do xdist repassa os drivers já resolvidos
+    e a pasta desta execução (todos os workers gravam na mesma)
+    """
+    node.workerinput["diretorio_execucao"] = node.config.stash[DIRETORIO_EXECUCAO]
+    node.workerinput["drivers"] = {}
+    if _url_do_grid(node.config):
+        return  # Navegadores no grid: nenhum driver local
+    for navegador in _navegadores(node.config):
+        try:
+            node.workerinput["drivers"][navegador] = _caminho_driver(node.config, navegador)
+        except Exception as e:
+            print(f"⚠️ driver do {navegador} não resolvido no processo principal: {str(e)}")
+
+
+def _configuracao(config, navegador, fidelidade_total=False, headless=None, **extras):
+    """
+    EXPLICAÇÃO:
+    Configuração do navegador vinda da linha de comando e do ambiente:
+    - sem interface com --headless ou headless no perfil de ambiente (--env)
+    - perfil (--browser-profile) e bloqueios (--block); com fidelidade_total,
+      o navegador completo de sempre, sem nada desligado
+    - argumentos extras do perfil de ambiente
+    - canal de eventos com buffer de --event-buffer eventos (0 = sem canal)
+    """
+    ambiente = config.stash[AMBIENTE]
+    if headless is None:
+        headless = config.getoption("--headless") or ambiente.headless
+    return ConfiguracaoNavegador(
+        navegador=navegador,
+        headless=headless,
+        perfil="padrao" if fidelidade_total else config.getoption("--browser-profile"),
+        estrategia=config.getoption("--page-load-strategy"),
+        bloqueio=[] if fidelidade_total else interpretar_bloqueio(config.getoption("--block")),
+        argumentos=list(ambiente.argumentos_navegador),
+        base_url=BasePage.BASE_URL,
+        eventos=max(0, config.getoption("--event-buffer")),
+        **extras,
+    )
+
+
+def _fidelidade_total(item):
+    """
+    EXPLICAÇÃO:
+    Testes com @pytest.mark.full_fidelity precisam do navegador completo.
+    Se o perfil já é o padrão e nada é bloqueado, o navegador normal
+    já é completo (e não precisa de um pool separado).
+    """
+    if item.get_closest_marker("full_fidelity") is None:
+        return False
+    config = item.config
+    return config.getoption("--browser-profile") != "padrao" or bool(config.getoption("--block"))
+
+
+def _obter_pool(request, configuracao):
     """
+    EXPLICAÇÃO:
+    Cada "receita" de navegador tem seu próprio pool,
+    assim um teste nunca recebe um navegador configurado de outro jeito
+    """
+    pools = request.getfixturevalue("pools_de_navegador")
+    nome = configuracao.chave()
+    if nome not in pools:
+        config = request.config
+
+        def fabrica():
+            if _url_do_grid(config):
+                return criar_driver(configuracao, grid=_grid(config))
+            return criar_driver(configuracao, _caminho_driver(config, configuracao.navegador))
+
+        pools[nome] = BrowserPool(
+            fabrica,
+            tamanho=request.config.getoption("--pool-size"),
+            max_usos=request.config.getoption("--pool-max-uses"),
+        )
+    return pools[nome]
+
+
+def _executor(config):
+    """Event loop e pools das sessões assíncronas deste processo (criados no primeiro uso)"""
+    if EXECUTOR_ASSINCRONO not in config.stash:
+        config.stash[EXECUTOR_ASSINCRONO] = ExecutorAssincrono(
+            concorrencia=config.getoption("--async-sessions"),
+            max_usos=config.getoption("--pool-max-uses"),
+        )
+    return config.stash[EXECUTOR_ASSINCRONO]
+
+
+def _pool_assincrono(config, configuracao):
+    """Pool de sessões assíncronas da configuração: no grid, ou com o driver local"""
+    url_grid = _url_do_grid(config)
+    caminho = None if url_grid else _caminho_driver(config, configuracao.navegador)
+    return _executor(config).pool(configuracao, caminho_driver=caminho, url_grid=url_grid)
+
+
+@pytest.fixture(scope="session")
+def pools_de_navegador(request):
+    """
+    EXPLICAÇÃO:
+    Guarda os pools de navegadores durante toda a sessão (um por worker).
+    No final, fecha tudo (e as conexões com o grid) e anota as
+    estatísticas para o relatório.
+    """
+    pools = {}
     
+    yield pools
+    
+    estatisticas = request.config.stash.setdefault(ESTATISTICAS_POOL, {})
+    resumos = []
+    for pool in pools.values():
+        pool.encerrar()
+        resumos.append(pool.estatisticas())
+    grid = request.config.stash.get(GRID, None)
+    if grid is not None:
+        grid.encerrar()
+        resumos.append(grid.estatisticas())
+    for resumo in resumos:
+        for chave, valor in resumo.items():
+            estatisticas[chave] = estatisticas.get(chave, 0) + valor
+
+
+@pytest.fixture(scope="session")
+def ambiente(request):
+    """Perfil de ambiente escolhido com --env"""
+    return request.config.stash[AMBIENTE]
+
 
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized") 
+@pytest.fixture(scope="session", autouse=True)
+def base_url(request):
+    """
+    EXPLICAÇÃO:
+    Define para onde TODAS as páginas apontam
+    (--base-url, ou o base_url do ambiente escolhido com --env).
+    Com base_url "local", sobe a cópia local do site uma vez
+    por sessão (uma por worker), numa porta livre.
+    """
+    ambiente = request.config.stash[AMBIENTE]
+    valor = request.config.getoption("--base-url") or ambiente.base_url
+    servidor = None
     
-    service = Service(ChromeDriverManager().install())
+    if valor == "local":
+        servidor = ServidorLocal().iniciar()
+        valor = servidor.url
     
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    url_original = BasePage.BASE_URL
+    BasePage.configurar_base_url(valor)
+    
+    yield BasePage.BASE_URL
+    
+    BasePage.configurar_base_url(url_original)
+    if servidor:
+        servidor.parar()
+
+
+@pytest.fixture(scope="session")
+def cache_sessoes(request):
+    """
+    EXPLICAÇÃO:
+    Sessões autenticadas guardadas durante a execução (uma cópia por worker).
+    Use com LoginPage.entrar_com_sessao_em_cache().
+    """
+    cache = CacheSessoes(ttl=request.config.getoption("--session-ttl"))
+    yield cache
+    print(f"🎫 Cache de sessões: {cache.estatisticas()}")
+
+
+@pytest.fixture
+def navegador(request):
+    """
+    EXPLICAÇÃO:
+    Qual navegador este teste usa. Com --browser=chrome,firefox
+    cada teste roda uma vez por navegador (test_x[chrome], test_x[firefox]).
+    O navegador fica anotado no relatório (JUnit e histórico de durações).
+    """
+    nome = getattr(request, "param", None) or _navegadores(request.config)[0]
+    request.node.user_properties.append(("navegador", nome))
+    anotar_contexto(navegador=nome)
+    return nome
+
+
+@pytest.fixture
+def driver(request, navegador):
+    """
+    EXPLICAÇÃO:
+    - Esta função vai ser chamada antes de cada teste
+    - Ela entrega um navegador limpo (novo ou reaproveitado do pool)
+    - Depois do teste, o navegador é limpo e volta para o pool
+    - Testes @pytest.mark.full_fidelity usam um navegador completo
+      (sem o perfil performance nem bloqueios), de outro pool
+    """
+    
+    pool = _obter_pool(request, _configuracao(request.config, navegador, _fidelidade_total(request.node)))
+    with span("driver.adquirir"):
+        driver = pool.adquirir()
     
     
     yield driver
     
 
-    driver.quit()  
+    with span("driver.devolver"):
+        pool.devolver(driver)  
 
 
 @pytest.fixture 
-def driver_melhorado():
+def driver_melhorado(request, navegador):
     """
     MELHORIAS EXPLICADAS:
     1. Adicionamos mais configurações úteis
     2. Evitamos detecção de automação
-    3. Configuramos timeouts
+    3. Sem implicit wait: as esperas explícitas da BasePage
+       não ficam somando tempo morto
+    4. O navegador vem do pool (sem partida a frio a cada teste)
     """
     
-    chrome_options = Options()
-    
-   
-    chrome_options.add_argument("--start-maximized")
-    
-    
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    
-    
-    driver.implicitly_wait(10)  # 10 segundos
+    pool = _obter_pool(
+        request, _configuracao(request.config, navegador, _fidelidade_total(request.node), sem_deteccao=True)
+    )
+    with span("driver.adquirir"):
+        driver = pool.adquirir()
     
+    yield driver
+    with span("driver.devolver"):
+        pool.devolver(driver)
+
+
+
+@pytest.fixture
+def sessao_assincrona(request, navegador):
+    """
+    EXPLICAÇÃO:
+    Sessão assíncrona (utils.async_webdriver) para testes "async def":
+        async def test_x(sessao_assincrona):
+            await AsyncLoginPage(sessao_assincrona).navegar_para_login()
+    Com --async-sessions=N os testes async rodam N de cada vez, no mesmo
+    processo: aí quem entrega a sessão é o lote (pytest_pyfunc_call)
+    e esta fixture não abre nada.
+    """
+    if request.node.nodeid in request.config.stash.get(LOTE_ASSINCRONO, {}):
+        yield None
+        return
     
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    executor = _executor(request.config)
+    pool = _pool_assincrono(request.config, _configuracao(request.config, navegador, _fidelidade_total(request.node)))
+    with span("driver.adquirir"):
+        sessao = executor.rodar(pool.adquirir())
     
-    yield driver
-    driver.quit()
+    yield sessao
+    with span("driver.devolver"):
+        executor.rodar(pool.devolver(sessao))
 
 
 
@@ -73,7 +418,7 @@ def pytest_addoption(parser):
         "--browser", 
         action="store", 
         default="chrome",
-        help="Qual navegador usar: chrome, firefox"
+        help=f"Qual navegador usar: {', '.join(NAVEGADORES)} (vários separados por vírgula rodam a suíte em cada um)"
     )
     parser.addoption(
         "--headless", 
@@ -81,37 +426,633 @@ def pytest_addoption(parser):
         default=False,
         help="Executar sem interface gráfica (mais rápido)"
     )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default="padrao",
+        choices=PERFIS,
+        help="Perfil de inicialização: padrao (navegador completo) ou performance (headless, janela fixa, sem extras)"
+    )
+    parser.addoption(
+        "--page-load-strategy",
+        action="store",
+        default="eager",
+        choices=ESTRATEGIAS_CARREGAMENTO,
+        help="pageLoadStrategy do perfil performance"
+    )
+    parser.addoption(
+        "--block",
+        action="store",
+        default="",
+        help=f"Bloquear requisições (separado por vírgula): {', '.join(CATEGORIAS_DISPONIVEIS)}"
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Quantos navegadores livres cada worker mantém aquecidos"
+    )
+    parser.addoption(
+        "--pool-max-uses",
+        action="store",
+        type=int,
+        default=50,
+        help="Depois de quantos testes um navegador do pool é descartado"
+    )
+    parser.addoption(
+        "--async-sessions",
+        action="store",
+        type=int,
+        default=1,
+        help="Testes 'async def': quantos rodam ao mesmo tempo neste processo, cada um com sua sessão"
+    )
+    parser.addoption(
+        "--chromedriver-path",
+        action="store",
+        default=None,
+        help="Usar sempre este chromedriver local (ou variável CHROMEDRIVER_PATH; GECKODRIVER_PATH e MSEDGEDRIVER_PATH para os outros)"
+    )
+    parser.addoption(
+        "--driver-cache-dir",
+        action="store",
+        default=DIRETORIO_CACHE_PADRAO,
+        help="Onde guardar o manifesto com os caminhos dos drivers"
+    )
+    parser.addoption(
+        "--grid-url",
+        action="store",
+        default=None,
+        help="Criar os navegadores num Selenium Grid/standalone remoto (ex: http://localhost:4444)"
+    )
+    parser.addoption(
+        "--grid-max-creating",
+        action="store",
+        type=int,
+        default=4,
+        help="Máximo de sessões sendo criadas no grid ao mesmo tempo (somando todos os workers)"
+    )
+    parser.addoption(
+        "--grid-retries",
+        action="store",
+        type=int,
+        default=5,
+        help="Novas tentativas (com espera crescente) quando o grid recusa uma sessão"
+    )
+    parser.addoption(
+        "--env",
+        action="store",
+        default=None,
+        help="Perfil de ambiente (config/ambientes.json): producao, ci, local..."
+    )
+    parser.addoption(
+        "--env-file",
+        action="store",
+        default=ARQUIVO_AMBIENTES,
+        help="Arquivo com os perfis de ambiente"
+    )
+    parser.addoption(
+        "--base-url",
+        action="store",
+        default=None,
+        help="Endereço do site testado (sobrescreve o do ambiente), ou 'local' para a cópia local"
+    )
+    parser.addoption(
+        "--session-ttl",
+        action="store",
+        type=float,
+        default=600,
+        help="Segundos que uma sessão autenticada fica reaproveitável (0 desliga o cache)"
+    )
+    parser.addoption(
+        "--workers",
+        action="store",
+        default=None,
+        help="Executar em paralelo: 'auto' (um worker por núcleo) ou um número"
+    )
+    parser.addoption(
+        "--artifacts",
+        action="store",
+        default="screenshot,url,eventos",
+        help=f"O que guardar quando um teste falha (separado por vírgula): {', '.join(TIPOS_DISPONIVEIS)}"
+    )
+    parser.addoption(
+        "--artifacts-events",
+        action="store",
+        type=int,
+        default=100,
+        help="Quantos dos últimos eventos do navegador guardar numa falha (artefato 'eventos')"
+    )
+    parser.addoption(
+        "--event-buffer",
+        action="store",
+        type=int,
+        default=500,
+        help="Tamanho do buffer de eventos WebDriver BiDi por navegador (0 desliga o canal de eventos)"
+    )
+    parser.addoption(
+        "--artifacts-max",
+        action="store",
+        type=int,
+        default=20,
+        help="Máximo de falhas com artefatos por execução (protege o disco numa queda do site)"
+    )
+    parser.addoption(
+        "--durations-db",
+        action="store",
+        default=ARQUIVO_HISTORICO,
+        help="Banco SQLite com o histórico de durações dos testes"
+    )
+    parser.addoption(
+        "--duration-regression",
+        action="store",
+        type=float,
+        default=50.0,
+        help="Avisar quando um teste ficar mais que X%% mais lento que a própria mediana"
+    )
+    parser.addoption(
+        "--durations-trend",
+        action="store_true",
+        default=False,
+        help="Mostrar no final a tendência de duração dos testes mais lentos"
+    )
+    parser.addoption(
+        "--impacted",
+        action="store",
+        nargs="?",
+        const="HEAD",
+        default=None,
+        help="Rodar só os testes afetados pelas mudanças desde a referência git (padrão: HEAD, ex: origin/main)"
+    )
+    parser.addoption(
+        "--log-console",
+        action="store",
+        default="silencioso",
+        choices=list(NIVEIS),
+        help="A partir de qual nível o log das páginas aparece na hora (padrão: nada; falhas mostram o log no relatório)"
+    )
+    parser.addoption(
+        "--log-buffer",
+        action="store",
+        type=int,
+        default=1000,
+        help="Quantas linhas de log cada teste guarda para mostrar se falhar"
+    )
+    parser.addoption(
+        "--log-jsonl",
+        action="store",
+        default=None,
+        help="Gravar todas as linhas de log em JSON Lines (um arquivo por worker: log.gw0.jsonl...)"
+    )
+    parser.addoption(
+        "--page-metrics",
+        action="store_true",
+        default=False,
+        help="Medir o carregamento de cada navegação (timing, LCP, requisições, bytes)"
+    )
+    parser.addoption(
+        "--budget",
+        action="store",
+        default="warn",
+        choices=MODOS_ORCAMENTO,
+        help="Página acima do orçamento (LOAD_BUDGET_MS...): avisar, falhar o teste ou ignorar"
+    )
+    parser.addoption(
+        "--page-metrics-file",
+        action="store",
+        default=ARQUIVO_SERIE,
+        help="JSONL onde as métricas de cada execução são acrescentadas (série temporal entre builds)"
+    )
+    parser.addoption(
+        "--impact-map",
+        action="store",
+        default=ARQUIVO_MAPA,
+        help="Arquivo com as páginas e locators que cada teste usou"
+    )
+    parser.addoption(
+        "--data-shard",
+        action="store",
+        default=None,
+        help="Rodar só uma parte das linhas dos testes @data_source, ex: 1/4 (um job de CI por parte)"
+    )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Rodar os testes @benchmark (abrem vários navegadores; fora da execução normal)"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """
+    EXPLICAÇÃO:
+    Traduz --workers para as opções do pytest-xdist antes dele começar:
+    - um worker por núcleo (ou o número pedido)
+    - fila alimentada de 1 em 1, para os testes lentos (que vêm primeiro)
+      se espalharem entre os workers
+    - com vários navegadores (--browser=chrome,firefox), cada worker fica
+      com um navegador só (--dist loadgroup, grupos do pytest_generate_tests)
+    - relatório JUnit em reports/report.xml (o xdist junta os resultados)
+    """
+    workers = config.getoption("--workers")
+    if workers is None or hasattr(config, "workerinput"):
+        return
+    if not config.pluginmanager.hasplugin("xdist"):
+        raise pytest.UsageError("--workers precisa do pytest-xdist instalado")
+    
+    config.option.numprocesses = workers if workers == "auto" else int(workers)
+    if config.option.maxschedchunk is None:
+        config.option.maxschedchunk = 1
+    try:
+        varios_navegadores = len(_navegadores(config)) > 1
+    except ValueError:
+        varios_navegadores = False  # O pytest_configure mostra o erro
+    if varios_navegadores and config.option.dist == "no":
+        config.option.dist = "loadgroup"
+    if not config.option.xmlpath:
+        config.option.xmlpath = os.path.join("reports", "report.xml")
+
+
+def pytest_configure(config):
+    """
+    EXPLICAÇÃO:
+    - Carrega o perfil de ambiente (--env) e aplica os timeouts nas páginas
+    - Anota o ambiente no relatório HTML, para comparar tempos entre ambientes
+    - Cada execução tem sua pasta de artefatos (reports/artefatos/<data-hora>),
+      e cada worker grava na sua subpasta
+    - Screenshots vão para um armazém compartilhado (imagens repetidas viram uma só)
+    """
+    try:
+        interpretar_bloqueio(config.getoption("--block"))
+        _navegadores(config)
+        ambiente = carregar_ambiente(config.getoption("--env"), config.getoption("--env-file"))
+    except (ValueError, OSError) as e:
+        raise pytest.UsageError(str(e))
+    
+    arquivo_log = config.getoption("--log-jsonl")
+    configurar_log(
+        nivel_console=config.getoption("--log-console"),
+        capacidade=config.getoption("--log-buffer"),
+        arquivo_jsonl=arquivo_do_worker(arquivo_log, id_do_worker(config)) if arquivo_log else None,
+        worker=id_do_worker(config),
+    )
+    
+    config.stash[AMBIENTE] = ambiente
+    BasePage.configurar_ambiente(ambiente)
+    BasePage.COLETAR_METRICAS = config.getoption("--page-metrics")
+    BasePage.MODO_ORCAMENTO = config.getoption("--budget")
+    
+    try:
+        from pytest_metadata.plugin import metadata_key
+        metadados = config.stash[metadata_key]
+        metadados["Ambiente"] = ambiente.nome
+        metadados["Base URL"] = config.getoption("--base-url") or ambiente.base_url
+        metadados["Timeouts"] = f"{ambiente.timeout}s / {ambiente.timeout_curto}s"
+    except (ImportError, KeyError):
+        pass  # Sem pytest-html/pytest-metadata: só não anota no relatório
+    
+    workerinput = getattr(config, "workerinput", {})
+    config.stash[DIRETORIO_EXECUCAO] = workerinput.get("diretorio_execucao") or os.path.join(
+        DIRETORIO_ARTEFATOS, time.strftime("%Y%m%d-%H%M%S")
+    )
+    pasta_do_worker = diretorio_do_worker(config, base=config.stash[DIRETORIO_EXECUCAO])
+    BasePage.DIRETORIO_SCREENSHOTS = os.path.join(pasta_do_worker, "screenshots")
+    BasePage.ARMAZEM_IMAGENS = ArmazemImagens(os.path.join(config.stash[DIRETORIO_EXECUCAO], "imagens"))
+
+
+def pytest_sessionstart(session):
+    """
+    EXPLICAÇÃO:
+    Anota o ambiente no relatório JUnit (reports/report.xml).
+    Quem grava o XML é o processo principal: no xdist, propriedades
+    anotadas pelos workers (record_testsuite_property) se perdem.
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+    xml = session.config.stash.get(xml_key, None)
+    if xml is not None:
+        xml.add_global_property("ambiente", session.config.stash[AMBIENTE].nome)
+
+
+def pytest_report_header(config):
+    """Mostra o ambiente (e a seleção por impacto, se pedida) logo no começo da saída do pytest"""
+    ambiente = config.stash[AMBIENTE]
+    linhas = [
+        f"ambiente: {ambiente.nome} ({ambiente.descricao}) - base_url: {config.getoption('--base-url') or ambiente.base_url}",
+        f"navegadores: {', '.join(_navegadores(config))}" + (f" - grid: {_url_do_grid(config)}" if _url_do_grid(config) else ""),
+    ]
+    if config.getoption("--async-sessions") > 1:
+        linhas.append(f"testes async: até {config.getoption('--async-sessions')} ao mesmo tempo neste processo")
+    analise = _analise_de_impacto(config)
+    if analise is not None:
+        if analise.motivo_completo:
+            linhas.append(f"seleção por impacto: rodando tudo - {analise.motivo_completo}")
+        else:
+            alterado = sorted(analise.arquivos_teste | analise.paginas | analise.locators)
+            linhas.append(f"seleção por impacto ({config.getoption('--impacted')}): {', '.join(alterado) or 'nada alterado'}")
+    return linhas
+
+
+def _analise_de_impacto(config):
+    """
+    EXPLICAÇÃO:
+    O que mudou desde a referência do --impacted (None sem a opção).
+    Sem mapa de impacto ainda, a análise já manda rodar tudo.
+    """
+    if config.getoption("--impacted") is None:
+        return None
+    if ANALISE_IMPACTO not in config.stash:
+        analise = analisar_mudancas(config.getoption("--impacted"), str(config.rootpath))
+        mapa = carregar_mapa(config.getoption("--impact-map"))
+        if not analise.motivo_completo and not mapa:
+            analise = analise._replace(motivo_completo="ainda não existe mapa de impacto (rode a suíte completa uma vez)")
+        analise = conferir_mapa(analise, mapa)
+        config.stash[ANALISE_IMPACTO] = analise
+    return config.stash[ANALISE_IMPACTO]
+
+
+def pytest_generate_tests(metafunc):
+    """
+    EXPLICAÇÃO:
+    - Testes marcados com @data_source ganham uma execução por linha do arquivo
+    - Com vários navegadores (--browser=chrome,firefox), testes que usam
+      navegador ganham uma execução por navegador
+    """
+    marcador = metafunc.definition.get_closest_marker("data_source")
+    if marcador is not None:
+        cache = getattr(metafunc.config, "cache", None)
+        parametrizar(
+            metafunc,
+            marcador,
+            diretorio_cache=cache.mkdir("fontes_de_dados") if cache else None,
+            shard=metafunc.config.getoption("--data-shard"),
+        )
+    
+    navegadores = _navegadores(metafunc.config)
+    if "navegador" in metafunc.fixturenames and len(navegadores) > 1:
+        metafunc.parametrize(
+            "navegador",
+            [
+                pytest.param(nome, id=nome, marks=pytest.mark.xdist_group(_grupo_do_navegador(metafunc, nome, navegadores)))
+                for nome in navegadores
+            ],
+            indirect=True,
+        )
+
+
+def _grupo_do_navegador(metafunc, navegador, navegadores):
+    """
+    EXPLICAÇÃO:
+    Grupo do xdist (--dist loadgroup) de um teste neste navegador.
+    Os workers são divididos entre os navegadores: com 4 workers e
+    2 navegadores, os testes do Chrome vão para "chrome-0" e "chrome-1".
+    Assim cada worker só sobe (e mantém no pool) um tipo de navegador.
+    O grupo sai do nodeid, então todos os workers calculam igual.
+    """
+    workers = getattr(metafunc.config, "workerinput", {}).get("workercount", 1)
+    grupos = max(1, workers // len(navegadores))
+    return f"{navegador}-{zlib.crc32(metafunc.definition.nodeid.encode('utf-8')) % grupos}"
+
+
+def _historico(config):
+    return HistoricoDuracoes(config.getoption("--durations-db"))
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    EXPLICAÇÃO:
+    - Com --impacted, tira da execução os testes que a mudança não afeta
+    - Em paralelo, os testes mais lentos (mediana do histórico) são distribuídos primeiro
+    - Sem --benchmark, os testes @benchmark são pulados
+    """
+    if not config.getoption("--benchmark"):
+        pular = pytest.mark.skip(reason="benchmark: rode com --benchmark")
+        for item in items:
+            if item.get_closest_marker("benchmark") is not None:
+                item.add_marker(pular)
+    
+    analise = _analise_de_impacto(config)
+    if analise is not None and not analise.motivo_completo:
+        afetados, nao_afetados = selecionar(items, carregar_mapa(config.getoption("--impact-map")), analise)
+        if nao_afetados:
+            config.hook.pytest_deselected(items=nao_afetados)
+            items[:] = afetados
+    
+    if modo_paralelo(config):
+        historico = _historico(config)
+        medianas = {}
+        for navegador in _navegadores(config):
+            medianas.update(historico.medianas(navegador))
+        ordenar_mais_lentos_primeiro(items, medianas)
+
+
+def pytest_runtest_logreport(report):
+    """
+    EXPLICAÇÃO:
+    Guarda a duração de cada fase (setup, call, teardown) de cada teste,
+    o resultado, os marcadores slow/smoke/critical_path e o navegador
+    (relatórios dos workers incluídos)
+    """
+    if report.outcome == "rerun":
+        return  # Tentativas do pytest-rerunfailures não contam como duração do teste
+    registro = _duracoes_da_execucao.setdefault(nodeid_sem_grupo(report.nodeid), {
+        "resultado": "passed",
+        "marcadores": [marcador for marcador in MARCADORES_RASTREADOS if marcador in report.keywords],
+    })
+    navegador = dict(report.user_properties).get("navegador")
+    if navegador:
+        registro["navegador"] = navegador
+    registro[report.when] = registro.get(report.when, 0.0) + report.duration
+    if report.failed:
+        registro["resultado"] = "failed"
+    elif report.skipped and registro["resultado"] == "passed":
+        registro["resultado"] = "skipped"
 
 @pytest.fixture
-def driver_configuravel(request):
+def driver_configuravel(request, navegador):
     """
     EXPLICAÇÃO:
     Agora o driver pode ser configurado por parâmetros
+    (--browser=chrome|firefox|edge, --headless, --browser-profile...)
     """
     
     
-    browser = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless")
+    configuracao = _configuracao(request.config, navegador, _fidelidade_total(request.node))
     
-    print(f"Iniciando {browser} (sem interface: {headless})")
+    print(f"Iniciando {navegador} (sem interface: {configuracao.headless})")
     
-    if browser == "chrome":
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        
-        if headless:
-            chrome_options.add_argument("--headless")
-            
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-    else:
-        raise ValueError(f"Navegador {browser} não suportado ainda")
-    
-    driver.implicitly_wait(10)
+    pool = _obter_pool(request, configuracao)
+    with span("driver.adquirir"):
+        driver = pool.adquirir()
     
     yield driver
-    driver.quit()
+    with span("driver.devolver"):
+        pool.devolver(driver)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    EXPLICAÇÃO:
+    Liga o gravador de spans durante o teste inteiro (fixtures incluídas).
+    No final, salva o "flame" do teste em JSON e soma no total da sessão.
+    Também anota as páginas e locators usados (mapa de impacto)
+    e as métricas de carregamento de cada navegação.
+    O log das páginas vai para um buffer do teste (mostrado só se falhar).
+    """
+    iniciar_gravacao()
+    iniciar_registro()
+    iniciar_coleta()
+    iniciar_teste(nodeid_sem_grupo(item.nodeid))
+    try:
+        yield
+    finally:
+        encerrar_teste()
+        gravador = encerrar_gravacao()
+        _mapa_da_execucao[nodeid_sem_grupo(item.nodeid)] = encerrar_registro(str(item.config.rootpath))
+        navegador = dict(item.user_properties).get("navegador")
+        _metricas_da_execucao.extend(
+            {"nodeid": nodeid_sem_grupo(item.nodeid), "navegador": navegador, **navegacao}
+            for navegacao in encerrar_coleta()
+        )
+    if gravador is None:
+        return
+    
+    nome_arquivo = re.sub(r"[^\w.-]+", "_", item.nodeid) + ".json"
+    salvar_spans(gravador, os.path.join("reports", "spans", id_do_worker(item.config), nome_arquivo))
+    somar_totais(_totais_spans, gravador.totais())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    with span("fase.setup"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    with span("fase.call"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    with span("fase.teardown"):
+        yield
+
+
+def pytest_collection_finish(session):
+    """
+    EXPLICAÇÃO:
+    Com --async-sessions=N (N > 1), escolhe os testes "async def" que
+    vão rodar juntos no lote concorrente: os que só pedem sessão,
+    navegador, base_url e os próprios parâmetros. Os outros (fixtures
+    próprias, skip/xfail) rodam um de cada vez, como sempre.
+    Nos workers do xdist não há lote: cada worker roda só a sua parte.
+    """
+    config = session.config
+    if config.getoption("--async-sessions") <= 1 or hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    config.stash[LOTE_ASSINCRONO] = {
+        item.nodeid: item for item in session.items if _pode_ir_para_o_lote(item)
+    }
+
+
+def _pode_ir_para_o_lote(item):
+    if not inspect.iscoroutinefunction(getattr(item, "obj", None)):
+        return False
+    if any(item.get_closest_marker(nome) is not None for nome in ("skip", "skipif", "xfail")):
+        return False
+    parametros = getattr(item, "callspec", None)
+    parametros = parametros.params if parametros is not None else {}
+    return all(nome in FIXTURES_DO_LOTE or nome in parametros for nome in item._fixtureinfo.argnames)
+
+
+def _fluxo_do_item(config, item):
+    """
+    EXPLICAÇÃO:
+    O teste como um fluxo do lote: pega uma sessão do pool assíncrono,
+    chama a função do teste com os argumentos dela e devolve a sessão
+    """
+    nomes = item._fixtureinfo.argnames
+    parametros = getattr(item, "callspec", None)
+    parametros = dict(parametros.params) if parametros is not None else {}
+    navegador = parametros.get("navegador") or _navegadores(config)[0]
+    pool = None
+    if "sessao_assincrona" in nomes:
+        pool = _pool_assincrono(config, _configuracao(config, navegador, _fidelidade_total(item)))
+    
+    async def fluxo():
+        argumentos = {nome: parametros[nome] for nome in nomes if nome in parametros}
+        if "navegador" in nomes:
+            argumentos["navegador"] = navegador
+        if "base_url" in nomes:
+            argumentos["base_url"] = BasePage.BASE_URL
+        if pool is None:
+            await item.obj(**argumentos)
+            return
+        sessao = await pool.adquirir()
+        try:
+            await item.obj(sessao_assincrona=sessao, **argumentos)
+        finally:
+            await pool.devolver(sessao)
+    
+    return fluxo
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """
+    EXPLICAÇÃO:
+    Testes "async def" rodam no event loop do processo.
+    Os do lote (--async-sessions) rodam TODOS juntos na vez do primeiro
+    deles; cada um, na sua vez, só entrega o resultado já calculado
+    (falha, skip, páginas usadas e a duração do próprio fluxo).
+    """
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    config = pyfuncitem.config
+    lote = config.stash.get(LOTE_ASSINCRONO, {})
+    
+    if pyfuncitem.nodeid not in lote:
+        argumentos = {nome: pyfuncitem.funcargs[nome] for nome in pyfuncitem._fixtureinfo.argnames}
+        _executor(config).rodar(pyfuncitem.obj(**argumentos))
+        return True
+    
+    if RESULTADOS_ASSINCRONOS not in config.stash:
+        config.stash[RESULTADOS_ASSINCRONOS] = _executor(config).executar_fluxos(
+            {nodeid: _fluxo_do_item(config, item) for nodeid, item in lote.items()}
+        )
+    resultado = config.stash[RESULTADOS_ASSINCRONOS].pop(pyfuncitem.nodeid)
+    incorporar_registro(resultado.usado)
+    incorporar_linhas(resultado.linhas)
+    pyfuncitem.stash[DURACAO_NO_LOTE] = resultado.duracao
+    if resultado.erro is not None:
+        raise resultado.erro
+    return True
+
+
+def _gravador_artefatos(config):
+    """
+    EXPLICAÇÃO:
+    Um gravador por processo, criado só na primeira falha.
+    O limite por execução é dividido entre os workers.
+    """
+    if GRAVADOR_ARTEFATOS not in config.stash:
+        tipos = [tipo.strip() for tipo in config.getoption("--artifacts").split(",") if tipo.strip()]
+        desconhecidos = set(tipos) - set(TIPOS_DISPONIVEIS)
+        if desconhecidos:
+            raise pytest.UsageError(f"--artifacts: tipos desconhecidos {sorted(desconhecidos)}")
+        workers = getattr(config, "workerinput", {}).get("workercount", 1)
+        config.stash[GRAVADOR_ARTEFATOS] = GravadorArtefatos(
+            diretorio_do_worker(config, base=config.stash[DIRETORIO_EXECUCAO]),
+            tipos=tipos,
+            max_por_execucao=-(-config.getoption("--artifacts-max") // workers),
+            armazem=BasePage.ARMAZEM_IMAGENS,
+            max_eventos=config.getoption("--artifacts-events"),
+        )
+    return config.stash[GRAVADOR_ARTEFATOS]
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -119,31 +1060,237 @@ def pytest_runtest_makereport(item, call):
     """
     EXPLICAÇÃO:
     Esta função "observa" todos os testes
-    Se um teste falhar, tira uma foto da tela
-    Muito útil para debugar problemas
+    Se um teste falhar, guarda uma foto da tela (e o que mais --artifacts pedir)
+    A gravação no disco acontece em segundo plano: o teste não espera
+    O relatório HTML ganha um link para a imagem compartilhada
     """
     
     outcome = yield
     rep = outcome.get_result()
     
+    if rep.failed:
+        # O log do teste só vira texto aqui, quando alguém vai ler
+        linhas = formatar_linhas(teste_atual())
+        if linhas:
+            rep.sections.append((f"log das páginas ({rep.when})", linhas))
+    
+    if rep.when == "call" and DURACAO_NO_LOTE in item.stash:
+        # Teste do lote assíncrono: a duração é a do próprio fluxo
+        # (não a do lote inteiro, nem o "quase zero" de entregar o resultado)
+        rep.duration = item.stash[DURACAO_NO_LOTE]
     
     if rep.when == "call" and rep.failed:
         
-        driver = item.funcargs.get('driver')
-        if driver:
-            
-            screenshot_name = f"screenshot_{item.name}_FALHA.png"
-            
-            
-            driver.save_screenshot(screenshot_name)
-            print(f"📸 Screenshot salvo: {screenshot_name}")
+        for nome in FIXTURES_DE_NAVEGADOR:
+            driver = item.funcargs.get(nome)
+            if driver:
+                caminhos = _gravador_artefatos(item.config).capturar_falha(driver, item.name)
+                if caminhos:
+                    print(f"📸 Artefatos da falha: {', '.join(caminhos.values())}")
+                if "screenshot" in caminhos:
+                    _anexar_link_no_relatorio(item.config, rep, caminhos["screenshot"])
+                break
+
+
+def _anexar_link_no_relatorio(config, rep, caminho):
+    """
+    EXPLICAÇÃO:
+    Link (e não a imagem embutida) no relatório do pytest-html:
+    cem falhas com a mesma tela apontam para o mesmo arquivo
+    """
+    caminho_relatorio = getattr(config.option, "htmlpath", None)
+    if not caminho_relatorio:
+        return
+    try:
+        from pytest_html import extras
+    except ImportError:
+        return
+    relativo = os.path.relpath(caminho, os.path.dirname(os.path.abspath(caminho_relatorio)))
+    rep.extras = getattr(rep, "extras", []) + [extras.url(relativo.replace(os.sep, "/"), name="screenshot")]
+
+
+def pytest_sessionfinish(session):
+    """
+    EXPLICAÇÃO:
+    Em execução paralela (xdist), cada worker manda as estatísticas
+    do seu pool para o processo principal.
+    O processo principal grava as durações no histórico (depois de
+    comparar com as medianas anteriores), atualiza o mapa de impacto
+    e junta os artefatos dos workers.
+    As sessões assíncronas (e seus drivers) são fechadas antes de tudo.
+    """
+    executor = session.config.stash.get(EXECUTOR_ASSINCRONO, None)
+    if executor is not None:
+        estatisticas = session.config.stash.setdefault(ESTATISTICAS_POOL, {})
+        for chave, valor in executor.encerrar().items():
+            estatisticas[chave] = estatisticas.get(chave, 0) + valor
+    
+    gravador = session.config.stash.get(GRAVADOR_ARTEFATOS, None)
+    if gravador is not None:
+        resumo = gravador.encerrar()
+        if resumo["descartadas"]:
+            print(f"⚠️ {resumo['descartadas']} falha(s) ficaram sem artefatos (limite ou fila cheia)")
+        if gravador.armazem is not None and gravador.armazem.repetidas:
+            estatisticas = gravador.armazem.estatisticas()
+            print(f"🖼️ Screenshots: {estatisticas['unicas']} únicos, {estatisticas['repetidas']} repetidos não gravados")
+    
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["estatisticas_pool"] = session.config.stash.get(ESTATISTICAS_POOL, {})
+        workeroutput["totais_spans"] = _totais_spans
+        workeroutput["mapa_impacto"] = _mapa_da_execucao
+        workeroutput["metricas_paginas"] = _metricas_da_execucao
+    
+    if eh_processo_principal(session.config):
+        if _duracoes_da_execucao:
+            historico = _historico(session.config)
+            browser = _navegadores(session.config)[0]  # Para testes que não usam navegador
+            session.config.stash[REGRESSOES] = historico.regressoes(
+                _duracoes_da_execucao, browser, limite_pct=session.config.getoption("--duration-regression")
+            )
+            historico.gravar(_duracoes_da_execucao, browser, ambiente=session.config.stash[AMBIENTE].nome)
+        
+        # Só testes que passaram atualizam o mapa: um teste que falhou no meio
+        # pode não ter chegado a usar tudo o que normalmente usa
+        aprovados = {
+            nodeid: usado for nodeid, usado in _mapa_da_execucao.items()
+            if _duracoes_da_execucao.get(nodeid, {}).get("resultado") == "passed"
+        }
+        if aprovados:
+            salvar_mapa(aprovados, session.config.getoption("--impact-map"))
+        if _totais_spans:
+            os.makedirs(os.path.join("reports", "spans"), exist_ok=True)
+            with open(os.path.join("reports", "spans", "resumo.json"), "w", encoding="utf-8") as arquivo:
+                json.dump(_totais_spans, arquivo, indent=2, ensure_ascii=False)
+        exportar_serie(
+            _metricas_da_execucao,
+            session.config.getoption("--page-metrics-file"),
+            execucao=os.path.basename(session.config.stash[DIRETORIO_EXECUCAO]),
+            ambiente=session.config.stash[AMBIENTE].nome,
+        )
+        indexar_artefatos(session.config.stash[DIRETORIO_EXECUCAO])
+
+
+def pytest_unconfigure(config):
+    """Fecha o arquivo JSON Lines do log das páginas (--log-jsonl)"""
+    encerrar_log()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Processo principal soma as estatísticas recebidas de cada worker"""
+    workeroutput = getattr(node, "workeroutput", {})
+    recebidas = workeroutput.get("estatisticas_pool", {})
+    estatisticas = node.config.stash.setdefault(ESTATISTICAS_POOL, {})
+    for chave, valor in recebidas.items():
+        estatisticas[chave] = estatisticas.get(chave, 0) + valor
+    somar_totais(_totais_spans, workeroutput.get("totais_spans", {}))
+    _mapa_da_execucao.update(workeroutput.get("mapa_impacto", {}))
+    _metricas_da_execucao.extend(workeroutput.get("metricas_paginas", []))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """
+    EXPLICAÇÃO:
+    Acrescenta no relatório HTML a tabela dos maiores "ralos de tempo":
+    onde a suíte inteira passou mais tempo (tempo próprio de cada span)
+    """
+    ralos = maiores_ralos(_totais_spans)
+    if not ralos:
+        return
+    linhas = "".join(
+        f"<tr><td>{html.escape(nome)}</td><td>{chamadas}</td><td>{segundos:.2f}s</td>"
+        f"<td>{1000 * segundos / chamadas:.1f}ms</td><td>{percentual:.1f}%</td></tr>"
+        for nome, chamadas, segundos, percentual in ralos
+    )
+    prefix.append(
+        "<h2>Maiores ralos de tempo</h2>"
+        "<table><tr><th>Span</th><th>Chamadas</th><th>Total</th><th>Média</th><th>% do tempo</th></tr>"
+        f"{linhas}</table>"
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    EXPLICAÇÃO:
+    Mostra no final da execução:
+    - quantas partidas a frio o pool evitou
+    - testes que ficaram mais lentos que a própria mediana
+    - as métricas de carregamento de cada página (mediana por página)
+    - a tendência de duração (com --durations-trend)
+    """
+    estatisticas = config.stash.get(ESTATISTICAS_POOL, {})
+    if estatisticas:
+        terminalreporter.write_sep("=", "pool de navegadores")
+        terminalreporter.write_line(
+            f"♻️ Partidas a frio evitadas: {estatisticas.get('partidas_evitadas', 0)} | "
+            f"🚀 Navegadores iniciados: {estatisticas.get('partidas_frias', 0)} | "
+            f"🗑️ Descartados: {estatisticas.get('descartes', 0)}"
+        )
+        if estatisticas.get("sessoes_remotas"):
+            terminalreporter.write_line(
+                f"🌐 Sessões no grid: {estatisticas['sessoes_remotas']} | "
+                f"⏳ Novas tentativas (grid cheio): {estatisticas.get('novas_tentativas_grid', 0)} "
+                f"({estatisticas.get('segundos_esperando_grid', 0):.1f}s esperando)"
+            )
+    
+    regressoes = config.stash.get(REGRESSOES, [])
+    if regressoes:
+        terminalreporter.write_sep("=", f"testes mais lentos que o normal (> {config.getoption('--duration-regression'):.0f}%)")
+        for nodeid, atual, mediana, percentual, marcadores in regressoes:
+            critico = " 🔥 " + "/".join(m for m in marcadores if m != "slow") if set(marcadores) - {"slow"} else ""
+            terminalreporter.write_line(f"🐢 {nodeid}: {atual:.2f}s (mediana {mediana:.2f}s, +{percentual:.0f}%){critico}")
+    
+    if _metricas_da_execucao:
+        terminalreporter.write_sep("=", "carregamento por página (medianas)")
+        for pagina, resumo in resumir_por_pagina(_metricas_da_execucao).items():
+            estouros = f" | ⚠️ {resumo['estouros']} acima do orçamento" if resumo["estouros"] else ""
+            terminalreporter.write_line(
+                f"📊 {pagina}: {resumo['navegacoes']} navegações | TTFB {resumo['ttfb_ms']}ms | "
+                f"load {resumo['carregamento_ms']}ms | LCP {resumo['lcp_ms']}ms | "
+                f"{resumo['requisicoes']} requisições | {(resumo['bytes_transferidos'] or 0) // 1024}KB{estouros}"
+            )
+        terminalreporter.write_line(f"Série temporal: {config.getoption('--page-metrics-file')}")
+    
+    if config.getoption("--durations-trend") and eh_processo_principal(config):
+        for browser in _navegadores(config):
+            _mostrar_tendencia(terminalreporter, config, browser)
+
+
+def _mostrar_tendencia(terminalreporter, config, browser):
+    """Tabela do --durations-trend: os mais lentos, o custo de cada marcador e sugestões de @slow"""
+    historico = _historico(config)
+    linhas = historico.tendencia(browser)
+    terminalreporter.write_sep("=", f"tendência de duração ({browser}, últimas {historico.janela} execuções)")
+    if not linhas:
+        terminalreporter.write_line("Sem histórico ainda: rode a suíte algumas vezes")
+        return
+    for nodeid, mediana, totais, marcadores in linhas:
+        etiquetas = f" [{', '.join(marcadores)}]" if marcadores else ""
+        terminalreporter.write_line(
+            f"{mediana:7.2f}s  {mini_grafico(totais):<{historico.janela}}  último {totais[-1]:.2f}s  {nodeid}{etiquetas}"
+        )
+    
+    por_marcador = historico.tempo_por_marcador(browser)
+    if por_marcador:
+        terminalreporter.write_line("")
+        terminalreporter.write_line("⏱️ Tempo por marcador: " + " | ".join(
+            f"{marcador}: {segundos:.1f}s" for marcador, segundos in sorted(por_marcador.items())
+        ))
+    
+    sem_slow = [nodeid for nodeid, mediana, _, marcadores in linhas
+                if mediana >= SEGUNDOS_PARA_SER_SLOW and "slow" not in marcadores]
+    for nodeid in sem_slow:
+        terminalreporter.write_line(f"💡 Considere @pytest.mark.slow em {nodeid}")
 
 
 @pytest.fixture
-def dados_de_teste():
+def dados_de_teste(base_url):
     """
     EXPLICAÇÃO:
     Em vez de colocar dados "hardcoded" nos testes.
+    As URLs vêm do ambiente escolhido (--env / --base-url).
     """
     return {
         "usuario_valido": {
@@ -155,8 +1302,8 @@ def dados_de_teste():
             "senha": "senhaerrada"
         },
         "urls": {
-            "login": "https://exemplo.com/login",
-            "home": "https://exemplo.com/home"
+            "login": f"{base_url}/login",
+            "home": f"{base_url}/"
         }
     }
 
@@ -1,5 +1,6 @@
-
 from .login_page import LoginPage
 from .base_page import BasePage
+from .async_base_page import AsyncBasePage
+from .async_login_page import AsyncLoginPage
 
-__all__ = ['LoginPage', 'BasePage']
\ No newline at end of file
+__all__ = ['LoginPage', 'BasePage', 'AsyncBasePage', 'AsyncLoginPage']
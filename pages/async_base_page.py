@@ -0,0 +1,430 @@
+"""
+AsyncBasePage - A BasePage para sessões assíncronas (utils.async_webdriver)
+
+ANALOGIA:
+A BasePage é um motorista que espera parado em cada sinal vermelho.
+A AsyncBasePage é um despachante: enquanto um carro espera o sinal,
+ele cuida dos outros vinte.
+
+RESPONSABILIDADES:
+- Os mesmos métodos da BasePage, com "await":
+  await pagina.clicar(BOTAO), await pagina.encontrar_elemento(CAMPO)
+- As esperas nunca travam o processo: entre uma verificação e
+  outra, o event loop atende as outras sessões
+- Mesmo cache de elementos, mesma corrida entre condições, mesma
+  foto do estado da página e os mesmos scripts (pages/scripts.py)
+  da versão síncrona
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from pages import scripts
+from pages.base_page import BasePage, EstadoPagina, ResultadoCorrida, Visivel
+from utils.impact import registrar_locator, registrar_pagina
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+
+class AsyncBasePage:
+    """
+    EXPLICAÇÃO:
+    Tudo que QUALQUER página assíncrona precisa.
+    Endereço do site, timeouts e pasta de screenshots vêm da BasePage,
+    então --base-url, --env e o conftest valem para as duas.
+    """
+
+    # Página síncrona "irmã" que define os locators (seleção por impacto:
+    # mudar um locator nela também seleciona os testes assíncronos)
+    PAGINA_SINCRONA = None
+
+    # Intervalo entre verificações das esperas (segundos)
+    INTERVALO = 0.05
+
+    # Foto do estado (capturar_estado), como na BasePage
+    ESTADO_LOCATORS = ()
+    LOCATOR_MENSAGENS = BasePage.LOCATOR_MENSAGENS
+
+    def __init__(self, driver):
+        """
+        EXPLICAÇÃO:
+        "driver" é uma SessaoAssincrona (ou qualquer objeto com os
+        mesmos métodos async: get, find_element, execute_script...)
+        """
+        self.driver = driver
+        self.timeout = BasePage.TIMEOUT
+        self.timeout_curto = BasePage.TIMEOUT_CURTO
+
+        self._cache_elementos = {}
+        self.cache_acertos = 0
+        self.cache_falhas = 0
+
+        self._estado = None
+        self.estado_acertos = 0
+        self.estado_capturas = 0
+
+        registrar_pagina(type(self))
+        if self.PAGINA_SINCRONA is not None:
+            registrar_pagina(self.PAGINA_SINCRONA)
+
+    @property
+    def BASE_URL(self):
+        return BasePage.BASE_URL
+
+    def url_de(self, caminho):
+        """Monta a URL completa de um caminho do site (ex: "/login")"""
+        return f"{self.BASE_URL}{caminho}"
+
+    def _registrar(self, locator):
+        registrar_locator(self.PAGINA_SINCRONA or type(self), locator)
+
+    async def _aguardar(self, condicao, timeout, ignorar=(NoSuchElementException,)):
+        """
+        EXPLICAÇÃO:
+        O WebDriverWait assíncrono: chama "await condicao()" até ela
+        devolver algo verdadeiro. Entre as tentativas, asyncio.sleep
+        libera o event loop para as outras sessões.
+        """
+        limite = time.monotonic() + timeout
+        while True:
+            try:
+                valor = await condicao()
+                if valor:
+                    return valor
+            except ignorar:
+                pass
+            if time.monotonic() >= limite:
+                raise TimeoutException(f"Condição não aconteceu em {timeout}s")
+            await asyncio.sleep(self.INTERVALO)
+
+    async def navegar_para(self, url):
+        """
+        EXPLICAÇÃO:
+        Vai até uma página e espera ela carregar
+        """
+        log.debug("🧭 Navegando para: %s", url)
+        self.limpar_cache_elementos()
+        await self.driver.get(url)
+        await self.aguardar_pagina_carregar()
+
+    async def aguardar_pagina_carregar(self):
+        """
+        EXPLICAÇÃO:
+        Espera o evento "load" (ou só o DOM pronto, com pageLoadStrategy
+        "eager"/"none") - o mesmo script da BasePage
+        """
+        estrategia = getattr(self.driver, "capabilities", {}).get("pageLoadStrategy", "normal")
+        script = scripts.AGUARDAR_CARREGAMENTO if estrategia == "normal" else scripts.AGUARDAR_DOM_PRONTO
+        carregou = await self._executar_assincrono(script, self.timeout, int(self.timeout * 1000))
+        if carregou:
+            log.debug("✅ Página carregada completamente")
+        else:
+            log.aviso("⚠️ Página pode não ter carregado completamente")
+
+    @asynccontextmanager
+    async def esperar_navegacao(self, timeout=None):
+        """
+        EXPLICAÇÃO:
+        Espera a ação dentro do "async with" levar a uma nova página
+
+        USO:
+            async with pagina.esperar_navegacao():
+                await pagina.clicar(BOTAO)
+        """
+        timeout = timeout or self.timeout
+        await self.driver.execute_script(scripts.MARCAR_DOCUMENTO)
+        yield
+        try:
+            await self._aguardar(
+                lambda: self.driver.execute_script(scripts.DOCUMENTO_TROCOU), timeout, ignorar=(WebDriverException,)
+            )
+            log.debug("🧭 Navegação concluída")
+        except TimeoutException:
+            log.aviso("⚠️ Nenhuma navegação aconteceu em %ss", timeout)
+            return
+        self.limpar_cache_elementos()
+        await self.aguardar_pagina_carregar()
+
+    async def _executar_assincrono(self, script, timeout, *argumentos):
+        """
+        Script que responde pelo callback, com o limite do driver um pouco maior que o do script
+        (anotado na sessão, como na BasePage: só vai ao navegador quando muda)
+        """
+        limite = timeout + 5
+        if getattr(self.driver, "limite_script", None) != limite:
+            await self.driver.set_script_timeout(limite)
+            self.driver.limite_script = limite
+        return await self.driver.execute_async_script(script, *argumentos)
+
+    async def encontrar_elemento(self, locator, timeout=None):
+        """
+        EXPLICAÇÃO:
+        Encontra um elemento na página (ou devolve o do cache)
+
+        PARÂMETROS:
+        - locator: "endereço" do elemento (By.ID, "nome-do-id")
+        - timeout: quanto tempo esperar (padrão: timeout do ambiente)
+        """
+        self._registrar(locator)
+        elemento = self._cache_elementos.get(locator)
+        if elemento is not None:
+            self.cache_acertos += 1
+            return elemento
+
+        self.cache_falhas += 1
+        try:
+            elemento = await self._aguardar(lambda: self.driver.find_element(*locator), timeout or self.timeout)
+        except TimeoutException:
+            log.erro("❌ Elemento não encontrado: %s", locator)
+            raise
+        log.debug("✅ Elemento encontrado: %s", locator)
+        self._cache_elementos[locator] = elemento
+        return elemento
+
+    async def encontrar_elemento_clicavel(self, locator, timeout=None):
+        """
+        EXPLICAÇÃO:
+        Encontra elemento visível e habilitado (pode ser clicado)
+        """
+        self._registrar(locator)
+
+        async def _clicavel():
+            elemento = await self.driver.find_element(*locator)
+            if await elemento.is_displayed() and await elemento.is_enabled():
+                return elemento
+            return None
+
+        try:
+            elemento = await self._aguardar(
+                _clicavel, timeout or self.timeout, ignorar=(NoSuchElementException, StaleElementReferenceException)
+            )
+        except TimeoutException:
+            log.erro("❌ Elemento não está clicável: %s", locator)
+            raise
+        log.debug("✅ Elemento clicável encontrado: %s", locator)
+        self._cache_elementos[locator] = elemento
+        return elemento
+
+    def limpar_cache_elementos(self):
+        """Esquece todos os elementos guardados e a foto do estado (a página mudou)"""
+        self._cache_elementos.clear()
+        self.invalidar_estado()
+
+    def estatisticas_cache(self):
+        """Quantas buscas o cache economizou (acertos) e quantas foram ao navegador (falhas)"""
+        return {"acertos": self.cache_acertos, "falhas": self.cache_falhas}
+
+    async def capturar_estado(self):
+        """
+        EXPLICAÇÃO:
+        Foto do estado da página (EstadoPagina), guardada até a
+        próxima interação - como na BasePage
+        """
+        if self._estado is not None:
+            self.estado_acertos += 1
+            return self._estado
+        locators, mensagens = self._especificacao_estado()
+        return self._guardar_estado(await self.driver.execute_script(scripts.ESTADO_PAGINA, locators, mensagens))
+
+    def invalidar_estado(self):
+        """Esquece a foto do estado (a página pode ter mudado)"""
+        self._estado = None
+
+    def estatisticas_estado(self):
+        """Quantas perguntas a foto respondeu (acertos) e quantas fotos foram tiradas (capturas)"""
+        return {"acertos": self.estado_acertos, "capturas": self.estado_capturas}
+
+    def _especificacao_estado(self):
+        for locator in self.ESTADO_LOCATORS:
+            self._registrar(locator)
+        mensagens = list(self.LOCATOR_MENSAGENS) if self.LOCATOR_MENSAGENS else None
+        return [list(locator) for locator in self.ESTADO_LOCATORS], mensagens
+
+    def _guardar_estado(self, dados):
+        self.estado_capturas += 1
+        self._estado = EstadoPagina(dados, self.ESTADO_LOCATORS)
+        log.debug("📸 Estado da página fotografado: %s mensagens (%s)", len(self._estado.mensagens), self._estado.url)
+        return self._estado
+
+    async def _usar_elemento(self, locator, acao):
+        """
+        EXPLICAÇÃO:
+        Executa "await acao(elemento)" com o elemento do cache.
+        Elemento velho (página redesenhada): busca de novo e tenta mais uma vez.
+        """
+        try:
+            return await acao(await self.encontrar_elemento(locator))
+        except StaleElementReferenceException:
+            log.debug("♻️ Elemento velho no cache, buscando de novo: %s", locator)
+            self._cache_elementos.pop(locator, None)
+            return await acao(await self.encontrar_elemento(locator))
+
+    async def clicar(self, locator):
+        """
+        EXPLICAÇÃO:
+        Clica em um elemento
+        """
+        self.invalidar_estado()
+        try:
+            await self._usar_elemento(locator, lambda elemento: elemento.click())
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            # Ainda não dava para clicar: agora sim esperamos ficar clicável
+            await (await self.encontrar_elemento_clicavel(locator)).click()
+        log.debug("🖱️ Clicou em: %s", locator)
+
+    async def digitar_texto(self, locator, texto):
+        """
+        EXPLICAÇÃO:
+        Digita texto em um campo (limpando o campo antes)
+        """
+        async def _digitar(elemento):
+            await elemento.clear()
+            await elemento.send_keys(texto)
+
+        self.invalidar_estado()
+        await self._usar_elemento(locator, _digitar)
+        log.debug("⌨️ Digitou '%s' em: %s", texto, locator)
+
+    async def obter_texto(self, locator):
+        """
+        EXPLICAÇÃO:
+        Pega o texto de um elemento
+        """
+        texto = await self._usar_elemento(locator, lambda elemento: elemento.get_text())
+        log.debug("📖 Texto obtido: '%s' de %s", texto, locator)
+        return texto
+
+    async def elemento_esta_visivel(self, locator, timeout=None):
+        """
+        EXPLICAÇÃO:
+        Verifica se elemento está visível na tela
+        (se a foto do estado já o viu visível, responde por ela)
+        """
+        self._registrar(locator)
+        if self._estado is not None and locator in self._estado and self._estado.visivel(locator):
+            self.estado_acertos += 1
+            return True
+
+        async def _visivel():
+            return await (await self.driver.find_element(*locator)).is_displayed()
+
+        try:
+            await self._aguardar(
+                _visivel, timeout or self.timeout_curto, ignorar=(NoSuchElementException, StaleElementReferenceException)
+            )
+            log.debug("👁️ Elemento visível: %s", locator)
+            return True
+        except TimeoutException:
+            log.debug("🙈 Elemento não visível: %s", locator)
+            return False
+
+    async def aguardar_primeiro(self, condicoes, timeout=None, fotografar=False):
+        """
+        EXPLICAÇÃO:
+        "Corrida" entre várias condições: devolve a primeira que acontecer
+        (Visivel(locator), UrlContem("trecho") ou só um locator).
+        Mesmo script da BasePage: um execute_script por rodada
+        (com fotografar=True, a rodada que decide já tira a foto do estado).
+        """
+        nomes = list(condicoes)
+        for condicao in condicoes.values():
+            self._registrar(getattr(condicao, "locator", condicao))
+        especificacao = [
+            (condicao if hasattr(condicao, "para_js") else Visivel(condicao)).para_js()
+            for condicao in condicoes.values()
+        ]
+
+        if fotografar:
+            self.invalidar_estado()
+            locators, mensagens = self._especificacao_estado()
+
+        async def _vencedor():
+            if not fotografar:
+                indice = await self.driver.execute_script(scripts.CORRIDA, especificacao)
+            else:
+                indice, estado = await self.driver.execute_script(
+                    scripts.CORRIDA_COM_ESTADO, especificacao, locators, mensagens
+                )
+                if indice >= 0:
+                    self._guardar_estado(estado)
+            return nomes[indice] if indice >= 0 else None
+
+        inicio = time.monotonic()
+        try:
+            vencedor = await self._aguardar(_vencedor, timeout or self.timeout_curto, ignorar=())
+        except TimeoutException:
+            vencedor = None
+        duracao = time.monotonic() - inicio
+
+        log.debug("🏁 Corrida decidida: %s em %.0fms", vencedor, duracao * 1000)
+        return ResultadoCorrida(vencedor, duracao)
+
+    async def consultar_elementos(self, locators, atributos=()):
+        """
+        EXPLICAÇÃO:
+        Lê vários elementos de uma vez só (uma ida ao navegador)
+
+        RETORNO:
+        Dicionário {locator: [elementos encontrados]}, como na BasePage
+        """
+        locators = list(locators)
+        for locator in locators:
+            self._registrar(locator)
+        resultado = await self.driver.execute_script(
+            scripts.CONSULTA_EM_LOTE, [list(locator) for locator in locators], list(atributos)
+        )
+        total = sum(len(elementos) for elementos in resultado)
+        log.debug("📦 Consulta em lote: %s locators, %s elementos", len(locators), total)
+        return dict(zip(locators, resultado))
+
+    async def obter_titulo_pagina(self):
+        """Pega o título da página"""
+        titulo = await self.driver.get_title()
+        log.debug("📋 Título da página: '%s'", titulo)
+        return titulo
+
+    async def obter_url_atual(self):
+        """Pega a URL atual da página"""
+        url = await self.driver.get_current_url()
+        log.debug("🌐 URL atual: %s", url)
+        return url
+
+    async def tirar_screenshot(self, nome_arquivo=None):
+        """
+        EXPLICAÇÃO:
+        Tira uma foto da tela (no armazém de imagens compartilhado,
+        se configurado, como na BasePage)
+
+        Hash, redução da imagem e gravação em disco rodam numa thread:
+        no event loop elas travariam as outras sessões
+        """
+        png = await self.driver.get_screenshot_as_png()
+        if not nome_arquivo and BasePage.ARMAZEM_IMAGENS is not None:
+            caminho = await asyncio.to_thread(BasePage.ARMAZEM_IMAGENS.guardar, png)
+            log.info("📸 Screenshot salvo: %s", caminho)
+            return caminho
+
+        if not nome_arquivo:
+            nome_arquivo = f"screenshot_{time.strftime('%Y%m%d_%H%M%S')}.png"
+        caminho = os.path.join(BasePage.DIRETORIO_SCREENSHOTS, nome_arquivo)
+        await asyncio.to_thread(_gravar_arquivo, caminho, png)
+        log.info("📸 Screenshot salvo: %s", caminho)
+        return caminho
+
+
+def _gravar_arquivo(caminho, conteudo):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(conteudo)
@@ -0,0 +1,141 @@
+"""
+AsyncLoginPage - A LoginPage para sessões assíncronas
+
+ANALOGIA:
+A mesma "sala de login" da LoginPage, visitada por vários
+visitantes ao mesmo tempo: cada um com "await" em vez de fila.
+
+RESPONSABILIDADES:
+- Os mesmos locators da LoginPage (definidos só lá)
+- Os mesmos passos: navegar, fazer login, conferir o resultado
+"""
+
+from pages.async_base_page import AsyncBasePage
+from pages.base_page import UrlContem, Visivel
+from pages.login_page import LoginPage
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """
+    EXPLICAÇÃO:
+    Herda da AsyncBasePage e usa os locators da LoginPage:
+    se um locator mudar, muda nas duas páginas
+    """
+
+    PAGINA_SINCRONA = LoginPage
+
+    CAMPO_USERNAME = LoginPage.CAMPO_USERNAME
+    CAMPO_PASSWORD = LoginPage.CAMPO_PASSWORD
+    BOTAO_LOGIN = LoginPage.BOTAO_LOGIN
+    BOTAO_LOGOUT = LoginPage.BOTAO_LOGOUT
+    MENSAGEM_ERRO = LoginPage.MENSAGEM_ERRO
+    MENSAGEM_SUCESSO = LoginPage.MENSAGEM_SUCESSO
+    TITULO_PAGINA_LOGIN = LoginPage.TITULO_PAGINA_LOGIN
+    AREA_SEGURA = LoginPage.AREA_SEGURA
+
+    LOGIN_PATH = LoginPage.LOGIN_PATH
+    SECURE_PATH = LoginPage.SECURE_PATH
+
+    RESULTADOS_SUCESSO = LoginPage.RESULTADOS_SUCESSO
+    ESTADO_LOCATORS = LoginPage.ESTADO_LOCATORS
+
+    @property
+    def LOGIN_URL(self):
+        return self.url_de(self.LOGIN_PATH)
+
+    @property
+    def SECURE_URL(self):
+        return self.url_de(self.SECURE_PATH)
+
+    async def navegar_para_login(self):
+        """Vai especificamente para a página de login"""
+        log.info("🏠 Navegando para página de login...")
+        await self.navegar_para(self.LOGIN_URL)
+        if not await self.esta_na_pagina_login():
+            log.aviso("❌ ATENÇÃO: Pode não estar na página de login!")
+
+    async def fazer_login(self, username, password):
+        """
+        EXPLICAÇÃO:
+        Faz o processo completo de login
+
+        PARÂMETROS:
+        - username: nome do usuário
+        - password: senha
+        """
+        log.info("🔐 Fazendo login com usuário: %s", username)
+        await self.digitar_texto(self.CAMPO_USERNAME, username)
+        await self.digitar_texto(self.CAMPO_PASSWORD, password)
+        async with self.esperar_navegacao():
+            await self.clicar(self.BOTAO_LOGIN)
+        log.info("✅ Tentativa de login concluída")
+
+    async def login_valido(self, username="tomsmith", password="SuperSecretPassword!"):
+        """Login com credenciais que sabemos que funcionam"""
+        await self.fazer_login(username, password)
+
+    async def login_invalido(self, username="usuario_errado", password="senha_errada"):
+        """Login com credenciais inválidas para testar erro"""
+        await self.fazer_login(username, password)
+
+    async def fazer_logout(self):
+        """Sai do sistema (faz logout)"""
+        log.info("🚪 Fazendo logout...")
+        async with self.esperar_navegacao():
+            await self.clicar(self.BOTAO_LOGOUT)
+        log.info("✅ Logout concluído")
+
+    async def esta_na_pagina_login(self):
+        """Verifica se está realmente na página de login (título e campos numa única consulta, como na LoginPage)"""
+        try:
+            titulo, usuario, senha = (await self.consultar_elementos(
+                [self.TITULO_PAGINA_LOGIN, self.CAMPO_USERNAME, self.CAMPO_PASSWORD]
+            )).values()
+            return (
+                bool(titulo) and "Login Page" in titulo[0]["texto"]
+                and all(elementos and elementos[0]["visivel"] for elementos in (usuario, senha))
+            )
+        except Exception as e:
+            log.erro("❌ Erro ao verificar página de login: %s", e)
+            return False
+
+    async def resultado_do_login(self, timeout=None):
+        """
+        EXPLICAÇÃO:
+        Corrida entre os resultados possíveis do login
+        (mesmas condições da LoginPage; a rodada que decide tira a foto do estado)
+        """
+        return await self.aguardar_primeiro({
+            "mensagem_sucesso": Visivel(self.MENSAGEM_SUCESSO, contem="You logged into a secure area!"),
+            "area_segura": Visivel(self.AREA_SEGURA),
+            "url_segura": UrlContem(self.SECURE_URL),
+            "mensagem_erro": Visivel(self.MENSAGEM_ERRO),
+        }, timeout=timeout, fotografar=True)
+
+    async def login_foi_bem_sucedido(self):
+        """Verifica se o login deu certo"""
+        resultado = await self.resultado_do_login()
+        sucesso = resultado.vencedor in self.RESULTADOS_SUCESSO
+        if sucesso:
+            log.info("✅ Login bem-sucedido (por %s)", resultado.vencedor)
+        else:
+            log.info("❌ Login não foi bem-sucedido")
+        return sucesso
+
+    async def login_falhou(self):
+        """Verifica se o login deu erro (mensagem de erro ou fora da área segura)"""
+        resultado = await self.resultado_do_login()
+        return resultado.vencedor not in self.RESULTADOS_SUCESSO
+
+    async def obter_mensagem_erro(self):
+        """Pega a mensagem de erro que apareceu (None se não houver), pela foto do estado"""
+        if self._estado is None and not await self.elemento_esta_visivel(self.MENSAGEM_ERRO):
+            return None
+        return (await self.capturar_estado()).texto(self.MENSAGEM_ERRO)
+
+    async def botao_logout_esta_visivel(self):
+        """Verifica se botão de logout apareceu"""
+        return await self.elemento_esta_visivel(self.BOTAO_LOGOUT)
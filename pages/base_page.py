@@ -2,9 +2,109 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import count
+import os
 import time
 
+from pages import scripts
+from utils.impact import registrar_locator, registrar_pagina
+from utils.logger import obter_logger
+from utils.page_metrics import (
+    OrcamentoExcedido,
+    descrever_estouros,
+    orcamentos_da_pagina,
+    registrar_navegacao,
+    verificar_orcamentos,
+)
+from utils.timing import medido, span
+
+log = obter_logger(__name__)
+
+# Identificadores únicos para os observadores de DOM injetados
+_ids_observadores = count(1)
+
+
+class Visivel:
+    """Condição de corrida: elemento visível (opcionalmente contendo um texto)"""
+    
+    def __init__(self, locator, contem=None):
+        self.locator = locator
+        self.contem = contem
+    
+    def para_js(self):
+        by, valor = self.locator
+        return {"tipo": "visivel", "by": by, "valor": valor, "contem": self.contem}
+
+
+class UrlContem:
+    """Condição de corrida: URL atual contém um trecho"""
+    
+    def __init__(self, trecho):
+        self.trecho = trecho
+    
+    def para_js(self):
+        return {"tipo": "url", "trecho": self.trecho}
+
+
+# vencedor: nome da condição que aconteceu primeiro (None se nenhuma)
+# duracao: segundos até a resposta
+ResultadoCorrida = namedtuple("ResultadoCorrida", ["vencedor", "duracao"])
+
+
+class EstadoPagina:
+    """
+    EXPLICAÇÃO:
+    Foto do estado da página, tirada por um único script no navegador:
+    URL, título, os elementos dos locators da página (texto visível,
+    classes, se está visível) e as mensagens "flash" visíveis.
+    Como anotar tudo que está no quadro antes de sair da sala:
+    as próximas perguntas são respondidas pelas anotações.
+    
+    Cada elemento é {"texto", "classes", "visivel"}
+    """
+    
+    def __init__(self, dados, locators):
+        self.url = dados["url"]
+        self.titulo = dados["titulo"]
+        self.mensagens = dados["mensagens"]
+        self._elementos = dict(zip(locators, dados["elementos"]))
+    
+    def __contains__(self, locator):
+        return locator in self._elementos
+    
+    def elementos(self, locator):
+        """Elementos do locator na foto (erro se o locator não foi fotografado)"""
+        try:
+            return self._elementos[locator]
+        except KeyError:
+            raise KeyError(f"Locator fora da foto do estado (declare em ESTADO_LOCATORS): {locator}") from None
+    
+    def visivel(self, locator):
+        """Algum elemento do locator estava visível?"""
+        return any(elemento["visivel"] for elemento in self.elementos(locator))
+    
+    def texto(self, locator):
+        """Texto do primeiro elemento visível do locator (None se nenhum)"""
+        for elemento in self.elementos(locator):
+            if elemento["visivel"]:
+                return elemento["texto"]
+        return None
+    
+    def classes(self, locator):
+        """Classes CSS do primeiro elemento do locator (lista vazia se não existe)"""
+        elementos = self.elementos(locator)
+        return elementos[0]["classes"] if elementos else []
+
 class BasePage:
     """
     EXPLICAÇÃO:
@@ -12,6 +112,36 @@ class BasePage:
     Outras páginas vão "herdar" essas funcionalidades.
     """
     
+    # Endereço do site testado. O conftest troca com --base-url
+    # (por exemplo, para a cópia local em utils/local_server.py)
+    BASE_URL = "https://the-internet.herokuapp.com"
+    
+    # Esperas padrão (segundos). O perfil de ambiente (--env) pode trocar
+    TIMEOUT = 15
+    TIMEOUT_CURTO = 5
+    
+    # Em execução paralela o conftest troca por uma pasta por worker
+    DIRETORIO_SCREENSHOTS = "reports/screenshots"
+    ARMAZEM_IMAGENS = None  # ArmazemImagens da execução (configurado no conftest)
+    
+    # Métricas de carregamento (utils/page_metrics.py): --page-metrics liga a coleta
+    # em toda navegação; --budget diz o que fazer quando um orçamento estoura
+    COLETAR_METRICAS = False
+    MODO_ORCAMENTO = "warn"
+    
+    # Orçamentos da página (None = sem orçamento). Declare na página:
+    #     class LoginPage(BasePage):
+    #         LOAD_BUDGET_MS = 3000
+    LOAD_BUDGET_MS = None
+    LCP_BUDGET_MS = None
+    TRANSFER_BUDGET_KB = None
+    REQUEST_BUDGET = None
+    
+    # Foto do estado (capturar_estado): locators que a página quer na foto
+    # e onde ficam as mensagens "flash" (avisos de sucesso/erro)
+    ESTADO_LOCATORS = ()
+    LOCATOR_MENSAGENS = (By.CSS_SELECTOR, "#flash, .flash, [role='alert']")
+    
     def __init__(self, driver):
         """
         EXPLICAÇÃO:
@@ -19,132 +149,557 @@ class BasePage:
         É como dar as "chaves da casa" para a página
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 15)  # Espera até 15 segundos
-        self.short_wait = WebDriverWait(driver, 5)  # Espera curta
+        self.timeout = self.TIMEOUT
+        self.timeout_curto = self.TIMEOUT_CURTO
+        self.wait = WebDriverWait(driver, self.timeout)  # Espera padrão (15s em produção)
+        self.short_wait = WebDriverWait(driver, self.timeout_curto)  # Espera curta
+        
+        # Cache de elementos já encontrados nesta página ({locator: elemento})
+        self._cache_elementos = {}
+        self.cache_acertos = 0
+        self.cache_falhas = 0
+        
+        # Última foto do estado da página (None = precisa fotografar de novo)
+        self._estado = None
+        self.estado_acertos = 0
+        self.estado_capturas = 0
+        
+        # Canal de eventos do navegador (utils/event_channel.py), se o driver tiver um:
+        # as esperas de navegação e de rede dormem até o evento chegar
+        self.eventos = getattr(driver, "canal_eventos", None)
+        
+        # Seleção por impacto (--impacted): anota que o teste usou esta página
+        registrar_pagina(type(self))
+    
+    @classmethod
+    def configurar_base_url(cls, url):
+        """
+        EXPLICAÇÃO:
+        Aponta TODAS as páginas para outro endereço do site
+        (as URLs das páginas são montadas a partir da BASE_URL)
+        """
+        BasePage.BASE_URL = url.rstrip("/")
+        log.info("🌍 Base URL: %s", BasePage.BASE_URL)
+    
+    @classmethod
+    def configurar_ambiente(cls, ambiente):
+        """
+        EXPLICAÇÃO:
+        Aplica os tempos de espera de um perfil de ambiente
+        (utils/environment.py) em todas as páginas.
+        O endereço do site é aplicado pela fixture base_url.
+        """
+        BasePage.TIMEOUT = ambiente.timeout
+        BasePage.TIMEOUT_CURTO = ambiente.timeout_curto
+        log.info("🗺️ Ambiente: %s (timeout %ss / %ss)", ambiente.nome, ambiente.timeout, ambiente.timeout_curto)
+    
+    def url_de(self, caminho):
+        """Monta a URL completa de um caminho do site (ex: "/login")"""
+        return f"{self.BASE_URL}{caminho}"
     
+    @medido
     def navegar_para(self, url):
         """
         EXPLICAÇÃO:
         Método para ir até uma página
         Como pedir para o motorista ir até um endereço
         """
-        print(f"🧭 Navegando para: {url}")
+        log.debug("🧭 Navegando para: %s", url)
+        self.limpar_cache_elementos()
+        marca = self._marcar_navegacao()
         self.driver.get(url)
-        self.aguardar_pagina_carregar()
+        self.aguardar_pagina_carregar(marca)
+        self.medir_navegacao(verificar_orcamento=True)
     
-    def aguardar_pagina_carregar(self):
+    @medido
+    def aguardar_pagina_carregar(self, marca=None):
         """
         EXPLICAÇÃO:
         Espera a página carregar completamente
         Como esperar o elevador chegar no andar
+        
+        O próprio navegador avisa (evento "load"), sem ficar perguntando
+        a cada meio segundo se já terminou.
+        
+        Com pageLoadStrategy "eager"/"none" (perfil performance), espera
+        só o HTML ficar pronto: imagens e fontes não atrasam o teste.
+        
+        Com canal de eventos e uma "marca" de antes da navegação, o
+        evento vem pelo canal e nem o script de espera precisa rodar.
+        """
+        if marca is not None:
+            carregou = self._aguardar_evento_carregamento(marca, self.timeout) is not None
+        else:
+            script = (scripts.AGUARDAR_CARREGAMENTO if self._estrategia_carregamento() == "normal"
+                      else scripts.AGUARDAR_DOM_PRONTO)
+            carregou = self._executar_assincrono(script, self.timeout, int(self.timeout * 1000))
+        if carregou:
+            log.debug("✅ Página carregada completamente")
+        else:
+            log.aviso("⚠️ Página pode não ter carregado completamente")
+    
+    @contextmanager
+    def esperar_navegacao(self, timeout=None):
         """
-        try:
-            
-            self.wait.until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
+        EXPLICAÇÃO:
+        Espera a ação dentro do "with" levar a uma nova página
+        
+        USO:
+            with pagina.esperar_navegacao():
+                pagina.clicar(BOTAO)
+        
+        Antes da ação marcamos o documento atual; quando a marca
+        some, é porque o navegador trocou de página. Aí só falta
+        esperar o evento "load" da página nova.
+        
+        Com canal de eventos, a marca é a posição no canal e a espera
+        dorme até o "load" da janela atual chegar.
+        """
+        timeout = timeout or self.timeout
+        marca = self._marcar_navegacao()
+        if marca is not None:
+            yield
+            with span("esperar_navegacao"):
+                if self._aguardar_evento_carregamento(marca, timeout) is None:
+                    log.aviso("⚠️ Nenhuma navegação aconteceu em %ss", timeout)
+                    return
+                log.debug("🧭 Navegação concluída")
+                self.limpar_cache_elementos()
+            self.medir_navegacao()
+            return
+        
+        self.driver.execute_script(scripts.MARCAR_DOCUMENTO)
+        yield
+        with span("esperar_navegacao"):
+            try:
+                WebDriverWait(
+                    self.driver, timeout, poll_frequency=0.05, ignored_exceptions=(WebDriverException,)
+                ).until(lambda driver: driver.execute_script(scripts.DOCUMENTO_TROCOU))
+                log.debug("🧭 Navegação concluída")
+            except TimeoutException:
+                log.aviso("⚠️ Nenhuma navegação aconteceu em %ss", timeout)
+                return
+            self.limpar_cache_elementos()
+            self.aguardar_pagina_carregar()
+        self.medir_navegacao()
+    
+    @contextmanager
+    def esperar_mudanca_dom(self, locator, timeout=10):
+        """
+        EXPLICAÇÃO:
+        Espera o DOM mudar dentro do elemento do locator
+        (ou da página inteira, se ele ainda não existir)
+        
+        USO:
+            with pagina.esperar_mudanca_dom((By.ID, "resultado")):
+                pagina.clicar(BOTAO_BUSCAR)
+        
+        O MutationObserver é armado ANTES da ação, então nenhuma
+        mudança rápida passa despercebida.
+        """
+        registrar_locator(type(self), locator)
+        id_observador = next(_ids_observadores)
+        self.driver.execute_script(scripts.ARMAR_OBSERVADOR_DOM, id_observador, *locator)
+        yield
+        self.invalidar_estado()
+        with span("esperar_mudanca_dom", locator):
+            mudou = self._executar_assincrono(
+                scripts.AGUARDAR_MUDANCA_DOM, timeout, id_observador, int(timeout * 1000)
             )
-            print("✅ Página carregada completamente")
-        except TimeoutException:
-            print("⚠️ Página pode não ter carregado completamente")
+        if mudou:
+            log.debug("🔄 DOM mudou em: %s", locator)
+        elif mudou is None:
+            log.aviso("⚠️ Página trocou antes de observar mudanças em: %s", locator)
+        else:
+            log.aviso("⏰ DOM não mudou após %ss: %s", timeout, locator)
+    
+    @medido
+    def aguardar_rede_ociosa(self, janela_ms=500, timeout=None):
+        """
+        EXPLICAÇÃO:
+        Espera a página ficar "janela_ms" sem baixar nenhum recurso novo
+        (imagens, scripts, chamadas XHR/fetch terminadas)
+        Como esperar o trânsito acalmar antes de atravessar a rua
+        """
+        timeout = timeout or self.timeout
+        if self.eventos is not None:
+            ociosa = self.eventos.aguardar_rede_ociosa(janela_ms, timeout)
+        else:
+            ociosa = self._executar_assincrono(
+                scripts.AGUARDAR_REDE_OCIOSA, timeout, janela_ms, int(timeout * 1000)
+            )
+        if ociosa:
+            log.debug("📡 Rede ociosa por %sms", janela_ms)
+        else:
+            log.aviso("⏰ Rede ainda ocupada após %ss", timeout)
+        return bool(ociosa)
     
-    def encontrar_elemento(self, locator, timeout=15):
+    def medir_navegacao(self, verificar_orcamento=False):
+        """
+        EXPLICAÇÃO:
+        Lê as métricas de carregamento da página atual e anota na
+        página (classe) e no teste. Como ler o painel do carro depois
+        de cada viagem.
+        
+        Com verificar_orcamento, compara com os orçamentos da classe:
+        --budget=warn só avisa, --budget=fail falha o teste.
+        Os orçamentos só valem para navegar_para (a página abrindo a
+        si mesma): depois de um clique, a página nova é outra.
+        
+        Devolve as métricas (None se nada foi medido).
+        """
+        verificar_orcamento = (
+            verificar_orcamento and self.MODO_ORCAMENTO != "off" and bool(orcamentos_da_pagina(type(self)))
+        )
+        if not (self.COLETAR_METRICAS or verificar_orcamento):
+            return None
+        try:
+            with span("medir_navegacao"):
+                metricas = self.driver.execute_script(scripts.METRICAS_NAVEGACAO)
+        except WebDriverException as e:
+            log.aviso("⚠️ Não deu para medir a navegação: %s", e)
+            return None
+        
+        estouros = verificar_orcamentos(type(self), metricas) if verificar_orcamento else []
+        registrar_navegacao(type(self).__name__, metricas, estouros)
+        log.debug(
+            "📊 %s: load %s ms, LCP %s ms, %s requisições, %s bytes", type(self).__name__,
+            metricas.get("carregamento_ms"), metricas.get("lcp_ms"), metricas.get("requisicoes"),
+            metricas.get("bytes_transferidos"),
+        )
+        if estouros:
+            mensagem = f"{type(self).__name__} acima do orçamento: {descrever_estouros(estouros)}"
+            if self.MODO_ORCAMENTO == "fail":
+                raise OrcamentoExcedido(mensagem)
+            log.aviso("⚠️ %s", mensagem)
+        return metricas
+    
+    def _estrategia_carregamento(self):
+        return getattr(self.driver, "capabilities", {}).get("pageLoadStrategy", "normal")
+    
+    def _marcar_navegacao(self):
+        """(janela atual, posição no canal) antes de navegar; None sem canal de eventos"""
+        if self.eventos is None:
+            return None
+        # No BiDi, o contexto de uma aba é o próprio handle da janela (iframes têm outros)
+        return self.driver.current_window_handle, self.eventos.marcar()
+    
+    def _aguardar_evento_carregamento(self, marca, timeout):
+        """Evento "load" (ou "domContentLoaded", se eager/none) da janela, depois da marca"""
+        contexto, posicao = marca
+        tipo = ("browsingContext.load" if self._estrategia_carregamento() == "normal"
+                else "browsingContext.domContentLoaded")
+        return self.eventos.aguardar(
+            (tipo,), desde=posicao, timeout=timeout,
+            condicao=lambda evento: evento.dados.get("contexto") == contexto,
+        )
+    
+    def _executar_assincrono(self, script, timeout, *argumentos):
+        """
+        EXPLICAÇÃO:
+        Roda um script que só responde quando o navegador chamar o callback.
+        O limite do Selenium fica um pouco maior que o do próprio script,
+        para o script sempre ter a chance de responder "não deu" sozinho.
+        
+        O limite vale para a sessão inteira, então fica anotado no próprio
+        driver: só vai ao navegador quando muda (uma ida a menos por espera).
+        """
+        limite = timeout + 5
+        if getattr(self.driver, "limite_script", None) != limite:
+            self.driver.set_script_timeout(limite)
+            self.driver.limite_script = limite
+        return self.driver.execute_async_script(script, *argumentos)
+    
+    @medido
+    def encontrar_elemento(self, locator, timeout=None):
         """
         EXPLICAÇÃO:
         Encontra um elemento na página
         Como procurar um interruptor na parede
         
+        Se o elemento já foi encontrado nesta página, vem do cache
+        (sem ir até o navegador). O cache é limpo a cada navegação.
+        
         PARÂMETROS:
         - locator: "endereço" do elemento (By.ID, "nome-do-id")
-        - timeout: quanto tempo esperar (padrão 15 segundos)
+        - timeout: quanto tempo esperar (padrão: timeout do ambiente)
         """
+        registrar_locator(type(self), locator)
+        elemento = self._cache_elementos.get(locator)
+        if elemento is not None:
+            self.cache_acertos += 1
+            return elemento
+        
+        self.cache_falhas += 1
         try:
-            elemento = WebDriverWait(self.driver, timeout).until(
+            elemento = WebDriverWait(self.driver, timeout or self.timeout).until(
                 EC.presence_of_element_located(locator)
             )
-            print(f"✅ Elemento encontrado: {locator}")
+            log.debug("✅ Elemento encontrado: %s", locator)
+            self._cache_elementos[locator] = elemento
             return elemento
         except TimeoutException:
-            print(f"❌ Elemento não encontrado: {locator}")
+            log.erro("❌ Elemento não encontrado: %s", locator)
             raise
     
-    def encontrar_elemento_clicavel(self, locator, timeout=15):
+    @medido
+    def encontrar_elemento_clicavel(self, locator, timeout=None):
         """
         EXPLICAÇÃO:
         Encontra elemento que pode ser clicado
         Como procurar um botão que funciona
         """
+        registrar_locator(type(self), locator)
         try:
-            elemento = WebDriverWait(self.driver, timeout).until(
+            elemento = WebDriverWait(self.driver, timeout or self.timeout).until(
                 EC.element_to_be_clickable(locator)
             )
-            print(f"✅ Elemento clicável encontrado: {locator}")
+            log.debug("✅ Elemento clicável encontrado: %s", locator)
+            self._cache_elementos[locator] = elemento
             return elemento
         except TimeoutException:
-            print(f"❌ Elemento não está clicável: {locator}")
+            log.erro("❌ Elemento não está clicável: %s", locator)
             raise
     
+    def limpar_cache_elementos(self):
+        """Esquece todos os elementos guardados e a foto do estado (a página mudou)"""
+        self._cache_elementos.clear()
+        self.invalidar_estado()
+    
+    def estatisticas_cache(self):
+        """Quantas buscas o cache economizou (acertos) e quantas foram ao navegador (falhas)"""
+        return {"acertos": self.cache_acertos, "falhas": self.cache_falhas}
+    
+    def capturar_estado(self):
+        """
+        EXPLICAÇÃO:
+        Devolve a foto do estado da página (EstadoPagina)
+        
+        A foto é tirada com um único execute_script e fica guardada
+        até a próxima interação (clicar, digitar, navegar, esperar
+        a página mudar...). Enquanto isso, perguntas como "a mensagem
+        de erro está visível?" e "qual o texto dela?" são respondidas
+        aqui mesmo, sem ir ao navegador.
+        """
+        if self._estado is not None:
+            self.estado_acertos += 1
+            return self._estado
+        locators, mensagens = self._especificacao_estado()
+        return self._guardar_estado(self.driver.execute_script(scripts.ESTADO_PAGINA, locators, mensagens))
+    
+    def invalidar_estado(self):
+        """Esquece a foto do estado (a página pode ter mudado)"""
+        self._estado = None
+    
+    def estatisticas_estado(self):
+        """Quantas perguntas a foto respondeu (acertos) e quantas fotos foram tiradas (capturas)"""
+        return {"acertos": self.estado_acertos, "capturas": self.estado_capturas}
+    
+    def _especificacao_estado(self):
+        """Locators da foto no formato do script: ([[by, valor], ...], [by, valor] ou None)"""
+        for locator in self.ESTADO_LOCATORS:
+            registrar_locator(type(self), locator)
+        mensagens = list(self.LOCATOR_MENSAGENS) if self.LOCATOR_MENSAGENS else None
+        return [list(locator) for locator in self.ESTADO_LOCATORS], mensagens
+    
+    def _guardar_estado(self, dados):
+        self.estado_capturas += 1
+        self._estado = EstadoPagina(dados, self.ESTADO_LOCATORS)
+        log.debug(
+            "📸 Estado da página fotografado: %s locators, %s mensagens (%s)",
+            len(self.ESTADO_LOCATORS), len(self._estado.mensagens), self._estado.url,
+        )
+        return self._estado
+    
+    def _usar_elemento(self, locator, acao):
+        """
+        EXPLICAÇÃO:
+        Executa "acao(elemento)" com o elemento do cache.
+        Se o elemento ficou velho (a página foi redesenhada),
+        busca de novo e tenta mais uma vez - sem o teste perceber.
+        """
+        try:
+            return acao(self.encontrar_elemento(locator))
+        except StaleElementReferenceException:
+            log.debug("♻️ Elemento velho no cache, buscando de novo: %s", locator)
+            self._cache_elementos.pop(locator, None)
+            return acao(self.encontrar_elemento(locator))
+    
+    @medido
     def clicar(self, locator):
         """
         EXPLICAÇÃO:
         Clica em um elemento
         Como apertar um botão
         """
-        elemento = self.encontrar_elemento_clicavel(locator)
-        elemento.click()
-        print(f"🖱️ Clicou em: {locator}")
+        self.invalidar_estado()
+        try:
+            self._usar_elemento(locator, lambda elemento: elemento.click())
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            # Ainda não dava para clicar: agora sim esperamos ficar clicável
+            self.encontrar_elemento_clicavel(locator).click()
+        log.debug("🖱️ Clicou em: %s", locator)
     
+    @medido
     def digitar_texto(self, locator, texto):
         """
         EXPLICAÇÃO:
         Digita texto em um campo
         Como escrever numa folha de papel
         """
-        elemento = self.encontrar_elemento(locator)
-        elemento.clear()  # Limpa o campo primeiro
-        elemento.send_keys(texto)
-        print(f"⌨️ Digitou '{texto}' em: {locator}")
+        def _digitar(elemento):
+            elemento.clear()  # Limpa o campo primeiro
+            elemento.send_keys(texto)
+        
+        self.invalidar_estado()
+        self._usar_elemento(locator, _digitar)
+        log.debug("⌨️ Digitou '%s' em: %s", texto, locator)
     
+    @medido
     def obter_texto(self, locator):
         """
         EXPLICAÇÃO:
         Pega o texto de um elemento
         Como ler o que está escrito numa placa
         """
-        elemento = self.encontrar_elemento(locator)
-        texto = elemento.text
-        print(f"📖 Texto obtido: '{texto}' de {locator}")
+        texto = self._usar_elemento(locator, lambda elemento: elemento.text)
+        log.debug("📖 Texto obtido: '%s' de %s", texto, locator)
         return texto
     
-    def elemento_esta_visivel(self, locator, timeout=5):
+    @medido
+    def elemento_esta_visivel(self, locator, timeout=None):
         """
         EXPLICAÇÃO:
         Verifica se elemento está visível na tela
         Como ver se a luz está acesa
+        
+        Se a foto do estado (capturar_estado) já viu o elemento
+        visível, a resposta vem dela, sem ir ao navegador
         """
+        registrar_locator(type(self), locator)
+        if self._estado is not None and locator in self._estado and self._estado.visivel(locator):
+            self.estado_acertos += 1
+            log.debug("👁️ Elemento visível (foto do estado): %s", locator)
+            return True
         try:
-            WebDriverWait(self.driver, timeout).until(
+            WebDriverWait(self.driver, timeout or self.timeout_curto).until(
                 EC.visibility_of_element_located(locator)
             )
-            print(f"👁️ Elemento visível: {locator}")
+            log.debug("👁️ Elemento visível: %s", locator)
             return True
         except TimeoutException:
-            print(f"🙈 Elemento não visível: {locator}")
+            log.debug("🙈 Elemento não visível: %s", locator)
             return False
     
+    @medido
+    def aguardar_primeiro(self, condicoes, timeout=None, fotografar=False):
+        """
+        EXPLICAÇÃO:
+        "Corrida" entre várias condições: devolve a primeira que acontecer
+        Como esperar na porta e ver quem chega primeiro
+        
+        PARÂMETROS:
+        - condicoes: dicionário {nome: condição}, onde condição é
+          Visivel(locator), UrlContem("trecho") ou só um locator
+        - timeout: quanto tempo esperar por qualquer uma delas
+          (padrão: timeout curto do ambiente)
+        - fotografar: na rodada que decide a corrida, o mesmo script
+          já tira a foto do estado da página (capturar_estado)
+        
+        Todas as condições são avaliadas juntas, num único
+        execute_script por rodada. A ordem do dicionário desempata.
+        """
+        nomes = list(condicoes)
+        for condicao in condicoes.values():
+            registrar_locator(type(self), getattr(condicao, "locator", condicao))
+        especificacao = [
+            (condicao if hasattr(condicao, "para_js") else Visivel(condicao)).para_js()
+            for condicao in condicoes.values()
+        ]
+        
+        if fotografar:
+            self.invalidar_estado()
+            locators, mensagens = self._especificacao_estado()
+        
+        def _vencedor(driver):
+            if not fotografar:
+                indice = driver.execute_script(scripts.CORRIDA, especificacao)
+            else:
+                indice, estado = driver.execute_script(scripts.CORRIDA_COM_ESTADO, especificacao, locators, mensagens)
+                if indice >= 0:
+                    self._guardar_estado(estado)
+            return nomes[indice] if indice >= 0 else None
+        
+        inicio = time.monotonic()
+        try:
+            vencedor = WebDriverWait(self.driver, timeout or self.timeout_curto, poll_frequency=0.05).until(_vencedor)
+        except TimeoutException:
+            vencedor = None
+        duracao = time.monotonic() - inicio
+        
+        log.debug("🏁 Corrida decidida: %s em %.0fms", vencedor, duracao * 1000)
+        return ResultadoCorrida(vencedor, duracao)
+    
+    @medido
+    def consultar_elementos(self, locators, atributos=()):
+        """
+        EXPLICAÇÃO:
+        Lê vários elementos de uma vez só (uma ida ao navegador)
+        Como tirar uma foto da estante inteira em vez de
+        pegar livro por livro
+        
+        PARÂMETROS:
+        - locators: lista de locators
+        - atributos: nomes dos atributos a ler (ex: ["type", "name"])
+        
+        RETORNO:
+        Dicionário {locator: [elementos encontrados]}, onde cada elemento é
+        {"tag", "texto", "atributos", "caixa", "visivel"}
+        """
+        locators = list(locators)
+        for locator in locators:
+            registrar_locator(type(self), locator)
+        resultado = self.driver.execute_script(
+            scripts.CONSULTA_EM_LOTE, [list(locator) for locator in locators], list(atributos)
+        )
+        total = sum(len(elementos) for elementos in resultado)
+        log.debug("📦 Consulta em lote: %s locators, %s elementos", len(locators), total)
+        return dict(zip(locators, resultado))
+    
+    def ler_campos(self, campos, atributos=()):
+        """
+        EXPLICAÇÃO:
+        Lê o estado de vários campos da página numa única chamada
+        
+        PARÂMETROS:
+        - campos: dicionário {nome: locator}
+        
+        RETORNO:
+        {nome: primeiro elemento encontrado (ou None)}
+        """
+        por_locator = self.consultar_elementos(campos.values(), atributos)
+        return {
+            nome: (por_locator[locator] or [None])[0]
+            for nome, locator in campos.items()
+        }
+    
+    @medido
     def aguardar_elemento_desaparecer(self, locator, timeout=10):
         """
         EXPLICAÇÃO:
         Espera um elemento sumir da tela
         Como esperar o loading terminar
         """
+        registrar_locator(type(self), locator)
+        self.invalidar_estado()
         try:
             WebDriverWait(self.driver, timeout).until(
                 EC.invisibility_of_element_located(locator)
             )
-            print(f"🫥 Elemento desapareceu: {locator}")
+            log.debug("🫥 Elemento desapareceu: %s", locator)
             return True
         except TimeoutException:
-            print(f"⏰ Elemento ainda visível após {timeout}s: {locator}")
+            log.aviso("⏰ Elemento ainda visível após %ss: %s", timeout, locator)
             return False
     
     def obter_titulo_pagina(self):
@@ -154,7 +709,7 @@ class BasePage:
         Como ler o nome na porta da casa
         """
         titulo = self.driver.title
-        print(f"📋 Título da página: '{titulo}'")
+        log.debug("📋 Título da página: '%s'", titulo)
         return titulo
     
     def obter_url_atual(self):
@@ -164,22 +719,32 @@ class BasePage:
         Como ver o endereço onde você está
         """
         url = self.driver.current_url
-        print(f"🌐 URL atual: {url}")
+        log.debug("🌐 URL atual: %s", url)
         return url
     
+    @medido
     def tirar_screenshot(self, nome_arquivo=None):
         """
         EXPLICAÇÃO:
         Tira uma foto da tela
         Como tirar uma selfie da página
+        
+        Com o armazém de imagens configurado (sem nome_arquivo), telas
+        iguais viram um arquivo só e o caminho devolvido é o compartilhado
         """
+        if not nome_arquivo and self.ARMAZEM_IMAGENS is not None:
+            caminho = self.ARMAZEM_IMAGENS.guardar(self.driver.get_screenshot_as_png())
+            log.info("📸 Screenshot salvo: %s", caminho)
+            return caminho
+        
         if not nome_arquivo:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             nome_arquivo = f"screenshot_{timestamp}.png"
         
-        caminho = f"reports/screenshots/{nome_arquivo}"
+        os.makedirs(self.DIRETORIO_SCREENSHOTS, exist_ok=True)
+        caminho = os.path.join(self.DIRETORIO_SCREENSHOTS, nome_arquivo)
         self.driver.save_screenshot(caminho)
-        print(f"📸 Screenshot salvo: {caminho}")
+        log.info("📸 Screenshot salvo: %s", caminho)
         return caminho
     
     def rolar_pagina_para_elemento(self, locator):
@@ -188,19 +753,24 @@ class BasePage:
         Rola a página até mostrar o elemento
         Como descer a escada até chegar no andar certo
         """
-        elemento = self.encontrar_elemento(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView();", elemento)
-        print(f"📜 Rolou página até: {locator}")
+        self.invalidar_estado()
+        self._usar_elemento(
+            locator, lambda elemento: self.driver.execute_script("arguments[0].scrollIntoView();", elemento)
+        )
+        log.debug("📜 Rolou página até: %s", locator)
     
+    @medido
     def aguardar_segundos(self, segundos):
         """
         EXPLICAÇÃO:
         Espera alguns segundos (use com moderação!)
         Como contar até 10 antes de fazer algo
         """
-        print(f"⏳ Aguardando {segundos} segundos...")
+        log.debug("⏳ Aguardando %s segundos...", segundos)
         time.sleep(segundos)
+        self.invalidar_estado()
     
+    @medido
     def pagina_contem_texto(self, texto):
         """
         EXPLICAÇÃO:
@@ -211,8 +781,8 @@ class BasePage:
             self.wait.until(
                 EC.text_to_be_present_in_element((By.TAG_NAME, "body"), texto)
             )
-            print(f"✅ Texto encontrado na página: '{texto}'")
+            log.info("✅ Texto encontrado na página: '%s'", texto)
             return True
         except TimeoutException:
-            print(f"❌ Texto não encontrado na página: '{texto}'")
+            log.info("❌ Texto não encontrado na página: '%s'", texto)
             return False
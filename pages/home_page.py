@@ -1,13 +1,15 @@
 from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
 
-class HomePage:
-    URL = "https://the-internet.herokuapp.com/"
+class HomePage(BasePage):
+    PATH = "/"
 
-    def __init__(self, driver):
-        self.driver = driver
+    @property
+    def URL(self):
+        return self.url_de(self.PATH)
 
     def load(self):
-        self.driver.get(self.URL)
+        self.navegar_para(self.URL)
 
     def click_form_authentication(self):
         self.driver.find_element(By.LINK_TEXT, "Form Authentication").click()
@@ -13,7 +13,12 @@ RESPONSABILIDADES:
 """
 
 from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from pages.base_page import BasePage, UrlContem, Visivel
+from utils.logger import obter_logger
+from utils.session_cache import capturar_sessao, restaurar_sessao
+from utils.timing import medido
+
+log = obter_logger(__name__)
 
 class LoginPage(BasePage):
     """
@@ -42,21 +47,38 @@ class LoginPage(BasePage):
     TITULO_PAGINA_LOGIN = (By.TAG_NAME, "h2")
     AREA_SEGURA = (By.CSS_SELECTOR, ".secure-area h2")
     
+    # O que entra na foto do estado (capturar_estado): depois do login,
+    # as verificações de mensagem/área segura/logout são respondidas por ela
+    ESTADO_LOCATORS = (MENSAGEM_ERRO, MENSAGEM_SUCESSO, AREA_SEGURA, TITULO_PAGINA_LOGIN, BOTAO_LOGOUT)
+    
   
-    LOGIN_URL = "https://the-internet.herokuapp.com/login"
-    SECURE_URL = "https://the-internet.herokuapp.com/secure"
+    LOGIN_PATH = "/login"
+    SECURE_PATH = "/secure"
+    
+    # Orçamento de carregamento (utils/page_metrics.py): acima disso, aviso ou falha (--budget)
+    LOAD_BUDGET_MS = 5000
+    
+    @property
+    def LOGIN_URL(self):
+        return self.url_de(self.LOGIN_PATH)
+    
+    @property
+    def SECURE_URL(self):
+        return self.url_de(self.SECURE_PATH)
     
 
+    @medido
     def navegar_para_login(self):
         """
         EXPLICAÇÃO:
         Vai especificamente para a página de login
         Como pedir para ir até a "sala de login"
         """
-        print("🏠 Navegando para página de login...")
+        log.info("🏠 Navegando para página de login...")
         self.navegar_para(self.LOGIN_URL)
         self._verificar_se_esta_na_pagina_login()
     
+    @medido
     def fazer_login(self, username, password):
         """
         EXPLICAÇÃO:
@@ -67,7 +89,7 @@ class LoginPage(BasePage):
         - username: nome do usuário
         - password: senha
         """
-        print(f"🔐 Fazendo login com usuário: {username}")
+        log.info("🔐 Fazendo login com usuário: %s", username)
         
         # Passo 1: Digitar username
         self.digitar_texto(self.CAMPO_USERNAME, username)
@@ -75,13 +97,11 @@ class LoginPage(BasePage):
         # Passo 2: Digitar password
         self.digitar_texto(self.CAMPO_PASSWORD, password)
         
-        # Passo 3: Clicar no botão
-        self.clicar(self.BOTAO_LOGIN)
-        
-        # Passo 4: Aguardar resposta da página
-        self.aguardar_segundos(2)
+        # Passo 3: Clicar no botão e aguardar a resposta (nova página)
+        with self.esperar_navegacao():
+            self.clicar(self.BOTAO_LOGIN)
         
-        print("✅ Tentativa de login concluída")
+        log.info("✅ Tentativa de login concluída")
     
     def login_valido(self, username="tomsmith", password="SuperSecretPassword!"):
         """
@@ -89,7 +109,7 @@ class LoginPage(BasePage):
         Login com credenciais que sabemos que funcionam
         Como usar a "chave mestra" da casa
         """
-        print("🔑 Fazendo login com credenciais válidas...")
+        log.info("🔑 Fazendo login com credenciais válidas...")
         self.fazer_login(username, password)
     
     def login_invalido(self, username="usuario_errado", password="senha_errada"):
@@ -98,19 +118,58 @@ class LoginPage(BasePage):
         Login com credenciais inválidas para testar erro
         Como tentar abrir com chave errada
         """
-        print("❌ Fazendo login com credenciais inválidas...")
+        log.info("❌ Fazendo login com credenciais inválidas...")
+        self.fazer_login(username, password)
+    
+    @medido
+    def entrar_com_sessao_em_cache(self, cache, username, password):
+        """
+        EXPLICAÇÃO:
+        Deixa o navegador logado, usando o cache de sessões quando der
+        Como usar o crachá guardado em vez de passar pela recepção
+        
+        1. Se já existe sessão guardada para essas credenciais,
+           injeta cookies/storage e abre direto a área segura
+        2. Se o site recusar (voltou para o login), descarta a sessão
+        3. Sem sessão válida: login de verdade pelo formulário,
+           e a sessão resultante é guardada para os próximos testes
+        
+        RETORNO:
+        "cache" se entrou com sessão guardada, "formulario" se fez login,
+        None se o login não funcionou
+        """
+        chave = (self.BASE_URL, username, password)
+        
+        sessao = cache.obter(chave)
+        if sessao is not None:
+            restaurar_sessao(self.driver, sessao, self.SECURE_URL)
+            self.limpar_cache_elementos()
+            if self.SECURE_PATH in self.obter_url_atual():
+                log.info("🎫 Sessão reaproveitada para: %s", username)
+                return "cache"
+            log.aviso("⚠️ Sessão guardada recusada pelo site, fazendo login de verdade: %s", username)
+            cache.rejeitar(chave)
+        
+        self.navegar_para_login()
         self.fazer_login(username, password)
+        if not self.login_foi_bem_sucedido():
+            return None
+        
+        cache.guardar(chave, capturar_sessao(self.driver))
+        log.info("💾 Sessão guardada para: %s", username)
+        return "formulario"
     
+    @medido
     def fazer_logout(self):
         """
         EXPLICAÇÃO:
         Sai do sistema (faz logout)
         Como "sair da casa e trancar a porta"
         """
-        print("🚪 Fazendo logout...")
-        self.clicar(self.BOTAO_LOGOUT)
-        self.aguardar_segundos(2)
-        print("✅ Logout concluído")
+        log.info("🚪 Fazendo logout...")
+        with self.esperar_navegacao():
+            self.clicar(self.BOTAO_LOGOUT)
+        log.info("✅ Logout concluído")
     
   
     def esta_na_pagina_login(self):
@@ -118,18 +177,51 @@ class LoginPage(BasePage):
         EXPLICAÇÃO:
         Verifica se está realmente na página de login
         Como ver se você está na "porta da frente"
+        
+        Título e campos do formulário são lidos juntos (ler_campos),
+        numa única ida ao navegador
         """
         try:
-            titulo = self.obter_texto(self.TITULO_PAGINA_LOGIN)
-            esta_na_pagina = "Login Page" in titulo
+            campos = self.ler_campos({
+                "titulo": self.TITULO_PAGINA_LOGIN,
+                "usuario": self.CAMPO_USERNAME,
+                "senha": self.CAMPO_PASSWORD,
+            })
+            titulo = campos["titulo"]
+            esta_na_pagina = (
+                titulo is not None and "Login Page" in titulo["texto"]
+                and all(campos[nome] is not None and campos[nome]["visivel"] for nome in ("usuario", "senha"))
+            )
             
-            print(f"📍 Está na página de login? {esta_na_pagina}")
+            log.info("📍 Está na página de login? %s", esta_na_pagina)
             return esta_na_pagina
             
         except Exception as e:
-            print(f"❌ Erro ao verificar página de login: {str(e)}")
+            log.erro("❌ Erro ao verificar página de login: %s", e)
             return False
     
+    # Resultados da corrida que contam como "login deu certo"
+    RESULTADOS_SUCESSO = ("mensagem_sucesso", "area_segura", "url_segura")
+    
+    def resultado_do_login(self, timeout=None):
+        """
+        EXPLICAÇÃO:
+        Descobre de uma vez só o que aconteceu depois do login:
+        mensagem de sucesso, área segura, URL segura ou mensagem de erro.
+        Quem aparecer primeiro "vence" - não precisamos esperar 5s
+        por cada possibilidade que não vai acontecer.
+        
+        A rodada que decide também tira a foto do estado da página:
+        obter_mensagem_erro e botao_logout_esta_visivel respondem por ela.
+        """
+        return self.aguardar_primeiro({
+            "mensagem_sucesso": Visivel(self.MENSAGEM_SUCESSO, contem="You logged into a secure area!"),
+            "area_segura": Visivel(self.AREA_SEGURA),
+            "url_segura": UrlContem(self.SECURE_URL),
+            "mensagem_erro": Visivel(self.MENSAGEM_ERRO),
+        }, timeout=timeout, fotografar=True)
+    
+    @medido
     def login_foi_bem_sucedido(self):
         """
         EXPLICAÇÃO:
@@ -137,28 +229,20 @@ class LoginPage(BasePage):
         Como ver se conseguiu "entrar na casa"
         """
         try:
-            if self.elemento_esta_visivel(self.MENSAGEM_SUCESSO, timeout=5):
-                mensagem = self.obter_texto(self.MENSAGEM_SUCESSO)
-                sucesso = "You logged into a secure area!" in mensagem
-                print(f"✅ Login bem-sucedido (por mensagem): {sucesso}")
-                return sucesso
+            resultado = self.resultado_do_login()
+            sucesso = resultado.vencedor in self.RESULTADOS_SUCESSO
             
-            if self.elemento_esta_visivel(self.AREA_SEGURA, timeout=5):
-                print("✅ Login bem-sucedido (está na área segura)")
-                return True
-            
-            url_atual = self.obter_url_atual()
-            if self.SECURE_URL in url_atual:
-                print("✅ Login bem-sucedido (URL correta)")
-                return True
-            
-            print("❌ Login não foi bem-sucedido")
-            return False
+            if sucesso:
+                log.info("✅ Login bem-sucedido (por %s)", resultado.vencedor)
+            else:
+                log.info("❌ Login não foi bem-sucedido")
+            return sucesso
             
         except Exception as e:
-            print(f"❌ Erro ao verificar sucesso do login: {str(e)}")
+            log.erro("❌ Erro ao verificar sucesso do login: %s", e)
             return False
     
+    @medido
     def login_falhou(self):
         """
         EXPLICAÇÃO:
@@ -166,37 +250,38 @@ class LoginPage(BasePage):
         Como ver se a "porta não abriu"
         """
         try:
-            if self.elemento_esta_visivel(self.MENSAGEM_ERRO, timeout=5):
-                mensagem = self.obter_texto(self.MENSAGEM_ERRO)
-                print(f"❌ Login falhou com mensagem: {mensagem}")
-                return True
+            resultado = self.resultado_do_login()
             
-            if not self.elemento_esta_visivel(self.AREA_SEGURA, timeout=5):
-                print("❌ Login falhou (não está na área segura)")
+            if resultado.vencedor == "mensagem_erro":
+                log.info("❌ Login falhou com mensagem de erro")
                 return True
             
-            url_atual = self.obter_url_atual()
-            if self.SECURE_URL not in url_atual:
-                print("❌ Login falhou (URL incorreta)")
+            if resultado.vencedor not in self.RESULTADOS_SUCESSO:
+                log.info("❌ Login falhou (não está na área segura)")
                 return True
             
             return False
             
         except Exception as e:
-            print(f"❌ Erro ao verificar falha do login: {str(e)}")
+            log.erro("❌ Erro ao verificar falha do login: %s", e)
             return False
     
+    @medido
     def obter_mensagem_erro(self):
         """
         EXPLICAÇÃO:
         Pega a mensagem de erro que apareceu
         Como ler o "aviso na porta"
+        
+        Depois de login_falhou / login_foi_bem_sucedido, a resposta vem
+        da foto do estado (nenhuma ida ao navegador). Sem foto, espera
+        a mensagem aparecer e fotografa a página uma vez.
         """
         try:
-            if self.elemento_esta_visivel(self.MENSAGEM_ERRO, timeout=5):
-                mensagem = self.obter_texto(self.MENSAGEM_ERRO)
-                return mensagem
-            return None
+            if self._estado is None and not self.elemento_esta_visivel(self.MENSAGEM_ERRO):
+                return None
+            estado = self.capturar_estado()
+            return estado.texto(self.MENSAGEM_ERRO)
         except Exception:
             return None
     
@@ -206,7 +291,7 @@ class LoginPage(BasePage):
         Verifica se botão de logout apareceu
         Como ver se a "chave de sair" está disponível
         """
-        return self.elemento_esta_visivel(self.BOTAO_LOGOUT, timeout=5)
+        return self.elemento_esta_visivel(self.BOTAO_LOGOUT)
 
     
     def _verificar_se_esta_na_pagina_login(self):
@@ -216,7 +301,7 @@ class LoginPage(BasePage):
         Como "conferir se chegou no lugar certo"
         """
         if not self.esta_na_pagina_login():
-            print("❌ ATENÇÃO: Pode não estar na página de login!")
+            log.aviso("❌ ATENÇÃO: Pode não estar na página de login!")
         else:
-            print("✅ Confirmado: Está na página de login")
+            log.info("✅ Confirmado: Está na página de login")
 
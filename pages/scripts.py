@@ -0,0 +1,238 @@
+"""
+scripts - Trechos de JavaScript injetados pelas páginas
+
+EXPLICAÇÃO:
+Algumas esperas ficam muito mais rápidas quando o próprio navegador
+avisa que algo aconteceu (eventos, MutationObserver, PerformanceObserver)
+em vez do Python perguntar "já?" a cada meio segundo.
+
+Os locators do Selenium (By.ID, By.CSS_SELECTOR...) são traduzidos
+para o JavaScript pela função RESOLVER, que devolve a lista de elementos.
+"""
+
+# Recebe (by, valor) no mesmo formato dos locators do Selenium
+RESOLVER = """
+function __resolver(by, valor) {
+    var lista = function (colecao) { return Array.prototype.slice.call(colecao); };
+    switch (by) {
+        case 'id':
+            var el = document.getElementById(valor);
+            return el ? [el] : [];
+        case 'css selector':
+            return lista(document.querySelectorAll(valor));
+        case 'name':
+            return lista(document.getElementsByName(valor));
+        case 'tag name':
+            return lista(document.getElementsByTagName(valor));
+        case 'class name':
+            return lista(document.getElementsByClassName(valor));
+        case 'link text':
+        case 'partial link text':
+            return lista(document.getElementsByTagName('a')).filter(function (a) {
+                var texto = (a.innerText || a.textContent || '').trim();
+                return by === 'link text' ? texto === valor : texto.indexOf(valor) !== -1;
+            });
+        case 'xpath':
+            var resultado = document.evaluate(valor, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var elementos = [];
+            for (var i = 0; i < resultado.snapshotLength; i++) { elementos.push(resultado.snapshotItem(i)); }
+            return elementos;
+    }
+    throw new Error('Tipo de locator não suportado: ' + by);
+}
+"""
+
+# Mesmo critério do Selenium (aproximado): tem tamanho e não está escondido
+VISIBILIDADE = """
+function __visivel(el) {
+    if (!el.getClientRects().length) { return false; }
+    var estilo = window.getComputedStyle(el);
+    return estilo.visibility !== 'hidden' && estilo.display !== 'none' && estilo.opacity !== '0';
+}
+"""
+
+# Cada condição: {tipo: 'visivel', by, valor, contem} ou {tipo: 'url', trecho}
+# Devolve o índice da primeira condição satisfeita (ou -1)
+PRIMEIRA_CONDICAO = """
+function __primeira(condicoes) {
+    for (var i = 0; i < condicoes.length; i++) {
+        var condicao = condicoes[i];
+        if (condicao.tipo === 'url') {
+            if (window.location.href.indexOf(condicao.trecho) !== -1) { return i; }
+            continue;
+        }
+        var elementos = __resolver(condicao.by, condicao.valor);
+        for (var j = 0; j < elementos.length; j++) {
+            var texto = elementos[j].innerText || '';
+            if (__visivel(elementos[j]) && (!condicao.contem || texto.indexOf(condicao.contem) !== -1)) {
+                return i;
+            }
+        }
+    }
+    return -1;
+}
+"""
+
+# Foto do estado da página: URL, título, os elementos dos locators pedidos
+# (texto visível, classes, visível?) e as mensagens "flash" visíveis
+FOTOGRAFAR = """
+function __estado(locators, mensagens) {
+    var ler = function (el) {
+        return {
+            texto: (el.innerText || '').trim(),
+            classes: Array.prototype.slice.call(el.classList),
+            visivel: __visivel(el)
+        };
+    };
+    return {
+        url: window.location.href,
+        titulo: document.title,
+        elementos: locators.map(function (locator) { return __resolver(locator[0], locator[1]).map(ler); }),
+        mensagens: mensagens ? __resolver(mensagens[0], mensagens[1]).filter(__visivel).map(ler) : []
+    };
+}
+"""
+
+# arguments: [condicoes]
+CORRIDA = RESOLVER + VISIBILIDADE + PRIMEIRA_CONDICAO + """
+return __primeira(arguments[0]);
+"""
+
+# arguments: [condicoes, locators, locator_mensagens]
+# Devolve [índice, foto do estado] - a foto vem na mesma ida ao navegador
+# que decidiu a corrida (null enquanto nenhuma condição aconteceu)
+CORRIDA_COM_ESTADO = RESOLVER + VISIBILIDADE + PRIMEIRA_CONDICAO + FOTOGRAFAR + """
+var indice = __primeira(arguments[0]);
+return [indice, indice >= 0 ? __estado(arguments[1], arguments[2]) : null];
+"""
+
+# arguments: [locators, locator_mensagens]
+# locators: lista de [by, valor]; locator_mensagens: [by, valor] ou null
+ESTADO_PAGINA = RESOLVER + VISIBILIDADE + FOTOGRAFAR + """
+return __estado(arguments[0], arguments[1]);
+"""
+
+# arguments: [locators, atributos]
+# locators: lista de [by, valor]; devolve, para cada locator, a lista de elementos
+CONSULTA_EM_LOTE = RESOLVER + VISIBILIDADE + """
+var atributos = arguments[1];
+var ler = function (el, nome) {
+    var valor = el[nome];
+    if (valor === undefined || (typeof valor === 'object' && valor !== null) || typeof valor === 'function') {
+        valor = el.getAttribute(nome);
+    }
+    return valor;
+};
+return arguments[0].map(function (locator) {
+    return __resolver(locator[0], locator[1]).map(function (el) {
+        var caixa = el.getBoundingClientRect();
+        var lidos = {};
+        atributos.forEach(function (nome) { lidos[nome] = ler(el, nome); });
+        return {
+            tag: el.tagName.toLowerCase(),
+            texto: (el.innerText || '').trim(),
+            atributos: lidos,
+            caixa: {x: caixa.x, y: caixa.y, largura: caixa.width, altura: caixa.height},
+            visivel: __visivel(el)
+        };
+    });
+});
+"""
+
+# arguments: [timeout_ms, callback]
+AGUARDAR_CARREGAMENTO = """
+var pronto = arguments[arguments.length - 1];
+if (document.readyState === 'complete') { pronto(true); return; }
+var relogio = setTimeout(function () { pronto(false); }, arguments[0]);
+window.addEventListener('load', function () { clearTimeout(relogio); pronto(true); }, {once: true});
+"""
+
+# pageLoadStrategy "eager"/"none": basta o HTML montado (DOMContentLoaded), sem imagens/fontes
+AGUARDAR_DOM_PRONTO = """
+var pronto = arguments[arguments.length - 1];
+if (document.readyState !== 'loading') { pronto(true); return; }
+var relogio = setTimeout(function () { pronto(false); }, arguments[0]);
+document.addEventListener('DOMContentLoaded', function () { clearTimeout(relogio); pronto(true); }, {once: true});
+"""
+
+MARCAR_DOCUMENTO = "window.__marcaNavegacao = true;"
+
+DOCUMENTO_TROCOU = "return !window.__marcaNavegacao;"
+
+# arguments: [id, by, valor]
+ARMAR_OBSERVADOR_DOM = RESOLVER + """
+var id = arguments[0];
+var alvo = __resolver(arguments[1], arguments[2])[0] || document.documentElement;
+window.__mudancasDom = window.__mudancasDom || {};
+var estado = window.__mudancasDom[id] = {mudou: false, ouvintes: []};
+estado.observador = new MutationObserver(function () {
+    estado.mudou = true;
+    estado.observador.disconnect();
+    estado.ouvintes.forEach(function (ouvinte) { ouvinte(true); });
+});
+estado.observador.observe(alvo, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# arguments: [id, timeout_ms, callback]
+AGUARDAR_MUDANCA_DOM = """
+var pronto = arguments[arguments.length - 1];
+var estado = (window.__mudancasDom || {})[arguments[0]];
+if (!estado) { pronto(null); return; }
+if (estado.mudou) { pronto(true); return; }
+var relogio = setTimeout(function () { estado.observador.disconnect(); pronto(false); }, arguments[1]);
+estado.ouvintes.push(function () { clearTimeout(relogio); pronto(true); });
+"""
+
+# arguments: [janela_ms, timeout_ms, callback]
+AGUARDAR_REDE_OCIOSA = """
+var pronto = arguments[arguments.length - 1];
+var janela = arguments[0];
+var terminou = false;
+var finalizar = function (resultado) {
+    if (terminou) { return; }
+    terminou = true;
+    clearTimeout(ocioso);
+    clearTimeout(limite);
+    observador.disconnect();
+    pronto(resultado);
+};
+var ocioso = null;
+var reiniciar = function () {
+    clearTimeout(ocioso);
+    ocioso = setTimeout(function () { finalizar(true); }, janela);
+};
+var observador = new PerformanceObserver(reiniciar);
+observador.observe({type: 'resource'});
+var limite = setTimeout(function () { finalizar(false); }, arguments[1]);
+reiniciar();
+"""
+
+# Métricas da navegação atual (Navigation Timing, Paint Timing, LCP e Resource Timing), em ms desde o início
+METRICAS_NAVEGACAO = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var pinturas = {};
+performance.getEntriesByType('paint').forEach(function (p) { pinturas[p.name] = p.startTime; });
+var recursos = performance.getEntriesByType('resource');
+var bytes = nav.transferSize || 0;
+recursos.forEach(function (r) { bytes += r.transferSize || 0; });
+var lcp = null;
+if (window.PerformanceObserver && (PerformanceObserver.supportedEntryTypes || []).indexOf('largest-contentful-paint') >= 0) {
+    // buffered: os candidatos que já aconteceram entram direto no buffer do observador
+    var observador = new PerformanceObserver(function () {});
+    observador.observe({type: 'largest-contentful-paint', buffered: true});
+    observador.takeRecords().forEach(function (e) { lcp = e.startTime; });
+    observador.disconnect();
+}
+function __ms(valor) { return valor ? Math.round(valor) : null; }
+return {
+    url: location.href,
+    ttfb_ms: __ms(nav.responseStart),
+    dom_pronto_ms: __ms(nav.domContentLoadedEventEnd),
+    carregamento_ms: __ms(nav.loadEventEnd),
+    primeira_pintura_ms: __ms(pinturas['first-paint']),
+    fcp_ms: __ms(pinturas['first-contentful-paint']),
+    lcp_ms: __ms(lcp),
+    requisicoes: recursos.length + 1,
+    bytes_transferidos: bytes
+};
+"""
@@ -0,0 +1,126 @@
+import base64
+import gzip
+import io
+import os
+import threading
+
+import pytest
+
+from utils.artifacts import ArmazemImagens, GravadorArtefatos
+
+PNG_FALSO = b"\x89PNG\r\n\x1a\nconteudo"
+
+
+class DriverFalso:
+
+    current_url = "http://127.0.0.1/login"
+    page_source = "<html><body>Your username is invalid!</body></html>"
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(PNG_FALSO).decode("ascii")
+
+    def get_log(self, tipo):
+        return [{"level": "SEVERE", "message": "erro no console"}]
+
+
+def test_grava_todos_os_artefatos_em_segundo_plano(tmp_path):
+    gravador = GravadorArtefatos(str(tmp_path), tipos=("screenshot", "dom", "console", "url"))
+
+    caminhos = gravador.capturar_falha(DriverFalso(), "test_login[usuario invalido]")
+    resumo = gravador.encerrar()
+
+    assert resumo == {"capturas": 1, "descartadas": 0, "arquivos": 4, "erros": 0}
+    assert all(os.path.exists(caminho) for caminho in caminhos.values())
+    base = tmp_path / "test_login_usuario_invalido_"
+    assert (tmp_path / (base.name + ".png")).read_bytes() == PNG_FALSO
+    assert b"invalid" in gzip.decompress((tmp_path / (base.name + ".html.gz")).read_bytes())
+    assert (tmp_path / (base.name + ".url.txt")).read_text() == DriverFalso.current_url
+
+
+def test_limite_por_execucao(tmp_path):
+    gravador = GravadorArtefatos(str(tmp_path), max_por_execucao=2)
+
+    for numero in range(5):
+        gravador.capturar_falha(DriverFalso(), f"test_{numero}")
+    resumo = gravador.encerrar()
+
+    assert resumo["capturas"] == 2
+    assert resumo["descartadas"] == 3
+    assert len(os.listdir(tmp_path)) == 4  # 2 falhas x (png + url)
+
+
+def test_fila_cheia_descarta_sem_esperar(tmp_path):
+    liberar = threading.Event()
+    gravador = GravadorArtefatos(str(tmp_path), max_pendentes=1, threads=1)
+    escrever = gravador._escrever
+    gravador._escrever = lambda caminho, conteudo: liberar.wait(5) and escrever(caminho, conteudo)
+
+    assert gravador.capturar_falha(DriverFalso(), "test_primeiro")
+    assert gravador.capturar_falha(DriverFalso(), "test_segundo") == {}
+
+    liberar.set()
+    resumo = gravador.encerrar()
+    assert resumo["capturas"] == 1
+    assert resumo["descartadas"] == 1
+    assert resumo["arquivos"] == 2
+
+
+def png_de_tela(largura=1600, altura=900, coluna=100, detalhe=None):
+    """Tela sintética: fundo claro com um bloco escuro (e um detalhe opcional)"""
+    Image = pytest.importorskip("PIL.Image")
+    from PIL import ImageDraw
+    imagem = Image.new("RGB", (largura, altura), "white")
+    desenho = ImageDraw.Draw(imagem)
+    desenho.rectangle((coluna, 100, coluna + 400, altura - 100), fill="black")
+    if detalhe:
+        desenho.text((10, altura - 20), detalhe, fill="gray")
+    saida = io.BytesIO()
+    imagem.save(saida, "PNG")
+    return saida.getvalue()
+
+
+def test_copias_exatas_sao_gravadas_uma_vez(tmp_path):
+    armazem = ArmazemImagens(str(tmp_path), distancia_maxima=None)
+
+    primeiro = armazem.guardar(PNG_FALSO if armazem.extensao == ".png" else png_de_tela())
+    segundo = armazem.guardar(PNG_FALSO if armazem.extensao == ".png" else png_de_tela())
+
+    assert primeiro == segundo
+    assert armazem.estatisticas() == {"unicas": 1, "repetidas": 1}
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_telas_quase_iguais_apontam_para_o_mesmo_arquivo(tmp_path):
+    armazem = ArmazemImagens(str(tmp_path))
+
+    primeiro = armazem.guardar(png_de_tela(detalhe="usuario: tom"))
+    parecido = armazem.guardar(png_de_tela(detalhe="usuario: ana"))
+    diferente = armazem.guardar(png_de_tela(coluna=1000))
+
+    assert parecido == primeiro
+    assert diferente != primeiro
+    assert armazem.estatisticas() == {"unicas": 2, "repetidas": 1}
+
+
+def test_imagem_e_reduzida_e_compactada(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    armazem = ArmazemImagens(str(tmp_path), largura_maxima=800)
+    original = png_de_tela()
+
+    caminho = armazem.guardar(original)
+
+    with Image.open(caminho) as imagem:
+        assert imagem.width == 800
+    assert os.path.getsize(caminho) < len(original)
+
+
+def test_falhas_com_a_mesma_tela_compartilham_o_screenshot(tmp_path):
+    armazem = ArmazemImagens(str(tmp_path / "imagens"))
+    gravador = GravadorArtefatos(str(tmp_path / "principal"), armazem=armazem)
+
+    caminhos = [gravador.capturar_falha(DriverFalso(), f"test_{numero}")["screenshot"] for numero in range(3)]
+    gravador.encerrar()
+
+    assert len(set(caminhos)) == 1
+    assert os.listdir(tmp_path / "imagens") == [os.path.basename(caminhos[0])]
+    assert sorted(gravador.imagens) == ["test_0", "test_1", "test_2"]
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils import impact
+from utils.async_flows import ExecutorAssincrono
+from utils.logger import obter_logger
+
+
+@pytest.fixture
+def executor():
+    executor = ExecutorAssincrono(concorrencia=5)
+    yield executor
+    executor.encerrar()
+
+
+def test_fluxos_rodam_juntos_ate_o_limite(executor):
+    rodando = {"agora": 0, "maximo": 0}
+
+    async def fluxo():
+        rodando["agora"] += 1
+        rodando["maximo"] = max(rodando["maximo"], rodando["agora"])
+        await asyncio.sleep(0.1)
+        rodando["agora"] -= 1
+
+    inicio = time.perf_counter()
+    resultados = executor.executar_fluxos({f"fluxo-{numero}": fluxo for numero in range(20)})
+    duracao = time.perf_counter() - inicio
+
+    assert rodando["maximo"] == 5
+    assert duracao < 20 * 0.1 / 2
+    assert list(resultados) == [f"fluxo-{numero}" for numero in range(20)]
+    assert all(resultado.erro is None and resultado.duracao >= 0.1 for resultado in resultados.values())
+
+
+def test_falha_de_um_fluxo_nao_derruba_os_outros(executor):
+    async def passa():
+        await asyncio.sleep(0.01)
+
+    async def falha():
+        assert 1 == 2
+
+    async def pula():
+        pytest.skip("sem dados")
+
+    resultados = executor.executar_fluxos({"passa": passa, "falha": falha, "pula": pula})
+
+    assert resultados["passa"].erro is None
+    assert isinstance(resultados["falha"].erro, AssertionError)
+    assert isinstance(resultados["pula"].erro, pytest.skip.Exception)
+
+
+def test_cada_fluxo_tem_o_seu_registro_de_impacto_e_de_log(executor):
+    async def usa_login():
+        await asyncio.sleep(0.01)
+        impact.registrar_pagina(LoginPage)
+        obter_logger("tests.fluxos").info("🔐 Fazendo login com usuário: %s", "tomsmith")
+
+    async def usa_base():
+        impact.registrar_pagina(BasePage)
+        await asyncio.sleep(0.01)
+
+    resultados = executor.executar_fluxos({"login": usa_login, "base": usa_base})
+
+    assert resultados["login"].usado == {("pagina", LoginPage)}
+    assert resultados["base"].usado == {("pagina", BasePage)}
+    assert [linha[3:5] for linha in resultados["login"].linhas] == [("🔐 Fazendo login com usuário: %s", ("tomsmith",))]
+    assert resultados["base"].linhas == []
+
+
+def test_encerrar_fecha_o_event_loop(executor):
+    assert executor.rodar(asyncio.sleep(0, result="ok")) == "ok"
+
+    assert executor.encerrar() == {}
+    assert executor.loop.is_closed()
+    assert executor.encerrar() == {}
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from pages.async_base_page import AsyncBasePage
+from utils.async_webdriver import CHAVE_ELEMENTO, ClienteWebDriver, ElementoRemoto, PoolAssincrono
+
+CAMPO = (By.ID, "username")
+
+
+class _Servidor(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 64  # 20 sessões abrindo conexão juntas
+
+
+class DriverFalso:
+    """
+    EXPLICAÇÃO:
+    Um "chromedriver" de mentira que responde o protocolo W3C o
+    suficiente para as páginas: sessões, url, elementos e scripts.
+    Anota os comandos, as conexões usadas e quantos comandos
+    estavam sendo atendidos ao mesmo tempo.
+    """
+
+    def __init__(self, chunked=False, fechar_conexoes=False, demora=0.0, aparece_depois=0):
+        self.chunked = chunked
+        self.fechar_conexoes = fechar_conexoes
+        self.demora = demora
+        self.aparece_depois = aparece_depois
+        self.comandos = []
+        self.conexoes = set()
+        self.sessoes = 0
+        self.atendendo = 0
+        self.max_atendendo = 0
+        self.elementos_velhos = set()
+        self._lock = threading.Lock()
+        falso = self
+
+        class Tratador(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _responder(self, status, valor):
+                corpo = json.dumps({"value": valor}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                if falso.chunked:
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    for inicio in range(0, len(corpo), 7):
+                        parte = corpo[inicio:inicio + 7]
+                        self.wfile.write(f"{len(parte):x}\r\n".encode() + parte + b"\r\n")
+                    self.wfile.write(b"0\r\n\r\n")
+                else:
+                    self.send_header("Content-Length", str(len(corpo)))
+                    if falso.fechar_conexoes:
+                        self.send_header("Connection", "close")
+                    self.end_headers()
+                    self.wfile.write(corpo)
+
+            def _tratar(self, metodo):
+                falso.conexoes.add(self.client_address)
+                tamanho = int(self.headers.get("Content-Length", 0))
+                corpo = json.loads(self.rfile.read(tamanho) or b"null")
+                with falso._lock:
+                    falso.comandos.append((metodo, self.path, corpo))
+                    falso.atendendo += 1
+                    falso.max_atendendo = max(falso.max_atendendo, falso.atendendo)
+                time.sleep(falso.demora)
+                with falso._lock:
+                    falso.atendendo -= 1
+                status, valor = falso.responder(metodo, self.path, corpo)
+                self._responder(status, valor)
+
+            def do_GET(self):
+                self._tratar("GET")
+
+            def do_POST(self):
+                self._tratar("POST")
+
+            def do_DELETE(self):
+                self._tratar("DELETE")
+
+        self._servidor = _Servidor(("127.0.0.1", 0), Tratador)
+        self.url = f"http://127.0.0.1:{self._servidor.server_address[1]}"
+        threading.Thread(target=self._servidor.serve_forever, daemon=True).start()
+
+    def buscas(self):
+        return [corpo for metodo, caminho, corpo in self.comandos if caminho.endswith("/element")]
+
+    def responder(self, metodo, caminho, corpo):
+        if caminho == "/status":
+            return 200, {"ready": True}
+        if caminho == "/session":
+            with self._lock:
+                self.sessoes += 1
+                return 200, {"sessionId": f"s{self.sessoes}", "capabilities": {"browserName": "firefox"}}
+        sufixo = re.sub(r"^/session/[^/]+", "", caminho)
+        if sufixo.endswith("/element"):
+            if len(self.buscas()) <= self.aparece_depois or "nao-existe" in corpo["value"]:
+                return 404, {"error": "no such element", "message": f"sem {corpo['value']}"}
+            return 200, {CHAVE_ELEMENTO: "el-" + re.sub(r"\W", "", corpo["value"])}
+        elemento = re.match(r"/element/([^/]+)/", sufixo)
+        if elemento and elemento.group(1) in self.elementos_velhos:
+            self.elementos_velhos.discard(elemento.group(1))
+            return 404, {"error": "stale element reference", "message": "elemento velho"}
+        if sufixo.endswith("/text"):
+            return 200, "You logged into a secure area!"
+        if sufixo == "/execute/sync":
+            return 200, {"recebido": corpo["args"], "elemento": {CHAVE_ELEMENTO: "el-devolvido"}}
+        if sufixo == "/window/handles":
+            return 200, ["janela-1"]
+        if "/cdp/" in sufixo or sufixo.startswith("/goog"):
+            return 404, {"error": "unknown command", "message": "sem CDP"}
+        return 200, None
+
+    def parar(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+
+@pytest.fixture
+def driver_falso():
+    falsos = []
+
+    def criar(**kwargs):
+        falsos.append(DriverFalso(**kwargs))
+        return falsos[-1]
+
+    yield criar
+    for falso in falsos:
+        falso.parar()
+
+
+def test_comandos_de_uma_sessao_dividem_a_mesma_conexao(driver_falso):
+    falso = driver_falso()
+
+    async def fluxo():
+        cliente = ClienteWebDriver(falso.url)
+        sessao = await cliente.nova_sessao({"browserName": "firefox"})
+        await sessao.get("http://site/login")
+        campo = await sessao.find_element(*CAMPO)
+        await campo.send_keys("tomsmith")
+        texto = await campo.get_text()
+        await sessao.quit()
+        cliente.fechar()
+        return texto, cliente
+
+    texto, cliente = asyncio.run(fluxo())
+
+    assert texto == "You logged into a secure area!"
+    assert len(falso.conexoes) == 1
+    assert cliente.conexoes_abertas == 1
+    assert falso.buscas() == [{"using": "css selector", "value": '[id="username"]'}]
+    assert ("POST", "/session/s1/element/el-idusername/value", {"text": "tomsmith"}) in falso.comandos
+    assert falso.comandos[-1][:2] == ("DELETE", "/session/s1")
+
+
+def test_erros_do_protocolo_viram_excecoes_do_selenium(driver_falso):
+    falso = driver_falso()
+
+    async def fluxo():
+        sessao = await ClienteWebDriver(falso.url).nova_sessao({})
+        with pytest.raises(NoSuchElementException, match="nao-existe"):
+            await sessao.find_element(By.ID, "nao-existe")
+        falso.elementos_velhos.add("el-velho")
+        with pytest.raises(StaleElementReferenceException):
+            await ElementoRemoto(sessao, "el-velho").click()
+
+    asyncio.run(fluxo())
+
+
+def test_elementos_nos_argumentos_e_na_resposta_dos_scripts(driver_falso):
+    falso = driver_falso()
+
+    async def fluxo():
+        sessao = await ClienteWebDriver(falso.url).nova_sessao({})
+        return await sessao.execute_script("return 1", ElementoRemoto(sessao, "el-1"), [1, "dois"])
+
+    resultado = asyncio.run(fluxo())
+
+    assert falso.comandos[-1][2]["args"] == [{CHAVE_ELEMENTO: "el-1"}, [1, "dois"]]
+    assert resultado["elemento"] == ElementoRemoto(None, "el-devolvido")
+
+
+@pytest.mark.parametrize("modo", [{"chunked": True}, {"fechar_conexoes": True}])
+def test_respostas_em_pedacos_e_conexoes_fechadas_pelo_servidor(driver_falso, modo):
+    falso = driver_falso(**modo)
+
+    async def fluxo():
+        cliente = ClienteWebDriver(falso.url)
+        sessao = await cliente.nova_sessao({})
+        for _ in range(3):
+            assert await sessao.get_title() is None
+        return await (await sessao.find_element(*CAMPO)).get_text()
+
+    assert asyncio.run(fluxo()) == "You logged into a secure area!"
+
+
+def test_resposta_quebrada_fecha_a_conexao():
+    async def fluxo():
+        fechadas = []
+
+        async def atender(leitor, escritor):
+            await leitor.readuntil(b"\r\n\r\n")
+            escritor.write(b"lixo\r\n\r\n")
+            await escritor.drain()
+            fechadas.append(await leitor.read() == b"")  # EOF: o cliente fechou
+
+        servidor = await asyncio.start_server(atender, "127.0.0.1", 0)
+        cliente = ClienteWebDriver(f"http://127.0.0.1:{servidor.sockets[0].getsockname()[1]}")
+        with pytest.raises(WebDriverException, match="Resposta HTTP inválida"):
+            await cliente.status()
+        await asyncio.sleep(0.1)
+        servidor.close()
+        return cliente, fechadas
+
+    cliente, fechadas = asyncio.run(fluxo())
+
+    assert cliente._livres == [] and fechadas == [True]
+
+
+def test_endereco_https_usa_tls_na_porta_443():
+    cliente = ClienteWebDriver("https://grid.exemplo.com/wd/hub")
+
+    assert cliente.tls and cliente.porta == 443 and cliente._prefixo == "/wd/hub"
+    assert ClienteWebDriver("http://127.0.0.1:9515").porta == 9515
+    with pytest.raises(ValueError, match="http:// ou https://"):
+        ClienteWebDriver("ws://127.0.0.1:9515")
+
+
+def test_muitas_sessoes_ocupadas_num_processo_so(driver_falso):
+    falso = driver_falso(demora=0.2)
+
+    async def fluxo(cliente):
+        sessao = await cliente.nova_sessao({})
+        await sessao.get("http://site/login")
+
+    async def todas():
+        cliente = ClienteWebDriver(falso.url)
+        inicio = time.perf_counter()
+        await asyncio.gather(*(fluxo(cliente) for _ in range(20)))
+        return time.perf_counter() - inicio
+
+    duracao = asyncio.run(todas())
+
+    assert falso.sessoes == 20
+    assert falso.max_atendendo > 5  # Os comandos das sessões foram atendidos juntos
+    assert duracao < 20 * 2 * 0.2 / 4  # Um atrás do outro seriam 8s
+
+
+def test_pool_reaproveita_a_sessao_limpa(driver_falso):
+    falso = driver_falso()
+
+    async def fluxo():
+        cliente = ClienteWebDriver(falso.url)
+        pool = PoolAssincrono(lambda: cliente.nova_sessao({}))
+        primeira = await pool.adquirir()
+        await pool.devolver(primeira)
+        segunda = await pool.adquirir()
+        await pool.devolver(segunda)
+        await pool.encerrar()
+        return primeira, segunda, pool
+
+    primeira, segunda, pool = asyncio.run(fluxo())
+
+    assert segunda is primeira
+    assert pool.estatisticas() == {"partidas_frias": 1, "partidas_evitadas": 1, "descartes": 0}
+    assert ("DELETE", "/session/s1/cookie", None) in falso.comandos  # Sem CDP: só os cookies do site atual
+    assert ("POST", "/session/s1/url", {"url": "about:blank"}) in falso.comandos
+
+
+def test_pagina_assincrona_espera_o_elemento_e_usa_o_cache(driver_falso):
+    falso = driver_falso(aparece_depois=2)
+
+    async def fluxo():
+        sessao = await ClienteWebDriver(falso.url).nova_sessao({})
+        pagina = AsyncBasePage(sessao)
+        await pagina.digitar_texto(CAMPO, "tomsmith")
+        falso.elementos_velhos.add("el-idusername")  # A página foi redesenhada
+        await pagina.clicar(CAMPO)
+        return pagina
+
+    pagina = asyncio.run(fluxo())
+
+    assert len(falso.buscas()) == 4  # 2 "ainda não existe", 1 encontrado, 1 depois do elemento velho
+    assert pagina.estatisticas_cache() == {"acertos": 1, "falhas": 2}
@@ -0,0 +1,52 @@
+from selenium.webdriver.common.by import By
+
+from pages import scripts
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+
+TITULO = {"tag": "h2", "texto": "Login Page", "atributos": {}, "caixa": {}, "visivel": True}
+
+
+def campo(valor="", visivel=True):
+    return {"tag": "input", "texto": "", "atributos": {"value": valor}, "caixa": {}, "visivel": visivel}
+
+
+class DriverFalso:
+    """Responde a consulta em lote com os elementos de "por_locator" ({(by, valor): [elementos]})"""
+
+    def __init__(self, por_locator):
+        self.por_locator = por_locator
+        self.chamadas = []
+
+    def execute_script(self, script, locators, atributos):
+        assert script == scripts.CONSULTA_EM_LOTE
+        self.chamadas.append((locators, atributos))
+        return [self.por_locator.get(tuple(locator), []) for locator in locators]
+
+
+def test_consultar_elementos_numa_ida_ao_navegador():
+    driver = DriverFalso({("id", "username"): [campo("tom")], ("css selector", "li"): [campo(), campo()]})
+    pagina = BasePage(driver)
+
+    resultado = pagina.consultar_elementos([(By.ID, "username"), (By.CSS_SELECTOR, "li"), (By.ID, "nada")], ["value"])
+    campos = pagina.ler_campos({"usuario": (By.ID, "username"), "nada": (By.ID, "nada")}, ["value"])
+
+    assert driver.chamadas[0] == ([["id", "username"], ["css selector", "li"], ["id", "nada"]], ["value"])
+    assert len(resultado[(By.CSS_SELECTOR, "li")]) == 2 and resultado[(By.ID, "nada")] == []
+    assert campos == {"usuario": campo("tom"), "nada": None}
+    assert len(driver.chamadas) == 2
+
+
+def test_pagina_de_login_confere_titulo_e_campos_juntos():
+    formulario = {
+        LoginPage.TITULO_PAGINA_LOGIN: [TITULO],
+        LoginPage.CAMPO_USERNAME: [campo()],
+        LoginPage.CAMPO_PASSWORD: [campo()],
+    }
+    driver = DriverFalso(formulario)
+
+    assert LoginPage(driver).esta_na_pagina_login()
+    assert len(driver.chamadas) == 1
+
+    formulario[LoginPage.CAMPO_PASSWORD] = [campo(visivel=False)]
+    assert not LoginPage(driver).esta_na_pagina_login()
@@ -0,0 +1,89 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+
+CAMPO = (By.ID, "username")
+
+
+class ElementoFalso:
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.texto_digitado = ""
+
+    def _verificar(self):
+        if self.driver.geracao_da_pagina != self.geracao:
+            raise StaleElementReferenceException("elemento velho")
+
+    def clear(self):
+        self._verificar()
+        self.texto_digitado = ""
+
+    def send_keys(self, texto):
+        self._verificar()
+        self.texto_digitado += texto
+
+    def click(self):
+        self._verificar()
+
+    @property
+    def text(self):
+        self._verificar()
+        return self.texto_digitado
+
+
+class DriverFalso:
+    """Conta quantas buscas chegam ao "navegador" """
+
+    def __init__(self):
+        self.buscas = 0
+        self.geracao_da_pagina = 0
+
+    def find_element(self, by, valor):
+        self.buscas += 1
+        elemento = ElementoFalso(self)
+        elemento.geracao = self.geracao_da_pagina
+        return elemento
+
+    def redesenhar_pagina(self):
+        self.geracao_da_pagina += 1
+
+
+@pytest.fixture
+def driver_falso():
+    return DriverFalso()
+
+
+def test_interacoes_repetidas_usam_cache(driver_falso):
+    pagina = BasePage(driver_falso)
+
+    pagina.digitar_texto(CAMPO, "tom")
+    pagina.digitar_texto(CAMPO, "smith")
+    texto = pagina.obter_texto(CAMPO)
+
+    assert texto == "smith"
+    assert driver_falso.buscas == 1
+    assert pagina.estatisticas_cache() == {"acertos": 2, "falhas": 1}
+
+
+def test_elemento_velho_e_buscado_de_novo(driver_falso):
+    pagina = BasePage(driver_falso)
+    pagina.digitar_texto(CAMPO, "tom")
+
+    driver_falso.redesenhar_pagina()
+    pagina.digitar_texto(CAMPO, "smith")
+
+    assert driver_falso.buscas == 2
+    assert pagina.obter_texto(CAMPO) == "smith"
+
+
+def test_limpar_cache_forca_nova_busca(driver_falso):
+    pagina = BasePage(driver_falso)
+    pagina.obter_texto(CAMPO)
+
+    pagina.limpar_cache_elementos()
+    pagina.obter_texto(CAMPO)
+
+    assert driver_falso.buscas == 2
@@ -0,0 +1,173 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages import scripts
+from pages.base_page import BasePage, UrlContem, Visivel
+from utils.logger import formatar_linhas, teste_atual
+
+CAMPO = (By.ID, "username")
+
+
+class DriverFalso:
+    """
+    Responde os scripts de espera da BasePage (sem canal de eventos):
+    a página "troca" na consulta número trocar_em (None = nunca troca)
+    """
+
+    def __init__(self, trocar_em=None, estrategia="normal"):
+        self.capabilities = {"pageLoadStrategy": estrategia}
+        self.trocar_em = trocar_em
+        self.consultas = 0
+        self.scripts = []
+        self.argumentos = []
+        self.limites = []
+        self.respostas = {}  # Resposta de cada script assíncrono (padrão: True)
+
+    def execute_script(self, script, *argumentos):
+        self.scripts.append(script)
+        self.argumentos.append(argumentos)
+        if script == scripts.DOCUMENTO_TROCOU:
+            self.consultas += 1
+            return self.trocar_em is not None and self.consultas >= self.trocar_em
+        return None
+
+    def set_script_timeout(self, segundos):
+        self.limites.append(segundos)
+
+    def execute_async_script(self, script, *argumentos):
+        self.scripts.append(script)
+        self.argumentos.append(argumentos)
+        return self.respostas.get(script, True)
+
+
+@pytest.fixture(autouse=True)
+def sem_metricas(monkeypatch):
+    monkeypatch.setattr(BasePage, "COLETAR_METRICAS", False)
+
+
+@pytest.fixture
+def log_do_teste():
+    """As linhas de log deste teste (o conftest abre um buffer por teste)"""
+    return lambda: formatar_linhas(teste_atual())
+
+
+def test_esperar_navegacao_quando_a_pagina_troca():
+    driver = DriverFalso(trocar_em=3)
+    pagina = BasePage(driver)
+    pagina._cache_elementos[CAMPO] = object()
+
+    with pagina.esperar_navegacao(timeout=2):
+        assert driver.scripts == [scripts.MARCAR_DOCUMENTO]
+
+    assert driver.scripts[1:] == [scripts.DOCUMENTO_TROCOU] * 3 + [scripts.AGUARDAR_CARREGAMENTO]
+    assert pagina._cache_elementos == {}
+
+
+def test_esperar_navegacao_sem_troca_desiste_no_timeout(log_do_teste):
+    driver = DriverFalso()
+    pagina = BasePage(driver)
+    pagina._cache_elementos[CAMPO] = elemento = object()
+
+    with pagina.esperar_navegacao(timeout=0.2):
+        pass
+
+    assert scripts.AGUARDAR_CARREGAMENTO not in driver.scripts
+    assert driver.consultas > 1
+    assert pagina._cache_elementos == {CAMPO: elemento}
+    assert "Nenhuma navegação aconteceu em 0.2s" in log_do_teste()
+
+
+def test_aguardar_pagina_carregar_pela_estrategia(log_do_teste):
+    driver = DriverFalso(estrategia="eager")
+    pagina = BasePage(driver)
+    pagina.timeout = 3
+
+    pagina.aguardar_pagina_carregar()
+    driver.respostas[scripts.AGUARDAR_DOM_PRONTO] = False
+    pagina.aguardar_pagina_carregar()
+
+    assert driver.scripts == [scripts.AGUARDAR_DOM_PRONTO] * 2
+    assert driver.argumentos[0] == (3000,)
+    assert driver.limites == [8]  # O limite já estava aplicado na segunda espera
+    assert "Página pode não ter carregado completamente" in log_do_teste()
+
+
+def test_esperar_mudanca_dom_arma_antes_e_espera_depois(log_do_teste):
+    driver = DriverFalso()
+    pagina = BasePage(driver)
+
+    with pagina.esperar_mudanca_dom(CAMPO, timeout=1):
+        assert driver.scripts == [scripts.ARMAR_OBSERVADOR_DOM]
+    driver.respostas[scripts.AGUARDAR_MUDANCA_DOM] = None  # A página trocou antes
+    with pagina.esperar_mudanca_dom(CAMPO, timeout=1):
+        pass
+
+    primeiro_id = driver.argumentos[0][0]
+    assert driver.argumentos[0] == (primeiro_id, "id", "username")
+    assert driver.argumentos[1] == (primeiro_id, 1000)
+    assert driver.argumentos[2][0] != primeiro_id
+    assert "Página trocou antes de observar mudanças" in log_do_teste()
+
+
+def test_aguardar_rede_ociosa_pelo_script():
+    driver = DriverFalso()
+    pagina = BasePage(driver)
+
+    assert pagina.aguardar_rede_ociosa(janela_ms=300, timeout=2) is True
+    driver.respostas[scripts.AGUARDAR_REDE_OCIOSA] = False
+    assert pagina.aguardar_rede_ociosa(janela_ms=300, timeout=2) is False
+    assert driver.argumentos == [(300, 2000), (300, 2000)]
+
+
+def test_limite_do_script_so_vai_ao_navegador_quando_muda():
+    driver = DriverFalso()
+    primeira, segunda = BasePage(driver), BasePage(driver)
+
+    primeira.aguardar_rede_ociosa(timeout=2)
+    segunda.aguardar_rede_ociosa(timeout=2)
+    segunda.aguardar_rede_ociosa(timeout=4)
+
+    assert driver.limites == [7, 9]
+
+
+class DriverCorrida:
+    """Responde a corrida com os índices de "indices", um por rodada (o último se repete)"""
+
+    def __init__(self, *indices):
+        self.indices = list(indices)
+        self.especificacoes = []
+
+    def execute_script(self, script, especificacao):
+        assert script == scripts.CORRIDA
+        self.especificacoes.append(especificacao)
+        return self.indices[min(len(self.especificacoes), len(self.indices)) - 1]
+
+
+def test_corrida_devolve_a_primeira_condicao_que_acontece():
+    driver = DriverCorrida(-1, -1, 1)
+    pagina = BasePage(driver)
+
+    resultado = pagina.aguardar_primeiro({
+        "sucesso": Visivel((By.CSS_SELECTOR, ".flash.success"), contem="logged"),
+        "url_segura": UrlContem("/secure"),
+        "erro": (By.CSS_SELECTOR, ".flash.error"),
+    }, timeout=2)
+
+    assert resultado.vencedor == "url_segura" and resultado.duracao < 2
+    assert len(driver.especificacoes) == 3
+    assert driver.especificacoes[0] == [
+        {"tipo": "visivel", "by": "css selector", "valor": ".flash.success", "contem": "logged"},
+        {"tipo": "url", "trecho": "/secure"},
+        {"tipo": "visivel", "by": "css selector", "valor": ".flash.error", "contem": None},
+    ]
+
+
+def test_corrida_sem_vencedor_no_timeout():
+    driver = DriverCorrida(-1)
+    pagina = BasePage(driver)
+
+    resultado = pagina.aguardar_primeiro({"erro": Visivel(CAMPO), "url": UrlContem("/secure")}, timeout=0.2)
+
+    assert resultado.vencedor is None
+    assert 0.2 <= resultado.duracao < 1
+    assert len(driver.especificacoes) > 1
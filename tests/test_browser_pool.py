@@ -0,0 +1,132 @@
+import threading
+
+import pytest
+from utils.browser_pool import BrowserPool
+
+
+class DriverFalso:
+    """
+    EXPLICAÇÃO:
+    Imita um WebDriver sem abrir navegador nenhum,
+    para testar a lógica do pool de forma rápida
+    """
+
+    def __init__(self, quebrado=False):
+        self.quebrado = quebrado
+        self.fechado = False
+        self.window_handles = ["principal"]
+        self.paginas = []
+        self.cookies_apagados = 0
+        self.switch_to = self
+
+    @property
+    def current_window_handle(self):
+        if self.quebrado:
+            raise RuntimeError("sessão morreu")
+        return self.window_handles[0]
+
+    def window(self, janela):
+        pass
+
+    def close(self):
+        self.window_handles.pop()
+
+    def execute_script(self, script):
+        if self.quebrado:
+            raise RuntimeError("sessão morreu")
+
+    def delete_all_cookies(self):
+        self.cookies_apagados += 1
+
+    def get(self, url):
+        if self.quebrado:
+            raise RuntimeError("sessão morreu")
+        self.paginas.append(url)
+
+    def quit(self):
+        self.fechado = True
+
+
+@pytest.fixture
+def pool():
+    return BrowserPool(DriverFalso, tamanho=1, max_usos=3)
+
+
+def test_pool_reaproveita_navegador(pool):
+    primeiro = pool.adquirir()
+    pool.devolver(primeiro)
+    segundo = pool.adquirir()
+
+    assert segundo is primeiro
+    assert pool.partidas_frias == 1
+    assert pool.partidas_evitadas == 1
+
+
+def test_pool_limpa_estado_ao_devolver(pool):
+    driver = pool.adquirir()
+    driver.window_handles.append("popup")
+
+    pool.devolver(driver)
+
+    assert driver.window_handles == ["principal"]
+    assert driver.cookies_apagados == 1
+    assert driver.paginas[-1] == "about:blank"
+
+
+def test_pool_descarta_apos_max_usos(pool):
+    driver = pool.adquirir()
+    for _ in range(3):
+        pool.devolver(driver)
+        if not driver.fechado:
+            driver = pool.adquirir()
+
+    assert driver.fechado
+    assert pool.descartes == 1
+    assert pool.adquirir() is not driver
+
+
+def test_pool_descarta_navegador_quebrado(pool):
+    driver = pool.adquirir()
+    driver.quebrado = True
+
+    pool.devolver(driver)
+
+    assert driver.fechado
+    assert pool.descartes == 1
+    assert pool.adquirir() is not driver
+
+
+def test_pool_descarta_navegador_que_morreu_parado(pool):
+    driver = pool.adquirir()
+    pool.devolver(driver)
+    driver.quebrado = True  # A sessão morreu enquanto estava guardada
+
+    entregues = []
+    tarefa = threading.Thread(target=lambda: entregues.append(pool.adquirir()), daemon=True)
+    tarefa.start()
+    tarefa.join(5)
+
+    assert not tarefa.is_alive(), "adquirir travou ao descartar o navegador morto"
+    assert entregues[0] is not driver and driver.fechado
+    assert pool.descartes == 1 and pool.partidas_frias == 2
+
+
+def test_pool_respeita_tamanho_maximo(pool):
+    primeiro = pool.adquirir()
+    segundo = pool.adquirir()
+
+    pool.devolver(primeiro)
+    pool.devolver(segundo)
+
+    assert not primeiro.fechado
+    assert segundo.fechado
+
+
+def test_pool_encerrar_fecha_livres(pool):
+    driver = pool.adquirir()
+    pool.devolver(driver)
+
+    pool.encerrar()
+
+    assert driver.fechado
+    assert pool.descartes == 0
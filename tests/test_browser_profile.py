@@ -0,0 +1,157 @@
+import json
+import os
+import statistics
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from utils.browser_profile import (
+    ARGUMENTOS_PERFORMANCE,
+    CATEGORIAS_BLOQUEIO,
+    aplicar_bloqueio_terceiros,
+    aplicar_perfil,
+    bloquear_recursos,
+    interpretar_bloqueio,
+)
+
+
+class DriverCdpFalso:
+    """Anota os comandos CDP em vez de mandá-los para um Chrome"""
+
+    def __init__(self):
+        self.comandos = []
+
+    def execute_cdp_cmd(self, comando, parametros):
+        self.comandos.append((comando, parametros))
+
+
+def test_perfil_padrao_mantem_o_navegador_completo():
+    opcoes = aplicar_perfil(Options(), "padrao")
+
+    assert opcoes.arguments == ["--start-maximized"]
+    assert opcoes.page_load_strategy == "normal"
+
+
+def test_perfil_performance():
+    opcoes = aplicar_perfil(Options(), "performance", estrategia="none")
+
+    assert "--headless=new" in opcoes.arguments
+    assert "--start-maximized" not in opcoes.arguments
+    assert set(ARGUMENTOS_PERFORMANCE) <= set(opcoes.arguments)
+    assert "--window-size=1366,768" in opcoes.arguments
+    assert opcoes.page_load_strategy == "none"
+
+
+def test_perfil_desconhecido():
+    with pytest.raises(ValueError):
+        aplicar_perfil(Options(), "turbo")
+
+
+def test_interpretar_bloqueio():
+    assert interpretar_bloqueio("") == []
+    assert interpretar_bloqueio(" imagens, fontes ,") == ["imagens", "fontes"]
+    with pytest.raises(ValueError):
+        interpretar_bloqueio("imagens,videos")
+
+
+def test_bloquear_recursos_via_cdp():
+    driver = DriverCdpFalso()
+
+    padroes = bloquear_recursos(driver, ["imagens", "terceiros"])
+
+    assert padroes == CATEGORIAS_BLOQUEIO["imagens"]
+    assert driver.comandos == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": padroes})]
+
+
+def test_sem_bloqueio_nao_fala_com_o_navegador():
+    driver = DriverCdpFalso()
+
+    assert bloquear_recursos(driver, []) == []
+    assert bloquear_recursos(object(), ["fontes"]) == []
+    assert driver.comandos == []
+
+
+def test_bloqueio_de_terceiros_libera_o_site_testado():
+    opcoes = aplicar_bloqueio_terceiros(Options(), "https://the-internet.herokuapp.com")
+
+    assert opcoes.arguments == [
+        "--host-resolver-rules=MAP * ~NOTFOUND , EXCLUDE the-internet.herokuapp.com , EXCLUDE localhost , EXCLUDE 127.0.0.1"
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_benchmark_perfis(request, base_url):
+    """
+    EXPLICAÇÃO:
+    Compara o navegador da fixture `driver` de antes (janela maximizada)
+    com o perfil performance, com e sem bloqueio de recursos.
+    Mede subir o navegador e fazer um login, algumas vezes cada um,
+    e grava as medianas em reports/benchmark_perfis.json
+
+    USO:
+        pytest tests/test_browser_profile.py --benchmark -s --base-url=local
+    
+    Sem Chrome ou chromedriver disponível, o teste é pulado
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from conftest import _caminho_driver
+    from pages.login_page import LoginPage
+
+    try:
+        caminho_driver = _caminho_driver(request.config, "chrome")
+    except Exception as e:
+        pytest.skip(f"chromedriver indisponível: {e}")
+    
+    headless = request.config.getoption("--headless")
+    cenarios = {
+        "fixture_atual": lambda opcoes: opcoes.add_argument("--start-maximized"),
+        "performance": lambda opcoes: aplicar_perfil(opcoes, "performance"),
+        "performance_bloqueio": lambda opcoes: aplicar_bloqueio_terceiros(
+            aplicar_perfil(opcoes, "performance"), base_url
+        ),
+    }
+    repeticoes = 3
+    resultados = {}
+
+    for nome, configurar in cenarios.items():
+        medidas = {"inicio": [], "login": []}
+        for _ in range(repeticoes):
+            opcoes = Options()
+            configurar(opcoes)
+            if headless and nome == "fixture_atual":
+                opcoes.add_argument("--headless=new")
+
+            inicio = time.perf_counter()
+            try:
+                driver = webdriver.Chrome(service=Service(caminho_driver), options=opcoes)
+            except WebDriverException as e:
+                if not resultados and not medidas["inicio"]:
+                    pytest.skip(f"Chrome indisponível: {e.msg}")
+                raise
+            try:
+                if nome == "performance_bloqueio":
+                    bloquear_recursos(driver, ["imagens", "fontes", "analytics"])
+                medidas["inicio"].append(time.perf_counter() - inicio)
+
+                inicio = time.perf_counter()
+                login = LoginPage(driver)
+                login.navegar_para_login()
+                login.login_valido()
+                assert login.login_foi_bem_sucedido()
+                medidas["login"].append(time.perf_counter() - inicio)
+            finally:
+                driver.quit()
+        resultados[nome] = {etapa: round(statistics.median(valores), 3) for etapa, valores in medidas.items()}
+
+    print(f"\n📊 Perfis do navegador (mediana de {repeticoes} execuções, segundos)")
+    for nome, medianas in resultados.items():
+        print(f"   {nome:<22} início: {medianas['inicio']:6.2f}   login: {medianas['login']:6.2f}")
+
+    os.makedirs("reports", exist_ok=True)
+    with open(os.path.join("reports", "benchmark_perfis.json"), "w", encoding="utf-8") as arquivo:
+        json.dump({"base_url": base_url, "headless": headless, "resultados": resultados}, arquivo, indent=2)
@@ -1,28 +1,21 @@
 
 import pytest
 from pages.login_page import LoginPage
+from utils.data_source import data_source, para_booleano
 
 class TestLoginDataDriven:
     
-    @pytest.mark.parametrize("username,password,deveria_funcionar", [
-        
-        ("tomsmith", "SuperSecretPassword!", True),   # ✅ Credenciais válidas
-        ("admin", "SuperSecretPassword!", False),     # ❌ Usuário errado
-        ("tomsmith", "senha123", False),              # ❌ Senha errada  
-        ("", "SuperSecretPassword!", False),          # ❌ Usuário vazio
-        ("tomsmith", "", False),                      # ❌ Senha vazia
-        ("", "", False),                              # ❌ Ambos vazios
-        ("user@test.com", "SuperSecretPassword!", False), # ❌ Email em vez de nome
-    ])
+    @data_source("dados/credenciais.csv", ids="caso", tipos={"deveria_funcionar": para_booleano})
     def test_login_com_diferentes_credenciais(self, driver, username, password, deveria_funcionar):
         """
         EXPLICAÇÃO:
-        Este teste vai rodar 7 vezes, uma para cada linha de dados
-        É como testar a fechadura com 7 chaves diferentes
+        Este teste vai rodar uma vez para cada linha de dados/credenciais.csv
+        É como testar a fechadura com várias chaves diferentes
         
         PARÂMETROS:
-        - @pytest.mark.parametrize: Marca que teste vai rodar múltiplas vezes
-        - Cada tupla vira uma execução diferente
+        - @data_source: Marca que teste vai rodar múltiplas vezes
+        - Cada linha do arquivo vira uma execução diferente
+          (só as colunas que o teste pede viram parâmetros)
         - deveria_funcionar: True se espera sucesso, False se espera erro
         """
         
@@ -133,51 +126,33 @@ class TestLoginComCenarios:
             print("✅ Cenário falhou como esperado")
 
 
-@pytest.fixture
-def dados_do_arquivo():
-    """
-    EXPLICAÇÃO:
-    Em projetos reais, dados podem vir de arquivos externos
-    Como ter uma "planilha" com todos os casos de teste
-    """
-    
-    return [
-        {"nome": "Teste Básico", "user": "tomsmith", "pwd": "SuperSecretPassword!", "deve_passar": True},
-        {"nome": "Admin Falso", "user": "admin", "pwd": "admin123", "deve_passar": False},
-        {"nome": "Campos Vazios", "user": "", "pwd": "", "deve_passar": False},
-        {"nome": "Usuário com Espaços", "user": " tomsmith ", "pwd": "SuperSecretPassword!", "deve_passar": False},
-        {"nome": "Senha com Caracteres Especiais", "user": "tomsmith", "pwd": "!@#$%^&*()", "deve_passar": False},
-    ]
-
 class TestLoginDadosExternos:
     
-    def test_todos_cenarios_do_arquivo(self, driver, dados_do_arquivo):
+    @data_source("dados/cenarios_login.jsonl", ids="caso")
+    def test_cenario_do_arquivo(self, driver, nome, user, pwd, deve_passar):
         """
         EXPLICAÇÃO:
-        Testa todos os cenários que vieram do "arquivo externo"
-        Como seguir uma lista de instruções passo a passo
+        Cada linha do "arquivo externo" (dados/cenarios_login.jsonl) vira um teste separado
+        
+        - Uma falha não interrompe os outros cenários
+        - O relatório mostra o resultado de cada linha
+        - Em paralelo (--workers), as linhas são divididas entre os workers
+        - O navegador vem do pool: cada worker reaproveita o mesmo
+          navegador aquecido, limpo entre um cenário e outro
         """
         
+        print(f"\n📁 Executando: {nome}")
+        
         login_page = LoginPage(driver)
+        login_page.navegar_para_login()
+        login_page.fazer_login(user, pwd)
         
-        for cenario in dados_do_arquivo:
-            print(f"\n📁 Executando: {cenario['nome']}")
-            
-            login_page.navegar_para_login()
-            
-            
-            login_page.fazer_login(cenario['user'], cenario['pwd'])
-            
-            
-            if cenario['deve_passar']:
-                assert login_page.login_foi_bem_sucedido(), f"Cenário '{cenario['nome']}' deveria passar"
-                print(f"✅ {cenario['nome']}: PASSOU")
-               
-                if login_page.botao_logout_esta_visivel():
-                    login_page.fazer_logout()
-            else:
-                assert login_page.login_falhou(), f"Cenário '{cenario['nome']}' deveria falhar"
-                print(f"❌ {cenario['nome']}: FALHOU (como esperado)")
+        if deve_passar:
+            assert login_page.login_foi_bem_sucedido(), f"Cenário '{nome}' deveria passar"
+            print(f"✅ {nome}: PASSOU")
+        else:
+            assert login_page.login_falhou(), f"Cenário '{nome}' deveria falhar"
+            print(f"❌ {nome}: FALHOU (como esperado)")
 
 
 class TestLoginAvancado:
@@ -255,21 +230,23 @@ def perfis_de_usuario():
 class TestPerfisDeUsuario:
     
     @pytest.mark.parametrize("perfil_nome", ["usuario_comum"])  
-    def test_acesso_por_perfil(self, driver, perfis_de_usuario, perfil_nome):
+    def test_acesso_por_perfil(self, driver, cache_sessoes, perfis_de_usuario, perfil_nome):
         """
         EXPLICAÇÃO:
         Testa se cada tipo de usuário consegue acessar o que deve
         Como verificar se cada "crachá" abre as portas certas
+        
+        O login pelo formulário acontece uma vez por perfil;
+        depois a sessão guardada é reaproveitada (cache_sessoes)
         """
         
         perfil = perfis_de_usuario[perfil_nome]
         print(f"\n👤 Testando perfil: {perfil_nome}")
         
         login_page = LoginPage(driver)
-        login_page.navegar_para_login()
         
         credenciais = perfil["credenciais"]
-        login_page.fazer_login(credenciais["username"], credenciais["password"])
+        login_page.entrar_com_sessao_em_cache(cache_sessoes, credenciais["username"], credenciais["password"])
         
        
         if perfil_nome == "usuario_comum":
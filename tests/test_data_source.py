@@ -0,0 +1,136 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from utils import data_source
+from utils.data_source import carregar_tabela, interpretar_shard, ler_registros, para_booleano, parametrizar
+
+
+@pytest.fixture
+def arquivo_csv(tmp_path):
+    caminho = tmp_path / "credenciais.csv"
+    caminho.write_text(
+        "caso,username,password,deveria_funcionar\n"
+        "validas,tomsmith,SuperSecretPassword!,true\n"
+        "senha_errada,tomsmith,senha123,false\n"
+        "usuario_vazio,,SuperSecretPassword!,false\n",
+        encoding="utf-8",
+    )
+    return caminho
+
+
+class MetafuncFalso:
+    """Guarda o que seria parametrizado, como o metafunc do pytest"""
+
+    def __init__(self, arquivo_teste, argumentos):
+        self.definition = SimpleNamespace(path=arquivo_teste)
+        self.fixturenames = argumentos
+        self.function = SimpleNamespace(__name__="test_falso")
+
+    def parametrize(self, nomes, parametros):
+        self.nomes = nomes
+        self.parametros = parametros
+
+
+def _marcador(*args, **kwargs):
+    return data_source.data_source(*args, **kwargs).mark
+
+
+def test_ler_registros_csv(arquivo_csv):
+    registros = list(ler_registros(str(arquivo_csv)))
+
+    assert len(registros) == 3
+    assert registros[2] == {"caso": "usuario_vazio", "username": "", "password": "SuperSecretPassword!", "deveria_funcionar": "false"}
+
+
+def test_ler_registros_xlsx(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    caminho = str(tmp_path / "cenarios.xlsx")
+    pasta = openpyxl.Workbook()
+    planilha = pasta.active
+    planilha.title = "login"
+    planilha.append(["nome", "user", "deve_passar"])
+    planilha.append(["Teste Básico", "tomsmith", True])
+    planilha.append([None, None, None])
+    planilha.append(["Admin Falso", "admin", False])
+    pasta.save(caminho)
+
+    registros = list(ler_registros(caminho, aba="login"))
+
+    assert [registro["nome"] for registro in registros] == ["Teste Básico", "Admin Falso"]
+    assert registros[0]["deve_passar"] is True
+
+
+def test_coluna_sem_cabecalho_nao_desloca_as_outras(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    caminho = tmp_path / "credenciais.xlsx"
+    pasta = openpyxl.Workbook()
+    pasta.active.append(["usuario", None, "senha"])
+    pasta.active.append(["tom", "x", "segredo"])
+    pasta.save(str(caminho))
+    metafunc = MetafuncFalso(caminho, ["usuario", "senha"])
+
+    parametrizar(metafunc, _marcador("credenciais.xlsx"))
+
+    assert metafunc.parametros[0].values == ("tom", "segredo")
+    assert list(ler_registros(str(caminho))) == [{"usuario": "tom", "senha": "segredo"}]
+
+
+def test_ler_registros_jsonl_com_chaves_novas(tmp_path):
+    caminho = tmp_path / "cenarios.jsonl"
+    caminho.write_text('{"nome": "a", "user": "tom"}\n\n{"nome": "b", "pwd": "x"}\n', encoding="utf-8")
+
+    registros = list(ler_registros(str(caminho)))
+
+    assert registros == [{"nome": "a", "user": "tom"}, {"nome": "b", "user": None, "pwd": "x"}]
+
+
+def test_cache_evita_reler_o_arquivo(arquivo_csv, tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    primeira = carregar_tabela(str(arquivo_csv), diretorio_cache=cache)
+
+    def nao_deveria_ler(*args):
+        raise AssertionError("arquivo relido com cache válido")
+
+    monkeypatch.setattr(data_source, "_abrir", nao_deveria_ler)
+    assert carregar_tabela(str(arquivo_csv), diretorio_cache=cache) == primeira
+
+
+def test_cache_invalido_quando_arquivo_muda(arquivo_csv, tmp_path):
+    cache = tmp_path / "cache"
+    carregar_tabela(str(arquivo_csv), diretorio_cache=cache)
+
+    with open(arquivo_csv, "a", encoding="utf-8") as arquivo:
+        arquivo.write("nova,ana,123,false\n")
+    os.utime(arquivo_csv, ns=(0, os.stat(arquivo_csv).st_mtime_ns + 1_000_000))
+
+    _, linhas = carregar_tabela(str(arquivo_csv), diretorio_cache=cache)
+    assert len(linhas) == 4
+
+
+def test_parametriza_so_as_colunas_do_teste(arquivo_csv):
+    metafunc = MetafuncFalso(arquivo_csv, ["driver", "username", "deveria_funcionar"])
+
+    parametrizar(metafunc, _marcador("credenciais.csv", ids="caso", tipos={"deveria_funcionar": para_booleano}))
+
+    assert metafunc.nomes == ["username", "deveria_funcionar"]
+    assert [parametro.id for parametro in metafunc.parametros] == ["validas", "senha_errada", "usuario_vazio"]
+    assert metafunc.parametros[0].values == ("tomsmith", True)
+
+
+def test_shard_divide_as_linhas(arquivo_csv):
+    partes = []
+    for parte in (1, 2):
+        metafunc = MetafuncFalso(arquivo_csv, ["username"])
+        parametrizar(metafunc, _marcador("credenciais.csv", ids="caso"), shard=f"{parte}/2")
+        partes.append([parametro.id for parametro in metafunc.parametros])
+
+    assert partes == [["validas", "usuario_vazio"], ["senha_errada"]]
+
+
+def test_shard_invalido():
+    with pytest.raises(ValueError):
+        interpretar_shard("3/2")
+    with pytest.raises(ValueError):
+        interpretar_shard("metade")
@@ -0,0 +1,74 @@
+import pytest
+from utils import driver_binary
+from utils.driver_binary import ler_manifesto, resolver_chromedriver, resolver_driver
+
+
+@pytest.fixture
+def chromedriver_falso(tmp_path):
+    caminho = tmp_path / "chromedriver"
+    caminho.write_text("binário de mentira")
+    return str(caminho)
+
+
+@pytest.fixture(autouse=True)
+def versao_fixa(monkeypatch):
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.delenv("GECKODRIVER_PATH", raising=False)
+    monkeypatch.setattr(driver_binary, "versao_do_chrome", lambda: "120.0.1")
+
+
+def test_instala_uma_vez_e_depois_usa_manifesto(tmp_path, chromedriver_falso):
+    chamadas = []
+
+    def instalar():
+        chamadas.append(1)
+        return chromedriver_falso
+
+    cache = str(tmp_path / "cache")
+    primeiro = resolver_chromedriver(diretorio_cache=cache, instalar=instalar)
+    segundo = resolver_chromedriver(diretorio_cache=cache, instalar=instalar)
+
+    assert primeiro == segundo == chromedriver_falso
+    assert len(chamadas) == 1
+    assert ler_manifesto(cache) == {"chrome-120.0.1": chromedriver_falso}
+
+
+def test_reinstala_se_binario_do_manifesto_sumiu(tmp_path, chromedriver_falso):
+    cache = str(tmp_path / "cache")
+    resolver_chromedriver(diretorio_cache=cache, instalar=lambda: str(tmp_path / "sumiu"))
+
+    caminho = resolver_chromedriver(diretorio_cache=cache, instalar=lambda: chromedriver_falso)
+
+    assert caminho == chromedriver_falso
+
+
+def test_caminho_fixo_nao_consulta_manifesto(tmp_path, chromedriver_falso, monkeypatch):
+    monkeypatch.setenv("CHROMEDRIVER_PATH", chromedriver_falso)
+
+    caminho = resolver_chromedriver(diretorio_cache=str(tmp_path), instalar=lambda: pytest.fail("não deveria instalar"))
+
+    assert caminho == chromedriver_falso
+    assert ler_manifesto(str(tmp_path)) == {}
+
+
+def test_caminho_fixo_inexistente_da_erro(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        resolver_chromedriver(caminho_fixo=str(tmp_path / "nao_existe"))
+
+
+def test_cada_navegador_tem_sua_entrada_no_manifesto(tmp_path, chromedriver_falso, monkeypatch):
+    geckodriver = tmp_path / "geckodriver"
+    geckodriver.write_text("outro binário de mentira")
+    monkeypatch.setattr(driver_binary, "versao_do_navegador", lambda navegador: {"firefox": "128.0"}.get(navegador, "120.0.1"))
+    cache = str(tmp_path / "cache")
+
+    resolver_driver("chrome", diretorio_cache=cache, instalar=lambda: chromedriver_falso)
+    resolver_driver("firefox", diretorio_cache=cache, instalar=lambda: str(geckodriver))
+
+    assert ler_manifesto(cache) == {"chrome-120.0.1": chromedriver_falso, "firefox-128.0": str(geckodriver)}
+    assert resolver_driver("firefox", diretorio_cache=cache, instalar=lambda: pytest.fail("já está no manifesto")) == str(geckodriver)
+
+
+def test_navegador_sem_driver_conhecido(tmp_path):
+    with pytest.raises(ValueError):
+        resolver_driver("safari", diretorio_cache=str(tmp_path))
@@ -0,0 +1,71 @@
+import pytest
+
+from utils.driver_factory import ConfiguracaoNavegador, interpretar_navegadores, montar_opcoes
+
+
+def test_interpretar_navegadores():
+    assert interpretar_navegadores("chrome") == ["chrome"]
+    assert interpretar_navegadores(" Chrome, firefox,chrome ") == ["chrome", "firefox"]
+    with pytest.raises(ValueError):
+        interpretar_navegadores("chrome,safari")
+    with pytest.raises(ValueError):
+        interpretar_navegadores("")
+
+
+def test_chrome_e_edge_usam_as_mesmas_opcoes():
+    for navegador in ("chrome", "edge"):
+        opcoes, ignorados = montar_opcoes(
+            ConfiguracaoNavegador(navegador, headless=True, argumentos=["--no-sandbox"], sem_deteccao=True)
+        )
+
+        assert opcoes.arguments == [
+            "--start-maximized",
+            "--headless=new",
+            "--disable-blink-features=AutomationControlled",
+            "--no-sandbox",
+        ]
+        assert opcoes.experimental_options["excludeSwitches"] == ["enable-automation"]
+        assert ignorados == []
+
+
+def test_firefox_performance_com_bloqueio():
+    configuracao = ConfiguracaoNavegador(
+        "firefox", perfil="performance", estrategia="none", bloqueio=["imagens", "analytics"]
+    )
+
+    opcoes, ignorados = montar_opcoes(configuracao)
+
+    assert opcoes.arguments == ["-headless", "--width=1366", "--height=768"]
+    assert opcoes.page_load_strategy == "none"
+    assert opcoes.preferences["permissions.default.image"] == 2
+    assert ignorados == ["analytics"]
+
+
+def test_firefox_headless_no_perfil_padrao():
+    opcoes, _ = montar_opcoes(ConfiguracaoNavegador("firefox", headless=True))
+
+    assert opcoes.arguments == ["-headless"]
+    assert opcoes.page_load_strategy == "normal"
+
+
+def test_chave_separa_configuracoes_diferentes():
+    chrome = ConfiguracaoNavegador("chrome", headless=True)
+
+    assert chrome.chave() == "chrome-padrao-headless"
+    assert ConfiguracaoNavegador("chrome", headless=True).chave() == chrome.chave()
+    assert ConfiguracaoNavegador("firefox", headless=True).chave() != chrome.chave()
+    assert ConfiguracaoNavegador("chrome", headless=True, bloqueio=["imagens"]).chave() != chrome.chave()
+
+
+def test_canal_de_eventos_liga_o_bidi():
+    for navegador in ("chrome", "firefox"):
+        opcoes, _ = montar_opcoes(ConfiguracaoNavegador(navegador, eventos=100))
+
+        assert opcoes.to_capabilities()["webSocketUrl"] is True
+    assert "webSocketUrl" not in montar_opcoes(ConfiguracaoNavegador("chrome"))[0].to_capabilities()
+    assert ConfiguracaoNavegador("chrome", eventos=100).chave() == "chrome-padrao-eventos"
+
+
+def test_navegador_desconhecido():
+    with pytest.raises(ValueError):
+        montar_opcoes(ConfiguracaoNavegador("safari"))
@@ -0,0 +1,72 @@
+import pytest
+
+from utils.duration_history import HistoricoDuracoes, mini_grafico
+
+
+def _registro(call, resultado="passed", marcadores=()):
+    return {"setup": 0.5, "call": call, "teardown": 0.1, "resultado": resultado, "marcadores": list(marcadores)}
+
+
+@pytest.fixture
+def historico(tmp_path):
+    return HistoricoDuracoes(str(tmp_path / "historico.sqlite"), janela=3, manter=5)
+
+
+def test_mediana_das_ultimas_execucoes_que_passaram(historico):
+    for call in (1.0, 9.0, 2.0, 3.0):
+        historico.gravar({"test_a": _registro(call)}, "chrome")
+    historico.gravar({"test_a": _registro(50.0, resultado="failed")}, "chrome")
+
+    assert historico.medianas("chrome") == {"test_a": pytest.approx(3.6)}  # mediana de 9.6, 2.6, 3.6
+    assert historico.medianas("firefox") == {}
+
+
+def test_regressao_acima_do_limite(historico):
+    for _ in range(3):
+        historico.gravar({"test_a": _registro(2.0), "test_b": _registro(2.0), "test_rapido": _registro(0.0)}, "chrome")
+
+    atual = {
+        "test_a": _registro(5.0, marcadores=("critical_path",)),
+        "test_b": _registro(2.5),
+        "test_rapido": _registro(0.3),
+    }
+    regressoes = historico.regressoes(atual, "chrome", limite_pct=50, minimo_segundos=1.0)
+
+    assert [(nodeid, marcadores) for nodeid, _, _, _, marcadores in regressoes] == [("test_a", ["critical_path"])]
+    assert regressoes[0][3] == pytest.approx(100 * (5.6 - 2.6) / 2.6)
+
+
+def test_historico_antigo_e_apagado(historico):
+    for call in range(8):
+        historico.gravar({"test_a": _registro(float(call))}, "chrome")
+
+    _, _, totais, _ = historico.tendencia("chrome")[0]
+    assert len(historico._ultimas("chrome", 100)["test_a"][0]) == 5
+    assert totais == [pytest.approx(5.6), pytest.approx(6.6), pytest.approx(7.6)]
+
+
+def test_tempo_por_marcador(historico):
+    historico.gravar({
+        "test_a": _registro(1.4, marcadores=("smoke",)),
+        "test_b": _registro(2.4, marcadores=("smoke", "critical_path")),
+    }, "chrome")
+
+    assert historico.tempo_por_marcador("chrome") == {"smoke": pytest.approx(5.0), "critical_path": pytest.approx(3.0)}
+
+
+def test_mini_grafico():
+    assert mini_grafico([1, 2, 8]) == "▁▂█"
+    assert mini_grafico([3, 3]) == "▁▁"
+
+
+def test_cada_registro_usa_o_historico_do_proprio_navegador(historico):
+    for _ in range(3):
+        historico.gravar(
+            {"test_a[chrome]": _registro(2.0), "test_a[firefox]": dict(_registro(6.0), navegador="firefox")},
+            "chrome",
+        )
+
+    assert historico.medianas("firefox") == {"test_a[firefox]": pytest.approx(6.6)}
+
+    atual = {"test_a[chrome]": _registro(2.2), "test_a[firefox]": dict(_registro(7.0), navegador="firefox")}
+    assert historico.regressoes(atual, "chrome", limite_pct=50) == []
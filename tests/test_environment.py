@@ -0,0 +1,50 @@
+import json
+
+import pytest
+from utils.environment import carregar_ambiente
+
+
+def test_sem_nome_usa_ambiente_padrao_do_arquivo():
+    ambiente = carregar_ambiente()
+
+    assert ambiente.nome == "producao"
+    assert ambiente.base_url == "https://the-internet.herokuapp.com"
+
+
+def test_ambiente_local_aponta_para_copia_local():
+    ambiente = carregar_ambiente("local")
+
+    assert ambiente.base_url == "local"
+    assert ambiente.headless
+    assert ambiente.timeout < carregar_ambiente("producao").timeout
+
+
+def test_valores_omitidos_usam_padroes(tmp_path):
+    arquivo = tmp_path / "ambientes.json"
+    arquivo.write_text(json.dumps({"ambientes": {"espelho": {"base_url": "http://espelho:8080"}}}))
+
+    ambiente = carregar_ambiente("espelho", str(arquivo))
+
+    assert ambiente.resumo() == {
+        "ambiente": "espelho",
+        "base_url": "http://espelho:8080",
+        "timeout": 15,
+        "timeout_curto": 5,
+        "headless": False,
+    }
+    assert ambiente.argumentos_navegador == []
+
+
+def test_ambiente_inexistente_da_erro_com_opcoes():
+    with pytest.raises(ValueError, match="ci, local, producao"):
+        carregar_ambiente("marte")
+
+
+def test_grid_do_ambiente(tmp_path):
+    arquivo = tmp_path / "ambientes.json"
+    arquivo.write_text(json.dumps({"ambientes": {
+        "grid": {"base_url": "https://the-internet.herokuapp.com", "grid_url": "http://localhost:4444"},
+    }}))
+
+    assert carregar_ambiente("grid", str(arquivo)).grid_url == "http://localhost:4444"
+    assert carregar_ambiente("producao").grid_url is None
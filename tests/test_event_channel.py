@@ -0,0 +1,171 @@
+import json
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from pages.base_page import BasePage
+from utils.artifacts import GravadorArtefatos
+from utils.event_channel import EVENTOS_BIDI, CanalEventos, conectar_canal
+from utils.logger import encerrar_teste, formatar_linhas, iniciar_teste
+
+
+class ConexaoFalsa:
+    """O lado "navegador" do canal: guarda os callbacks e dispara eventos quando mandam"""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.comandos = []
+
+    def add_callback(self, evento, callback):
+        self.callbacks[evento.event_class] = callback
+        return len(self.callbacks)
+
+    def remove_callback(self, evento, id_callback):
+        self.callbacks.pop(evento.event_class, None)
+
+    def execute(self, comando):
+        pedido = next(comando)
+        self.comandos.append((pedido["method"], pedido["params"]))
+        try:
+            comando.send({})
+        except StopIteration as fim:
+            return fim.value
+
+    def disparar(self, tipo, parametros, depois=0):
+        def _disparar():
+            time.sleep(depois)
+            self.callbacks[tipo](parametros)
+
+        if not depois:
+            return _disparar()
+        threading.Thread(target=_disparar, daemon=True).start()
+
+
+def requisicao(id_requisicao, url="http://site/api"):
+    return {"request": {"request": id_requisicao, "method": "GET", "url": url}}
+
+
+def test_assina_os_eventos_e_guarda_so_os_ultimos():
+    conexao = ConexaoFalsa()
+    canal = CanalEventos(conexao, capacidade=3).assinar()
+
+    assinados = [tipo for tipos in EVENTOS_BIDI.values() for tipo in tipos]
+    assert conexao.comandos == [("session.subscribe", {"events": assinados})]
+    for numero in range(5):
+        conexao.disparar("log.entryAdded", {"level": "error", "type": "console", "text": f"erro {numero}", "extra": "x"})
+
+    eventos = canal.eventos()
+    assert [evento["texto"] for evento in eventos] == ["erro 2", "erro 3", "erro 4"]
+    assert eventos[0]["tipo"] == "log.entryAdded" and "extra" not in eventos[0]
+    assert canal.eventos(ultimos=1)[0]["seq"] == 5
+    assert canal.estatisticas() == {"eventos_recebidos": 5, "eventos_descartados": 2}
+
+    canal.encerrar()
+    assert conexao.callbacks == {}
+
+
+def test_espera_acorda_com_o_evento_sem_perguntar_de_novo():
+    conexao = ConexaoFalsa()
+    canal = CanalEventos(conexao).assinar()
+    conexao.disparar("browsingContext.load", {"context": "janela-1", "url": "http://site/antiga"})
+    marca = canal.marcar()
+
+    conexao.disparar("browsingContext.load", {"context": "iframe-1", "url": "http://site/anuncio"}, depois=0.05)
+    conexao.disparar("browsingContext.load", {"context": "janela-1", "url": "http://site/nova"}, depois=0.1)
+    inicio = time.perf_counter()
+    evento = canal.aguardar(
+        ("browsingContext.load",), desde=marca, timeout=5,
+        condicao=lambda evento: evento.dados["contexto"] == "janela-1",
+    )
+
+    assert evento.dados["url"] == "http://site/nova"
+    assert time.perf_counter() - inicio < 1
+    assert canal.aguardar(("browsingContext.load",), desde=canal.marcar(), timeout=0.05) is None
+
+
+def test_rede_ociosa_espera_as_requisicoes_pendentes():
+    conexao = ConexaoFalsa()
+    canal = CanalEventos(conexao).assinar()
+    conexao.disparar("network.beforeRequestSent", requisicao("r1"))
+    assert canal.pendentes() == ["http://site/api"]
+
+    conexao.disparar("network.responseCompleted", {**requisicao("r1"), "response": {"status": 200}}, depois=0.1)
+    inicio = time.perf_counter()
+
+    assert canal.aguardar_rede_ociosa(janela_ms=50, timeout=5)
+    assert 0.15 <= time.perf_counter() - inicio < 1
+    assert canal.pendentes() == []
+    assert canal.eventos(tipos=("network.responseCompleted",))[0]["status"] == 200
+
+    conexao.disparar("network.beforeRequestSent", requisicao("r2"))
+    assert not canal.aguardar_rede_ociosa(janela_ms=50, timeout=0.1)
+
+
+class DriverComCanal:
+
+    capabilities = {"webSocketUrl": "ws://127.0.0.1:9222/session/s1", "pageLoadStrategy": "normal"}
+    current_window_handle = "janela-1"
+
+    def __init__(self):
+        self._websocket_connection = ConexaoFalsa()
+        self.scripts = []
+
+    def execute_script(self, script, *argumentos):
+        self.scripts.append(script)
+
+
+def test_conectar_canal_usa_a_conexao_bidi_do_selenium():
+    driver = DriverComCanal()
+
+    canal = conectar_canal(driver, capacidade=10)
+
+    assert driver.canal_eventos is canal
+    assert canal.conexao is driver._websocket_connection
+    assert conectar_canal(type("SemBidi", (), {"capabilities": {}})()) is None
+
+
+def test_canal_recusado_avisa_o_motivo():
+    driver = DriverComCanal()
+
+    def _recusar(comando):
+        raise WebDriverException("unknown command: session.subscribe")
+
+    driver._websocket_connection.execute = _recusar
+    iniciar_teste("tests/test_event_channel.py::recusado")
+    try:
+        assert conectar_canal(driver) is None
+    finally:
+        contexto = encerrar_teste()
+
+    assert not hasattr(driver, "canal_eventos") and driver._websocket_connection.callbacks == {}
+    assert "AVISO" in formatar_linhas(contexto) and "unknown command: session.subscribe" in formatar_linhas(contexto)
+
+
+def test_esperar_navegacao_pelo_canal_de_eventos():
+    driver = DriverComCanal()
+    conectar_canal(driver)
+    pagina = BasePage(driver)
+
+    with pagina.esperar_navegacao(timeout=5):
+        driver._websocket_connection.disparar(
+            "browsingContext.load", {"context": "janela-1", "url": "http://site/secure"}, depois=0.05
+        )
+
+    assert driver.scripts == []  # Nenhum script de marcação ou de espera
+
+
+def test_falha_grava_os_ultimos_eventos(tmp_path):
+    driver = DriverComCanal()
+    canal = conectar_canal(driver)
+    for numero in range(5):
+        driver._websocket_connection.disparar("network.fetchError", {**requisicao(f"r{numero}"), "errorText": "net::ERR"})
+    gravador = GravadorArtefatos(str(tmp_path), tipos=("eventos",), max_eventos=2)
+
+    caminhos = gravador.capturar_falha(driver, "test_login")
+    gravador.encerrar()
+
+    linhas = [json.loads(linha) for linha in open(caminhos["eventos"], encoding="utf-8")]
+    assert [linha["id"] for linha in linhas] == ["r3", "r4"]
+    assert linhas[0]["erro"] == "net::ERR"
+    assert len(canal.eventos()) == 5
@@ -0,0 +1,157 @@
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils import impact
+from utils.impact import Analise, analisar_mudancas, conferir_mapa, locators_alterados, selecionar
+
+RAIZ = str(__import__("pathlib").Path(__file__).resolve().parents[1])
+
+PAGINA = '''from selenium.webdriver.common.by import By
+
+
+class PaginaExemplo:
+    CAMPO = (By.ID, "campo")
+    BOTAO = (
+        By.CSS_SELECTOR,
+        "button",
+    )
+
+    def clicar(self):
+        return self.BOTAO
+'''
+
+PAGINA_COM_LOGICA = '''from selenium.webdriver.common.by import By
+
+
+class PaginaExemplo:
+    CAMPO = (By.ID, "campo")
+    RESULTADOS_SUCESSO = ("mensagem_sucesso", "area_segura")
+    ESTADO_LOCATORS = (CAMPO,)
+'''
+
+
+class DriverFalso:
+
+    def find_element(self, by, valor):
+        return SimpleNamespace(text="", click=lambda: None)
+
+
+@pytest.fixture(autouse=True)
+def sem_registro_do_conftest():
+    """O conftest registra o teste atual; aqui cada teste controla o próprio registro"""
+    impact.encerrar_registro(RAIZ)
+    yield
+    impact.iniciar_registro()
+
+
+def test_registra_paginas_e_locators_usados():
+    impact.iniciar_registro()
+    pagina = LoginPage(DriverFalso())
+    pagina.obter_texto(LoginPage.CAMPO_USERNAME)
+    pagina.obter_texto((By.ID, "sem-nome"))
+
+    usado = impact.encerrar_registro(RAIZ)
+
+    assert usado == {
+        "arquivos": ["pages/base_page.py", "pages/login_page.py"],
+        "locators": ["pages/login_page.py::CAMPO_USERNAME"],
+    }
+
+
+def test_sem_registro_ativo_nada_e_anotado():
+    BasePage(DriverFalso())
+    assert impact.encerrar_registro(RAIZ) == {"arquivos": [], "locators": []}
+
+
+def test_mudanca_so_em_locators(tmp_path):
+    caminho = tmp_path / "pagina.py"
+    caminho.write_text(PAGINA, encoding="utf-8")
+
+    assert locators_alterados(str(caminho), {5, 8}, "pages/pagina.py") == {
+        "pages/pagina.py::CAMPO", "pages/pagina.py::BOTAO",
+    }
+    assert locators_alterados(str(caminho), {5, 12}, "pages/pagina.py") is None
+    assert locators_alterados(str(caminho), None, "pages/pagina.py") is None
+
+
+def test_tupla_que_nao_e_locator_conta_como_a_pagina_toda(tmp_path):
+    caminho = tmp_path / "pagina.py"
+    caminho.write_text(PAGINA_COM_LOGICA, encoding="utf-8")
+
+    assert locators_alterados(str(caminho), {5}, "pages/pagina.py") == {"pages/pagina.py::CAMPO"}
+    assert locators_alterados(str(caminho), {6}, "pages/pagina.py") is None
+    assert locators_alterados(str(caminho), {5, 7}, "pages/pagina.py") is None
+
+
+def test_selecionar_afetados():
+    mapa = {
+        "tests/test_login.py::test_a": {"arquivos": ["pages/login_page.py"], "locators": ["pages/login_page.py::CAMPO"]},
+        "tests/test_google.py::test_b": {"arquivos": [], "locators": []},
+        "tests/test_home.py::test_c": {"arquivos": ["pages/home_page.py"], "locators": []},
+    }
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in [*mapa, "tests/test_novo.py::test_d"]]
+
+    afetados, nao_afetados = selecionar(items, mapa, Analise(set(), set(), {"pages/login_page.py::CAMPO"}, None))
+
+    assert [item.nodeid for item in afetados] == ["tests/test_login.py::test_a", "tests/test_novo.py::test_d"]
+    assert len(nao_afetados) == 2
+
+
+def test_pagina_que_o_mapa_nao_conhece_roda_tudo():
+    mapa = {"tests/test_login.py::test_a": {"arquivos": ["pages/base_page.py", "pages/login_page.py"], "locators": []}}
+    items = [SimpleNamespace(nodeid="tests/test_login.py::test_a")]
+
+    for analise in (
+        Analise(set(), {"pages/scripts.py"}, set(), None),
+        Analise(set(), set(), {"pages/componente.py::CAMPO"}, None),
+    ):
+        assert conferir_mapa(analise, mapa).motivo_completo
+        assert selecionar(items, mapa, analise) == (items, [])
+    assert conferir_mapa(Analise(set(), {"pages/login_page.py"}, set(), None), mapa).motivo_completo is None
+
+
+@pytest.fixture
+def repositorio(tmp_path):
+    def git(*argumentos):
+        subprocess.run(["git", *argumentos], cwd=tmp_path, check=True, capture_output=True)
+
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "pages" / "pagina.py").write_text(PAGINA, encoding="utf-8")
+    (tmp_path / "tests" / "test_pagina.py").write_text("def test_x():\n    pass\n", encoding="utf-8")
+    git("init", "-q")
+    git("add", ".")
+    git("-c", "user.name=teste", "-c", "user.email=teste@exemplo.com", "commit", "-qm", "inicial")
+    return tmp_path
+
+
+def test_analisar_mudancas_de_locator_e_teste(repositorio):
+    pagina = repositorio / "pages" / "pagina.py"
+    pagina.write_text(PAGINA.replace('"campo"', '"campo-novo"'), encoding="utf-8")
+    (repositorio / "tests" / "test_pagina.py").write_text("def test_x():\n    assert True\n", encoding="utf-8")
+    (repositorio / "README.md").write_text("docs", encoding="utf-8")
+
+    analise = analisar_mudancas("HEAD", str(repositorio))
+
+    assert analise == Analise({"tests/test_pagina.py"}, set(), {"pages/pagina.py::CAMPO"}, None)
+
+
+def test_mudanca_fora_de_paginas_e_testes_roda_tudo(repositorio):
+    (repositorio / "conftest.py").write_text("", encoding="utf-8")
+
+    assert analisar_mudancas("HEAD", str(repositorio)).motivo_completo == "conftest.py alterado"
+
+
+def test_sem_git_roda_tudo(tmp_path):
+    assert analisar_mudancas("HEAD", str(tmp_path)).motivo_completo
+
+
+def test_modulo_de_pages_sem_classe_roda_tudo(repositorio):
+    (repositorio / "pages" / "scripts.py").write_text('ESPERAR = "return true;"\n', encoding="utf-8")
+
+    assert analisar_mudancas("HEAD", str(repositorio)).motivo_completo == "pages/scripts.py alterado"
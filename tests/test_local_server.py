@@ -0,0 +1,87 @@
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.cookiejar import CookieJar
+
+import pytest
+from utils.local_server import ServidorLocal
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    servidor = ServidorLocal().iniciar()
+    yield servidor
+    servidor.parar()
+
+
+@pytest.fixture
+def cliente():
+    """Cliente HTTP com cookies, como um navegador simplificado"""
+    return urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+
+
+def _login(cliente, servidor, usuario, senha):
+    dados = urllib.parse.urlencode({"username": usuario, "password": senha}).encode()
+    return cliente.open(f"{servidor.url}/authenticate", data=dados)
+
+
+def test_home_tem_link_para_login(servidor, cliente):
+    pagina = cliente.open(f"{servidor.url}/").read().decode()
+
+    assert '<a href="/login">Form Authentication</a>' in pagina
+
+
+def test_login_valido_vai_para_area_segura(servidor, cliente):
+    resposta = _login(cliente, servidor, "tomsmith", "SuperSecretPassword!")
+    pagina = resposta.read().decode()
+
+    assert resposta.url == f"{servidor.url}/secure"
+    assert 'class="flash success"' in pagina
+    assert "You logged into a secure area!" in pagina
+    assert "Secure Area" in pagina
+
+
+@pytest.mark.parametrize("usuario,senha,mensagem", [
+    ("admin", "SuperSecretPassword!", "Your username is invalid!"),
+    ("tomsmith", "errada", "Your password is invalid!"),
+    ("", "", "Your username is invalid!"),
+])
+def test_login_invalido_volta_com_erro(servidor, cliente, usuario, senha, mensagem):
+    resposta = _login(cliente, servidor, usuario, senha)
+    pagina = resposta.read().decode()
+
+    assert resposta.url == f"{servidor.url}/login"
+    assert 'class="flash error"' in pagina
+    assert mensagem in pagina
+
+
+def test_flash_aparece_uma_vez_so(servidor, cliente):
+    _login(cliente, servidor, "admin", "x").read()
+
+    pagina = cliente.open(f"{servidor.url}/login").read().decode()
+
+    assert "flash" not in pagina.split('id="content"')[0].split('id="flash-messages"')[1]
+
+
+def test_area_segura_exige_login(servidor, cliente):
+    resposta = cliente.open(f"{servidor.url}/secure")
+
+    assert resposta.url == f"{servidor.url}/login"
+    assert "You must login to view the secure area!" in resposta.read().decode()
+
+
+def test_logout_encerra_sessao(servidor, cliente):
+    _login(cliente, servidor, "tomsmith", "SuperSecretPassword!").read()
+
+    pagina = cliente.open(f"{servidor.url}/logout").read().decode()
+    resposta = cliente.open(f"{servidor.url}/secure")
+
+    assert "You logged out of the secure area!" in pagina
+    assert resposta.url == f"{servidor.url}/login"
+
+
+def test_rota_desconhecida_da_404(servidor, cliente):
+    with pytest.raises(urllib.error.HTTPError) as erro:
+        cliente.open(f"{servidor.url}/nao-existe")
+
+    assert erro.value.code == 404
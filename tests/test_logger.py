@@ -0,0 +1,111 @@
+import json
+import time
+
+import pytest
+
+from utils import logger
+from utils.logger import (
+    anotar_contexto,
+    arquivo_do_worker,
+    configurar,
+    encerrar_teste,
+    formatar_linhas,
+    iniciar_teste,
+    obter_logger,
+)
+
+log = obter_logger("tests.paginas")
+
+
+class Contador:
+    """Conta quantas vezes virou texto"""
+
+    def __init__(self):
+        self.vezes = 0
+
+    def __str__(self):
+        self.vezes += 1
+        return "locator"
+
+
+@pytest.fixture(autouse=True)
+def log_isolado(monkeypatch):
+    """O conftest já configurou o log (e talvez um --log-jsonl): aqui cada teste tem o seu"""
+    for nome in ("nivel_console", "nivel_saida", "capacidade", "worker"):
+        monkeypatch.setattr(logger._configuracao, nome, getattr(logger._configuracao, nome))
+    monkeypatch.setattr(logger._configuracao, "arquivo", None)
+    yield
+    logger.encerrar()
+
+
+def test_silencioso_guarda_as_linhas_cruas_no_buffer(capsys):
+    configurar(capacidade=3)
+    contexto = iniciar_teste("tests/test_x.py::test_a")
+    locator = Contador()
+    for numero in range(5):
+        log.debug("🖱️ Clicou em: %s (%s)", locator, numero)
+    encerrar_teste()
+
+    assert capsys.readouterr().out == ""
+    assert locator.vezes == 0  # Ninguém leu: nada foi formatado
+    texto = formatar_linhas(contexto)
+    assert texto.count("\n") == 2 and texto.endswith("DEBUG  tests.paginas: 🖱️ Clicou em: locator (4)")
+    assert locator.vezes == 3
+
+
+def test_nivel_do_console(capsys):
+    configurar(nivel_console="aviso")
+
+    log.info("🔐 Fazendo login")
+    log.aviso("⚠️ Página pode não ter carregado em %ss", 15)
+    log.erro("❌ Elemento não encontrado: %s", ("id", "x"))
+
+    assert capsys.readouterr().out == "⚠️ Página pode não ter carregado em 15s\n❌ Elemento não encontrado: ('id', 'x')\n"
+    with pytest.raises(ValueError):
+        configurar(nivel_console="barulhento")
+
+
+def test_json_lines_com_o_contexto_do_teste(tmp_path, capsys):
+    caminho = arquivo_do_worker(str(tmp_path / "log.jsonl"), "gw1")
+    configurar(arquivo_jsonl=caminho, worker="gw1")
+    iniciar_teste("tests/test_x.py::test_b")
+    anotar_contexto(navegador="firefox")
+    log.debug("⌨️ Digitou em: %s", "campo", locator="#username")
+    encerrar_teste()
+    log.info("fora de teste")
+    logger.encerrar()
+
+    linhas = [json.loads(linha) for linha in open(caminho, encoding="utf-8")]
+    assert caminho.endswith("log.gw1.jsonl")
+    assert capsys.readouterr().out == ""
+    assert linhas[0] == {
+        "instante": linhas[0]["instante"],
+        "nivel": "debug",
+        "logger": "tests.paginas",
+        "mensagem": "⌨️ Digitou em: campo",
+        "worker": "gw1",
+        "nodeid": "tests/test_x.py::test_b",
+        "navegador": "firefox",
+        "locator": "#username",
+    }
+    assert linhas[1]["nodeid"] is None
+
+
+def test_emitir_no_modo_silencioso_custa_quase_nada():
+    configurar()
+    encerrar_teste()
+
+    inicio = time.perf_counter()
+    for _ in range(100_000):
+        log.debug("🖱️ Clicou em: %s", "botao")
+    fora_de_teste = time.perf_counter() - inicio
+
+    iniciar_teste("tests/test_x.py::test_c")
+    inicio = time.perf_counter()
+    for _ in range(100_000):
+        log.debug("🖱️ Clicou em: %s", "botao")
+    dentro_de_teste = time.perf_counter() - inicio
+    contexto = encerrar_teste()
+
+    assert fora_de_teste < 0.5 and dentro_de_teste < 1.0
+    assert len(contexto.linhas) == logger._configuracao.capacidade
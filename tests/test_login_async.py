@@ -0,0 +1,56 @@
+"""
+Login com a API assíncrona (AsyncLoginPage)
+
+Cada teste é um fluxo independente: com --async-sessions=N, até N
+deles rodam juntos no mesmo processo (um navegador para cada).
+
+USO:
+    pytest tests/test_login_async.py --async-sessions=20 --browser-profile=performance --base-url=local
+"""
+
+import pytest
+
+from pages.async_login_page import AsyncLoginPage
+
+CREDENCIAIS_INVALIDAS = [
+    ("usuario_errado", "senha_errada", "Your username is invalid!"),
+    ("tomsmith", "senha_errada", "Your password is invalid!"),
+    ("", "", "Your username is invalid!"),
+    ("TOMSMITH", "SuperSecretPassword!", "Your username is invalid!"),
+]
+
+
+@pytest.mark.ui
+@pytest.mark.smoke
+async def test_login_valido(sessao_assincrona):
+    login = AsyncLoginPage(sessao_assincrona)
+    await login.navegar_para_login()
+
+    await login.login_valido()
+
+    assert await login.login_foi_bem_sucedido()
+    assert await login.botao_logout_esta_visivel()
+
+
+@pytest.mark.ui
+@pytest.mark.parametrize("username,password,mensagem", CREDENCIAIS_INVALIDAS)
+async def test_login_invalido(sessao_assincrona, username, password, mensagem):
+    login = AsyncLoginPage(sessao_assincrona)
+    await login.navegar_para_login()
+
+    await login.fazer_login(username, password)
+
+    assert await login.login_falhou()
+    assert mensagem in await login.obter_mensagem_erro()
+
+
+@pytest.mark.ui
+async def test_logout_volta_para_o_login(sessao_assincrona):
+    login = AsyncLoginPage(sessao_assincrona)
+    await login.navegar_para_login()
+    await login.login_valido()
+
+    await login.fazer_logout()
+
+    assert login.LOGIN_PATH in await login.obter_url_atual()
+    assert await login.esta_na_pagina_login()
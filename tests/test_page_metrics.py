@@ -0,0 +1,100 @@
+import pytest
+
+from pages.base_page import BasePage
+from utils import page_metrics
+from utils.page_metrics import (
+    OrcamentoExcedido,
+    encerrar_coleta,
+    exportar_serie,
+    iniciar_coleta,
+    ler_serie,
+    resumir_por_pagina,
+    verificar_orcamentos,
+)
+
+METRICAS = {
+    "url": "http://site/login",
+    "ttfb_ms": 80,
+    "dom_pronto_ms": 400,
+    "carregamento_ms": 1200,
+    "primeira_pintura_ms": 300,
+    "fcp_ms": 300,
+    "lcp_ms": None,
+    "requisicoes": 12,
+    "bytes_transferidos": 300 * 1024,
+}
+
+
+class PaginaComOrcamento(BasePage):
+    LOAD_BUDGET_MS = 1000
+    LCP_BUDGET_MS = 500  # O navegador não mediu LCP: não estoura
+    TRANSFER_BUDGET_KB = 500
+
+
+class DriverFalso:
+
+    def __init__(self):
+        self.scripts = 0
+
+    def execute_script(self, script, *argumentos):
+        self.scripts += 1
+        return dict(METRICAS)
+
+
+@pytest.fixture(autouse=True)
+def sem_coleta_do_conftest(monkeypatch):
+    """O conftest coleta as navegações deste próprio teste; aqui começamos do zero"""
+    monkeypatch.setattr(page_metrics, "_coleta_atual", None)
+    monkeypatch.setattr(BasePage, "COLETAR_METRICAS", False)
+    monkeypatch.setattr(BasePage, "MODO_ORCAMENTO", "warn")
+
+
+def test_orcamentos_declarados_na_pagina():
+    assert verificar_orcamentos(PaginaComOrcamento, METRICAS) == [
+        ("LOAD_BUDGET_MS", "carregamento_ms", 1200, 1000),
+    ]
+    assert verificar_orcamentos(BasePage, METRICAS) == []
+
+
+def test_orcamento_estourado_avisa_ou_falha():
+    driver = DriverFalso()
+    coleta = iniciar_coleta()
+    try:
+        assert PaginaComOrcamento(driver).medir_navegacao(verificar_orcamento=True)["carregamento_ms"] == 1200
+        BasePage.MODO_ORCAMENTO = "fail"
+        with pytest.raises(OrcamentoExcedido, match="carregamento_ms 1200 > 1000"):
+            PaginaComOrcamento(driver).medir_navegacao(verificar_orcamento=True)
+    finally:
+        encerrar_coleta()
+
+    assert [registro["orcamento_excedido"] for registro in coleta] == [["LOAD_BUDGET_MS"], ["LOAD_BUDGET_MS"]]
+    assert coleta[0]["pagina"] == "PaginaComOrcamento" and coleta[0]["url"] == "http://site/login"
+
+
+def test_sem_coleta_nem_orcamento_nada_e_medido():
+    driver = DriverFalso()
+
+    assert BasePage(driver).medir_navegacao(verificar_orcamento=True) is None
+    BasePage.MODO_ORCAMENTO = "off"
+    assert PaginaComOrcamento(driver).medir_navegacao(verificar_orcamento=True) is None
+    assert driver.scripts == 0
+
+
+def test_serie_temporal_cresce_a_cada_execucao(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "metricas.jsonl")
+    monkeypatch.setenv("BUILD_ID", "build-41")
+    registros = [
+        {"nodeid": "t::a", "pagina": "LoginPage", **METRICAS, "orcamento_excedido": []},
+        {"nodeid": "t::b", "pagina": "LoginPage", **METRICAS, "carregamento_ms": 1800, "orcamento_excedido": ["LOAD_BUDGET_MS"]},
+    ]
+
+    exportar_serie(registros, caminho, ambiente="ci")
+    monkeypatch.setenv("BUILD_ID", "build-42")
+    exportar_serie(registros[:1], caminho, ambiente="ci")
+
+    serie = ler_serie(caminho)
+    assert [linha["build"] for linha in serie] == ["build-41", "build-41", "build-42"]
+    assert serie[0]["ambiente"] == "ci" and serie[0]["nodeid"] == "t::a"
+    resumo = resumir_por_pagina(registros)["LoginPage"]
+    assert resumo["navegacoes"] == 2 and resumo["estouros"] == 1
+    assert resumo["carregamento_ms"] == 1500 and resumo["lcp_ms"] is None
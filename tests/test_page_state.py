@@ -0,0 +1,106 @@
+import pytest
+
+from pages import scripts
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+
+ERRO = {"texto": "Your username is invalid!\n×", "classes": ["flash", "error"], "visivel": True}
+
+
+def foto(url="http://site/login", erro=True):
+    """Resposta do script de foto para a LoginPage (na ordem de ESTADO_LOCATORS)"""
+    logout = [] if erro else [{"texto": "Logout", "classes": ["button"], "visivel": True}]
+    return {
+        "url": url,
+        "titulo": "The Internet",
+        "elementos": [[ERRO] if erro else [], [], [], [{"texto": "Login Page", "classes": [], "visivel": True}], logout],
+        "mensagens": [ERRO] if erro else [],
+    }
+
+
+class ElementoFalso:
+
+    def click(self):
+        pass
+
+    def clear(self):
+        pass
+
+    def send_keys(self, texto):
+        pass
+
+
+class DriverFalso:
+    """Conta as idas ao "navegador" (scripts e buscas de elemento)"""
+
+    def __init__(self, corrida=3):
+        self.corrida = corrida  # Índice da condição que vence (3 = mensagem_erro)
+        self.scripts = []
+        self.buscas = 0
+
+    def execute_script(self, script, *argumentos):
+        self.scripts.append(script)
+        if script == scripts.CORRIDA_COM_ESTADO:
+            return [self.corrida, foto(erro=self.corrida == 3)]
+        if script == scripts.ESTADO_PAGINA:
+            assert argumentos[0][0] == list(LoginPage.MENSAGEM_ERRO)
+            return foto()
+        raise AssertionError("script inesperado")
+
+    def find_element(self, by, valor):
+        self.buscas += 1
+        return ElementoFalso()
+
+
+def test_login_falhou_e_mensagem_numa_ida_ao_navegador():
+    driver = DriverFalso()
+    pagina = LoginPage(driver)
+
+    assert pagina.login_falhou()
+    assert "Your username is invalid!" in pagina.obter_mensagem_erro()
+    assert pagina.obter_mensagem_erro() == ERRO["texto"]
+
+    assert driver.scripts == [scripts.CORRIDA_COM_ESTADO]
+    assert driver.buscas == 0
+    assert pagina.estatisticas_estado() == {"acertos": 2, "capturas": 1}
+
+
+def test_login_com_sucesso_nao_espera_pela_mensagem_de_erro():
+    driver = DriverFalso(corrida=2)  # url_segura
+    pagina = LoginPage(driver)
+
+    assert pagina.login_foi_bem_sucedido()
+    assert pagina.obter_mensagem_erro() is None
+    assert pagina.botao_logout_esta_visivel()
+    assert driver.scripts == [scripts.CORRIDA_COM_ESTADO]
+
+
+def test_interacao_invalida_a_foto():
+    driver = DriverFalso()
+    pagina = LoginPage(driver)
+
+    estado = pagina.capturar_estado()
+    assert pagina.capturar_estado() is estado
+    pagina.digitar_texto(pagina.CAMPO_USERNAME, "tom")
+    assert pagina.capturar_estado() is not estado
+    pagina.clicar(pagina.BOTAO_LOGIN)
+    pagina.capturar_estado()
+    pagina.limpar_cache_elementos()
+    pagina.capturar_estado()
+
+    assert driver.scripts == [scripts.ESTADO_PAGINA] * 4
+    assert pagina.estatisticas_estado() == {"acertos": 1, "capturas": 4}
+
+
+def test_perguntas_respondidas_pela_foto():
+    estado = LoginPage(DriverFalso()).capturar_estado()
+
+    assert estado.url == "http://site/login" and estado.titulo == "The Internet"
+    assert estado.visivel(LoginPage.MENSAGEM_ERRO)
+    assert estado.classes(LoginPage.MENSAGEM_ERRO) == ["flash", "error"]
+    assert estado.texto(LoginPage.TITULO_PAGINA_LOGIN) == "Login Page"
+    assert not estado.visivel(LoginPage.MENSAGEM_SUCESSO)
+    assert estado.texto(LoginPage.AREA_SEGURA) is None
+    assert [mensagem["texto"] for mensagem in estado.mensagens] == [ERRO["texto"]]
+    with pytest.raises(KeyError, match="ESTADO_LOCATORS"):
+        estado.visivel(BasePage.LOCATOR_MENSAGENS)
@@ -0,0 +1,43 @@
+import json
+from types import SimpleNamespace
+
+from utils.parallel import indexar_artefatos, nodeid_sem_grupo, ordenar_mais_lentos_primeiro
+
+
+def _item(nodeid, marcadores=()):
+    return SimpleNamespace(nodeid=nodeid, get_closest_marker=lambda nome: nome if nome in marcadores else None)
+
+
+def test_mais_lentos_e_desconhecidos_vao_primeiro():
+    items = [_item("rapido"), _item("novo"), _item("lento"), _item("medio")]
+    duracoes = {"rapido": 0.5, "lento": 30.0, "medio": 4.0}
+
+    ordenar_mais_lentos_primeiro(items, duracoes)
+
+    assert [item.nodeid for item in items] == ["novo", "lento", "medio", "rapido"]
+
+
+def test_sem_historico_slow_vai_antes():
+    items = [_item("novo"), _item("novo_lento", marcadores=("slow",)), _item("conhecido")]
+
+    ordenar_mais_lentos_primeiro(items, {"conhecido": 2.0})
+
+    assert [item.nodeid for item in items] == ["novo_lento", "novo", "conhecido"]
+
+
+def test_nodeid_sem_grupo_do_xdist():
+    assert nodeid_sem_grupo("tests/test_a.py::test_x[chrome]@chrome-0") == "tests/test_a.py::test_x[chrome]"
+    assert nodeid_sem_grupo("tests/test_a.py::test_x[tom@site.com]") == "tests/test_a.py::test_x[tom@site.com]"
+    assert nodeid_sem_grupo("tests/test_a.py::test_x") == "tests/test_a.py::test_x"
+
+
+def test_indexar_artefatos_junta_workers(tmp_path):
+    (tmp_path / "gw0").mkdir()
+    (tmp_path / "gw0" / "falha.png").write_bytes(b"png")
+    (tmp_path / "gw1" / "screenshots").mkdir(parents=True)
+    (tmp_path / "gw1" / "screenshots" / "tela.png").write_bytes(b"png")
+
+    indice = indexar_artefatos(str(tmp_path))
+
+    assert indice == {"gw0": ["gw0/falha.png"], "gw1": ["gw1/screenshots/tela.png"]}
+    assert json.loads((tmp_path / "indice.json").read_text()) == indice
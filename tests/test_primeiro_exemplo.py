@@ -5,6 +5,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
 
 
 def test_abrir_google_basico(driver):
@@ -112,22 +113,23 @@ def test_buscar_google_wait_robusto(driver):
         print(f"Título atual: {driver.title}")
         
         try:
-            inputs = driver.find_elements(By.TAG_NAME, "input")
+            locator_inputs = (By.TAG_NAME, "input")
+            inputs = BasePage(driver).consultar_elementos([locator_inputs], ["type", "name"])[locator_inputs]
             print(f"Inputs encontrados: {len(inputs)}")
             for i, inp in enumerate(inputs[:3]):  
-                print(f"Input {i}: type='{inp.get_attribute('type')}', name='{inp.get_attribute('name')}'")
+                print(f"Input {i}: type='{inp['atributos']['type']}', name='{inp['atributos']['name']}'")
         except:
             pass
             
         raise
 
-def test_site_confiavel_para_testes(driver):
+def test_site_confiavel_para_testes(driver, base_url):
     """
     EXPLICAÇÃO:
     Google pode mudar, vamos usar um site feito para automação
     """
 
-    driver.get("https://the-internet.herokuapp.com/login")
+    driver.get(f"{base_url}/login")
     
     wait = WebDriverWait(driver, 10)
 
@@ -154,22 +156,22 @@ def test_debug_google_elementos(driver):
     Este teste só explora o Google para entendermos sua estrutura
     """
     
-    driver.get("https://www.google.com")
-    time.sleep(3)  
+    pagina = BasePage(driver)
+    pagina.navegar_para("https://www.google.com")
     
     print(f"🔍 Título da página: {driver.title}")
     print(f"🔍 URL atual: {driver.current_url}")
     
-    inputs = driver.find_elements(By.TAG_NAME, "input")
+    # Uma única chamada traz todos os inputs com todos os atributos
+    locator_inputs = (By.TAG_NAME, "input")
+    inputs = pagina.consultar_elementos([locator_inputs], ["type", "name", "id", "class"])[locator_inputs]
     print(f"🔍 Total de inputs encontrados: {len(inputs)}")
     
     for i, inp in enumerate(inputs):
-        input_type = inp.get_attribute('type')
-        input_name = inp.get_attribute('name')
-        input_id = inp.get_attribute('id')
-        input_class = inp.get_attribute('class')
+        atributos = inp["atributos"]
+        input_class = atributos["class"] or ""
         
-        print(f"  Input {i}: type='{input_type}', name='{input_name}', id='{input_id}', class='{input_class[:50]}...'")
+        print(f"  Input {i}: type='{atributos['type']}', name='{atributos['name']}', id='{atributos['id']}', class='{input_class[:50]}...'")
     
     assert True
 
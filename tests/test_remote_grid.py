@@ -0,0 +1,154 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+
+from utils.remote_grid import GridRemoto
+
+
+class GridFalso:
+    """
+    EXPLICAÇÃO:
+    Um "Selenium Grid" de mentira que responde o protocolo WebDriver
+    o suficiente para criar e fechar sessões. Anota as conexões usadas
+    e quantas sessões estavam sendo criadas ao mesmo tempo.
+    """
+
+    def __init__(self, recusar=0, demora=0.0, pronto=True):
+        self.recusar = recusar
+        self.demora = demora
+        self.pronto = pronto
+        self.conexoes = set()
+        self.sessoes = 0
+        self.criando = 0
+        self.max_criando = 0
+        self._lock = threading.Lock()
+        grid = self
+
+        class Tratador(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Mantém a conexão aberta (keep-alive)
+
+            def log_message(self, *args):
+                pass
+
+            def _responder(self, status, valor):
+                corpo = json.dumps({"value": valor}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def do_GET(self):
+                grid.conexoes.add(self.client_address)
+                self._responder(200, {"ready": grid.pronto, "message": "ok" if grid.pronto else "sem nós"})
+
+            def do_POST(self):
+                grid.conexoes.add(self.client_address)
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with grid._lock:
+                    grid.criando += 1
+                    grid.max_criando = max(grid.max_criando, grid.criando)
+                    recusar = grid.recusar > 0
+                    grid.recusar -= 1
+                time.sleep(grid.demora)
+                with grid._lock:
+                    grid.criando -= 1
+                    grid.sessoes += 1
+                    numero = grid.sessoes
+                if recusar:
+                    self._responder(500, {"error": "session not created", "message": "New session request timed out", "stacktrace": ""})
+                else:
+                    self._responder(200, {"sessionId": f"sessao-{numero}", "capabilities": {"browserName": "chrome"}})
+
+            def do_DELETE(self):
+                grid.conexoes.add(self.client_address)
+                self._responder(200, None)
+
+        self._servidor = ThreadingHTTPServer(("127.0.0.1", 0), Tratador)
+        self._servidor.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._servidor.server_address[1]}"
+        threading.Thread(target=self._servidor.serve_forever, daemon=True).start()
+
+    def parar(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+
+@pytest.fixture
+def grid_falso():
+    grids = []
+
+    def criar(**kwargs):
+        grids.append(GridFalso(**kwargs))
+        return grids[-1]
+
+    yield criar
+    for grid in grids:
+        grid.parar()
+
+
+def test_sessoes_dividem_a_mesma_conexao(grid_falso):
+    falso = grid_falso()
+    grid = GridRemoto(falso.url)
+
+    for _ in range(3):
+        driver = grid.criar_sessao(Options())
+        driver.quit()
+    grid.encerrar()
+
+    assert falso.sessoes == 3
+    assert len(falso.conexoes) == 1
+    assert grid.estatisticas()["sessoes_remotas"] == 3
+
+
+def test_grid_cheio_tenta_de_novo(grid_falso):
+    falso = grid_falso(recusar=2)
+    grid = GridRemoto(falso.url, tentativas=3, espera_inicial=0.01)
+
+    driver = grid.criar_sessao(Options())
+
+    assert driver.session_id == "sessao-3"
+    assert grid.novas_tentativas == 2
+
+
+def test_desiste_depois_das_tentativas(grid_falso):
+    falso = grid_falso(recusar=10)
+    grid = GridRemoto(falso.url, tentativas=1, espera_inicial=0.01)
+
+    with pytest.raises(SessionNotCreatedException):
+        grid.criar_sessao(Options())
+    assert falso.sessoes == 2
+
+
+def test_limite_de_criacoes_simultaneas(grid_falso):
+    falso = grid_falso(demora=0.1)
+    grid = GridRemoto(falso.url, max_criacoes=2)
+
+    threads = [threading.Thread(target=grid.criar_sessao, args=(Options(),)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert falso.sessoes == 5
+    assert falso.max_criando == 2
+
+
+def test_espera_cresce_ate_o_maximo():
+    grid = GridRemoto("http://grid:4444", espera_inicial=1.0, espera_maxima=5.0)
+
+    assert 0.5 <= grid._espera(0) <= 1.0
+    assert 2.0 <= grid._espera(2) <= 4.0
+    assert 2.5 <= grid._espera(10) <= 5.0
+
+
+def test_grid_fora_do_ar():
+    grid = GridRemoto("http://127.0.0.1:9")
+
+    with pytest.raises(RuntimeError):
+        grid.aguardar_pronto(timeout=0)
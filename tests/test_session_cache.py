@@ -0,0 +1,90 @@
+from utils.session_cache import CacheSessoes, SessaoSalva, capturar_sessao, restaurar_sessao
+
+COOKIE = {"name": "rack.session", "value": "abc", "path": "/", "domain": "site.com", "expiry": 123, "secure": True}
+
+
+def _sessao(**extras):
+    return SessaoSalva(origem="https://site.com", cookies=[COOKIE], **extras)
+
+
+class ChromeFalso:
+    """Registra as chamadas que restaurar_sessao faz no navegador"""
+
+    def __init__(self):
+        self.chamadas = []
+        self.current_url = "https://site.com/secure"
+
+    def execute_cdp_cmd(self, comando, parametros):
+        self.chamadas.append((comando, parametros))
+
+    def get(self, url):
+        self.chamadas.append(("get", url))
+
+    def execute_script(self, script, *args):
+        self.chamadas.append(("script", args))
+        return {"local": {"tema": "escuro"}, "sessao": {}}
+
+    def get_cookies(self):
+        return [COOKIE]
+
+
+def test_cache_devolve_sessao_guardada():
+    cache = CacheSessoes()
+    sessao = _sessao()
+
+    cache.guardar("tomsmith", sessao)
+
+    assert cache.obter("tomsmith") is sessao
+    assert cache.obter("outro") is None
+    assert cache.estatisticas() == {"acertos": 1, "falhas": 1, "rejeicoes": 0}
+
+
+def test_sessao_expirada_nao_e_devolvida():
+    cache = CacheSessoes(ttl=60)
+    cache.guardar("tomsmith", _sessao(criada_em=0))
+
+    assert cache.obter("tomsmith") is None
+
+
+def test_cache_cheio_descarta_a_mais_antiga():
+    cache = CacheSessoes(max_sessoes=2)
+    cache.guardar("a", _sessao())
+    cache.guardar("b", _sessao())
+    cache.obter("a")
+    cache.guardar("c", _sessao())
+
+    assert cache.obter("b") is None
+    assert cache.obter("a") is not None
+    assert cache.obter("c") is not None
+
+
+def test_sessao_rejeitada_sai_do_cache():
+    cache = CacheSessoes()
+    cache.guardar("tomsmith", _sessao())
+
+    cache.rejeitar("tomsmith")
+
+    assert cache.obter("tomsmith") is None
+    assert cache.rejeicoes == 1
+
+
+def test_capturar_sessao_pega_cookies_e_storage():
+    sessao = capturar_sessao(ChromeFalso())
+
+    assert sessao.origem == "https://site.com"
+    assert sessao.cookies == [COOKIE]
+    assert sessao.local_storage == {"tema": "escuro"}
+
+
+def test_restaurar_no_chrome_injeta_cookies_sem_abrir_pagina_extra():
+    driver = ChromeFalso()
+
+    restaurar_sessao(driver, _sessao(local_storage={"tema": "escuro"}), "https://site.com/secure")
+
+    comando, parametros = driver.chamadas[0]
+    assert comando == "Network.setCookies"
+    assert parametros["cookies"] == [{
+        "name": "rack.session", "value": "abc", "path": "/", "secure": True, "url": "https://site.com",
+    }]
+    assert driver.chamadas[1] == ("get", "https://site.com/secure")
+    assert driver.chamadas[2] == ("script", ({"tema": "escuro"}, {}))
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+from utils import timing
+from utils.timing import encerrar_gravacao, iniciar_gravacao, maiores_ralos, medido, span
+
+
+class PaginaFalsa:
+
+    @medido
+    def fazer_login(self, usuario):
+        self.clicar("botao")
+        return usuario
+
+    @medido
+    def clicar(self, locator):
+        time.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def sem_gravador_do_conftest(monkeypatch):
+    """O conftest grava os spans deste próprio teste; aqui começamos do zero"""
+    monkeypatch.setattr(timing, "_gravador_atual", None)
+
+
+def test_sem_gravacao_nao_registra_nada():
+    anterior = iniciar_gravacao()
+    encerrar_gravacao()
+
+    with span("qualquer"):
+        resultado = PaginaFalsa().fazer_login("tom")
+
+    assert resultado == "tom"
+    assert encerrar_gravacao() is None
+    assert anterior.spans == []  # O gravador encerrado não recebe mais nada
+
+
+def test_spans_aninhados_com_tempo_proprio():
+    gravador = iniciar_gravacao()
+    try:
+        with span("fase.call"):
+            PaginaFalsa().fazer_login("tom")
+    finally:
+        encerrar_gravacao()
+
+    spans = gravador.exportar()
+    assert [s["nome"] for s in spans] == ["fase.call", "fazer_login", "clicar"]
+    assert [s["profundidade"] for s in spans] == [0, 1, 2]
+    assert spans[2]["detalhe"] == "botao"
+
+    totais = gravador.totais()
+    assert totais["clicar"][0] == 1
+    assert totais["clicar"][1] >= 0.01
+    # O tempo do clicar não é contado de novo no fazer_login
+    assert totais["fazer_login"][1] < totais["clicar"][1]
+
+
+def test_maiores_ralos_ordena_por_tempo():
+    totais = {"clicar": [10, 1.0], "navegar_para": [2, 3.0]}
+
+    ralos = maiores_ralos(totais, limite=1)
+
+    assert ralos == [("navegar_para", 2, 3.0, 75.0)]
@@ -0,0 +1,3 @@
+from .browser_pool import BrowserPool
+
+__all__ = ['BrowserPool']
@@ -0,0 +1,332 @@
+"""
+artifacts - Captura de artefatos de falha sem travar a suíte
+
+PROBLEMA:
+Salvar screenshot de forma síncrona no hook de relatório deixa cada
+falha mais lenta, e numa "tempestade de falhas" (site fora do ar)
+a suíte inteira fica esperando o disco - e enche o disco.
+
+SOLUÇÃO:
+- Do navegador pegamos só o mínimo, rápido (screenshot em base64,
+  URL, DOM, console) - isso precisa ser feito na hora
+- Decodificar, comprimir e gravar fica para um pool de threads
+- Fila limitada: se estiver cheia, o artefato é descartado (o teste não espera)
+- Limite por execução: depois de N falhas, paramos de capturar
+- Com canal de eventos (utils.event_channel), os últimos N eventos
+  de rede/console/navegação vão junto (.eventos.jsonl)
+
+SCREENSHOTS REPETIDOS:
+Quando uma página compartilhada quebra, dezenas de testes geram a
+mesma tela. O ArmazemImagens guarda cada imagem uma única vez,
+pelo conteúdo (SHA-256) e pela aparência (hash perceptual), reduzida
+e em formato compacto (WebP). Os relatórios apontam para o arquivo
+compartilhado. Sem o Pillow instalado, só as cópias exatas são unidas.
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow é opcional: sem ele, só deduplicação exata e PNG original
+    Image = None
+
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+TIPOS_DISPONIVEIS = ("screenshot", "dom", "console", "url", "eventos")
+
+
+def nome_seguro(texto):
+    """Transforma o nome do teste em nome de arquivo válido"""
+    return re.sub(r"[^\w.-]+", "_", texto)
+
+
+def hash_perceptual(png):
+    """
+    EXPLICAÇÃO:
+    "Impressão digital" da aparência da imagem (dHash de 64 bits):
+    reduz para 9x8 em tons de cinza e compara cada pixel com o vizinho.
+    Telas quase iguais (um campo digitado diferente, um cursor) dão
+    hashes com poucos bits diferentes. Devolve None sem o Pillow
+    (ou se a imagem não puder ser lida).
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(png)) as imagem:
+            pequena = imagem.convert("L").resize((9, 8), Image.Resampling.BILINEAR)
+    except OSError:
+        return None
+    pixels = list(pequena.getdata())
+    valor = 0
+    for linha in range(8):
+        for coluna in range(8):
+            valor = (valor << 1) | (pixels[linha * 9 + coluna] > pixels[linha * 9 + coluna + 1])
+    return valor
+
+
+def distancia(hash_a, hash_b):
+    """Quantos bits diferem entre dois hashes perceptuais"""
+    return bin(hash_a ^ hash_b).count("1")
+
+
+class ArmazemImagens:
+    """
+    EXPLICAÇÃO:
+    Guarda screenshots pelo conteúdo: imagens iguais (ou quase iguais)
+    viram um arquivo só, e todo mundo recebe o caminho desse arquivo
+
+    PARÂMETROS:
+    - diretorio: pasta compartilhada da execução (todos os workers)
+    - largura_maxima: imagens maiores são reduzidas
+    - qualidade: qualidade do WebP (0-100)
+    - distancia_maxima: até quantos bits de diferença no hash perceptual
+      contam como "mesma tela" (None = só cópias exatas)
+    """
+
+    def __init__(self, diretorio, largura_maxima=1280, qualidade=70, distancia_maxima=4):
+        self.diretorio = diretorio
+        self.largura_maxima = largura_maxima
+        self.qualidade = qualidade
+        self.distancia_maxima = distancia_maxima
+        self.extensao = ".webp" if Image is not None and features.check("webp") else ".png"
+
+        self._por_conteudo = {}  # sha256 -> caminho
+        self._por_aparencia = []  # [(hash perceptual, caminho)]
+        self._lock = threading.Lock()
+
+        self.unicas = 0
+        self.repetidas = 0
+
+    def reservar(self, png):
+        """
+        EXPLICAÇÃO:
+        Decide onde a imagem fica, sem gravar nada ainda.
+        Devolve (caminho, nova): nova=False quando já existe uma igual.
+        """
+        conteudo = hashlib.sha256(png).hexdigest()
+        with self._lock:
+            if conteudo in self._por_conteudo:
+                self.repetidas += 1
+                return self._por_conteudo[conteudo], False
+
+        aparencia = hash_perceptual(png) if self.distancia_maxima is not None else None
+
+        with self._lock:
+            caminho = self._por_conteudo.get(conteudo)
+            if caminho is None and aparencia is not None:
+                for outra, caminho_outra in self._por_aparencia:
+                    if distancia(aparencia, outra) <= self.distancia_maxima:
+                        caminho = caminho_outra
+                        break
+            if caminho is None:
+                caminho = os.path.join(self.diretorio, conteudo[:20] + self.extensao)
+                nova = not os.path.exists(caminho)  # Outro worker pode já ter gravado
+            else:
+                nova = False
+
+            self._por_conteudo[conteudo] = caminho
+            if aparencia is not None and nova:
+                self._por_aparencia.append((aparencia, caminho))
+            if nova:
+                self.unicas += 1
+            else:
+                self.repetidas += 1
+            return caminho, nova
+
+    def gravar(self, png, caminho):
+        """Reduz, converte e grava (escrita atômica: workers podem gravar a mesma imagem)"""
+        os.makedirs(self.diretorio, exist_ok=True)
+        temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(self.compactar(png))
+        os.replace(temporario, caminho)
+        return caminho
+
+    def guardar(self, png):
+        """Reservar + gravar de uma vez (para quem pode esperar, ex: tirar_screenshot)"""
+        caminho, nova = self.reservar(png)
+        if nova:
+            self.gravar(png, caminho)
+        return caminho
+
+    def compactar(self, png):
+        """Reduz para largura_maxima e converte para WebP (sem Pillow: o PNG original)"""
+        if Image is None:
+            return png
+        saida = io.BytesIO()
+        try:
+            with Image.open(io.BytesIO(png)) as imagem:
+                if imagem.width > self.largura_maxima:
+                    altura = round(imagem.height * self.largura_maxima / imagem.width)
+                    imagem = imagem.resize((self.largura_maxima, altura), Image.Resampling.LANCZOS)
+                if self.extensao == ".webp":
+                    imagem.convert("RGB").save(saida, "WEBP", quality=self.qualidade, method=4)
+                else:
+                    imagem.save(saida, "PNG", optimize=True)
+        except OSError:
+            return png  # Imagem que o Pillow não entende: guarda como veio
+        return saida.getvalue()
+
+    def estatisticas(self):
+        return {"unicas": self.unicas, "repetidas": self.repetidas}
+
+
+class GravadorArtefatos:
+    """
+    EXPLICAÇÃO:
+    Recebe as falhas e grava os arquivos em segundo plano
+
+    PARÂMETROS:
+    - diretorio: pasta desta execução/worker
+    - tipos: o que capturar (screenshot, dom, console, url, eventos)
+    - max_por_execucao: depois de quantas falhas parar de capturar
+    - max_pendentes: tamanho máximo da fila de gravação
+    - threads: quantas gravações em paralelo
+    - armazem: ArmazemImagens compartilhado (screenshots deduplicados)
+    - max_eventos: quantos dos últimos eventos do canal gravar
+    """
+
+    def __init__(self, diretorio, tipos=("screenshot", "url"), max_por_execucao=50, max_pendentes=8, threads=2,
+                 armazem=None, max_eventos=100):
+        self.diretorio = diretorio
+        self.armazem = armazem
+        self.tipos = tuple(tipos)
+        self.max_por_execucao = max_por_execucao
+        self.max_eventos = max_eventos
+
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="artefatos")
+        self._vagas = threading.BoundedSemaphore(max_pendentes)
+        self._lock = threading.Lock()
+
+        self.capturas = 0
+        self.descartadas = 0
+        self.arquivos = []
+        self.erros = []
+        self.imagens = {}  # nome do teste -> screenshot compartilhado
+
+    def capturar_falha(self, driver, nome_teste):
+        """
+        EXPLICAÇÃO:
+        Chamado no momento da falha. Faz só as leituras do navegador
+        e devolve {tipo: caminho} do que SERÁ gravado ({} se descartado).
+        Com armazém, o screenshot aponta para a imagem compartilhada.
+        """
+        if not self._vagas.acquire(blocking=False):
+            with self._lock:
+                self.descartadas += 1
+            log.aviso("⚠️ Fila de artefatos cheia, falha sem artefatos: %s", nome_teste)
+            return {}
+
+        # Só conta para o limite da execução quem conseguiu uma vaga na fila
+        with self._lock:
+            if self.capturas >= self.max_por_execucao:
+                self.descartadas += 1
+                self._vagas.release()
+                return {}
+            self.capturas += 1
+
+        try:
+            dados = self._ler_navegador(driver)
+        except Exception as e:
+            self._vagas.release()
+            log.aviso("⚠️ Não deu para ler o navegador para os artefatos: %s", e)
+            return {}
+
+        base = os.path.join(self.diretorio, nome_seguro(nome_teste))
+        caminhos = self._caminhos(base, dados)
+
+        if self.armazem is not None and "screenshot" in dados:
+            # O hash precisa ser feito agora para o relatório já apontar
+            # para o arquivo certo; reduzir e converter continua em segundo plano
+            png = base64.b64decode(dados.pop("screenshot"))
+            caminho, nova = self.armazem.reservar(png)
+            if nova:
+                dados["imagem"] = (png, caminho)
+            caminhos["screenshot"] = caminho
+            with self._lock:
+                self.imagens[nome_teste] = caminho
+
+        self._executor.submit(self._gravar, base, dados)
+        return caminhos
+
+    def encerrar(self):
+        """Espera a fila esvaziar (fim da sessão) e devolve um resumo"""
+        self._executor.shutdown(wait=True)
+        if self.imagens:
+            os.makedirs(self.diretorio, exist_ok=True)
+            with open(os.path.join(self.diretorio, "imagens.json"), "w", encoding="utf-8") as arquivo:
+                json.dump(self.imagens, arquivo, indent=2, ensure_ascii=False)
+        return {
+            "capturas": self.capturas,
+            "descartadas": self.descartadas,
+            "arquivos": len(self.arquivos),
+            "erros": len(self.erros),
+        }
+
+    def _ler_navegador(self, driver):
+        """Parte síncrona: só o que precisa do navegador, sem processar nada"""
+        dados = {}
+        if "screenshot" in self.tipos:
+            dados["screenshot"] = driver.get_screenshot_as_base64()
+        if "url" in self.tipos:
+            dados["url"] = driver.current_url
+        if "dom" in self.tipos:
+            dados["dom"] = driver.page_source
+        if "console" in self.tipos:
+            try:
+                dados["console"] = driver.get_log("browser")
+            except Exception:
+                dados["console"] = []  # Navegador/driver sem suporte a log do console
+        if "eventos" in self.tipos:
+            canal = getattr(driver, "canal_eventos", None)
+            if canal is not None:  # Sem canal (sem BiDi): nada a gravar
+                dados["eventos"] = canal.eventos(ultimos=self.max_eventos)
+        return dados
+
+    def _caminhos(self, base, dados):
+        extensoes = {"screenshot": ".png", "dom": ".html.gz", "console": ".console.json", "url": ".url.txt",
+                     "eventos": ".eventos.jsonl"}
+        return {tipo: base + extensoes[tipo] for tipo in dados}
+
+    def _gravar(self, base, dados):
+        """Parte em segundo plano: decodificar, comprimir e escrever"""
+        try:
+            os.makedirs(self.diretorio, exist_ok=True)
+            gravados = []
+            if "screenshot" in dados:
+                gravados.append(self._escrever(base + ".png", base64.b64decode(dados["screenshot"])))
+            if "imagem" in dados:
+                png, caminho = dados["imagem"]
+                gravados.append(self.armazem.gravar(png, caminho))
+            if "dom" in dados:
+                gravados.append(self._escrever(base + ".html.gz", gzip.compress(dados["dom"].encode("utf-8"))))
+            if "console" in dados:
+                conteudo = json.dumps(dados["console"], indent=2, ensure_ascii=False).encode("utf-8")
+                gravados.append(self._escrever(base + ".console.json", conteudo))
+            if "url" in dados:
+                gravados.append(self._escrever(base + ".url.txt", dados["url"].encode("utf-8")))
+            if "eventos" in dados:
+                linhas = "".join(json.dumps(evento, ensure_ascii=False) + "\n" for evento in dados["eventos"])
+                gravados.append(self._escrever(base + ".eventos.jsonl", linhas.encode("utf-8")))
+            with self._lock:
+                self.arquivos.extend(gravados)
+        except Exception as e:
+            with self._lock:
+                self.erros.append(f"{base}: {e}")
+        finally:
+            self._vagas.release()
+
+    def _escrever(self, caminho, conteudo):
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(conteudo)
+        return caminho
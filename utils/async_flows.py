@@ -0,0 +1,123 @@
+"""
+async_flows - Muitos fluxos de teste ao mesmo tempo num event loop só
+
+PROBLEMA:
+Paralelismo com o xdist custa um processo Python por navegador
+ocupado. Quase todo o tempo de um teste de UI é espera pelo
+navegador - tempo em que o processo não faz nada.
+
+SOLUÇÃO:
+- Um event loop por processo, onde vivem as conexões e as sessões
+  assíncronas (utils.async_webdriver)
+- Um pool de sessões por configuração de navegador
+- executar_fluxos() roda N fluxos independentes ao mesmo tempo
+  (no máximo "concorrencia" juntos), e devolve o resultado de cada um
+  sem deixar a falha de um derrubar os outros
+- Cada fluxo anota as páginas que usou no seu próprio registro de
+  impacto (utils.impact usa ContextVar)
+
+USO:
+    executor = ExecutorAssincrono(concorrencia=20)
+    resultados = executor.executar_fluxos({"login": fluxo_login, "logout": fluxo_logout})
+    executor.encerrar()
+"""
+
+import asyncio
+import time
+from collections import namedtuple
+
+from utils.async_webdriver import FabricaSessoes, PoolAssincrono
+from utils.impact import iniciar_registro
+from utils.logger import iniciar_teste, obter_logger
+
+log = obter_logger(__name__)
+
+# erro: exceção do fluxo (None = passou)
+# duracao: segundos do próprio fluxo (sem a fila do limite de concorrência)
+# usado: anotações de impacto do fluxo (para utils.impact.incorporar_registro)
+# linhas: linhas de log do fluxo (para utils.logger.incorporar_linhas)
+ResultadoFluxo = namedtuple("ResultadoFluxo", ["erro", "duracao", "usado", "linhas"])
+
+
+class ExecutorAssincrono:
+    """
+    EXPLICAÇÃO:
+    Dono do event loop do processo e dos pools de sessões assíncronas
+
+    PARÂMETROS:
+    - concorrencia: quantos fluxos rodam ao mesmo tempo (= sessões abertas)
+    - max_usos: depois de quantos fluxos uma sessão é descartada
+    """
+
+    def __init__(self, concorrencia=1, max_usos=50):
+        self.concorrencia = max(1, concorrencia)
+        self.max_usos = max_usos
+        self.loop = asyncio.new_event_loop()
+        self._pools = {}
+        self._fabricas = {}
+
+    def rodar(self, corrotina):
+        """Roda uma corrotina no event loop do processo até ela terminar"""
+        return self.loop.run_until_complete(corrotina)
+
+    def pool(self, configuracao, caminho_driver=None, url_grid=None):
+        """Pool de sessões da configuração (criado na primeira vez que é pedido)"""
+        nome = configuracao.chave()
+        if nome not in self._pools:
+            fabrica = FabricaSessoes(configuracao, caminho_driver=caminho_driver, url_grid=url_grid)
+            self._fabricas[nome] = fabrica
+            self._pools[nome] = PoolAssincrono(fabrica.criar, tamanho=self.concorrencia, max_usos=self.max_usos)
+        return self._pools[nome]
+
+    def executar_fluxos(self, fluxos):
+        """
+        EXPLICAÇÃO:
+        Roda os fluxos ({chave: função async sem argumentos}) juntos,
+        no máximo "concorrencia" de cada vez.
+
+        RETORNO:
+        {chave: ResultadoFluxo}, na ordem dos fluxos
+        """
+        return self.rodar(self._executar_fluxos(fluxos))
+
+    async def _executar_fluxos(self, fluxos):
+        limite = asyncio.Semaphore(self.concorrencia)
+
+        async def _executar(chave, fluxo):
+            async with limite:
+                usado = iniciar_registro()  # Esta tarefa tem o seu próprio registro
+                contexto_log = iniciar_teste(str(chave))  # ... e o seu próprio log
+                inicio = time.perf_counter()
+                erro = None
+                try:
+                    await fluxo()
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except BaseException as e:  # Inclui pytest.skip/fail (não são Exception)
+                    erro = e
+                return ResultadoFluxo(erro, time.perf_counter() - inicio, usado, list(contexto_log.linhas))
+
+        inicio = time.perf_counter()
+        resultados = await asyncio.gather(*(_executar(chave, fluxo) for chave, fluxo in fluxos.items()))
+        duracao = time.perf_counter() - inicio
+        soma = sum(resultado.duracao for resultado in resultados)
+        log.info(
+            "⚡ %s fluxos assíncronos em %.1fs (%.1fs somados, até %s juntos)",
+            len(resultados), duracao, soma, self.concorrencia,
+        )
+        return dict(zip(fluxos, resultados))
+
+    def encerrar(self):
+        """Fecha as sessões guardadas, os drivers e o event loop; devolve as estatísticas somadas"""
+        estatisticas = {}
+        if self.loop.is_closed():
+            return estatisticas
+        for nome, pool in self._pools.items():
+            self.rodar(pool.encerrar())
+            self.rodar(self._fabricas[nome].encerrar())
+            for chave, valor in pool.estatisticas().items():
+                estatisticas[chave] = estatisticas.get(chave, 0) + valor
+        self._pools.clear()
+        self._fabricas.clear()
+        self.loop.close()
+        return estatisticas
@@ -0,0 +1,648 @@
+"""
+async_webdriver - O protocolo WebDriver falado direto do asyncio
+
+PROBLEMA:
+O cliente do Selenium é síncrono: enquanto um navegador carrega a
+página, o processo inteiro espera. Para manter 20 navegadores
+ocupados eram precisos 20 workers do xdist - 20 Pythons, cada um
+com a suíte inteira e seus plugins na memória.
+
+SOLUÇÃO:
+- Um cliente HTTP/1.1 mínimo sobre asyncio (conexões keep-alive,
+  sem dependências novas) que manda os comandos W3C WebDriver
+  direto para o chromedriver/geckodriver ou para o grid
+- Enquanto uma sessão espera o navegador, o event loop atende as outras
+- Um chromedriver (ou msedgedriver) atende várias sessões: um processo
+  de driver para N navegadores. O geckodriver só atende uma, então
+  cada sessão do Firefox local tem o seu
+- As opções vêm da mesma receita dos navegadores síncronos
+  (utils.driver_factory.montar_opcoes) e os erros são as mesmas
+  exceções do Selenium (NoSuchElementException, TimeoutException...)
+
+USO:
+    fabrica = FabricaSessoes(ConfiguracaoNavegador("chrome", headless=True), "/caminho/do/chromedriver")
+    sessao = await fabrica.criar()
+    await sessao.get("https://the-internet.herokuapp.com/login")
+    campo = await sessao.find_element(By.ID, "username")
+    await campo.send_keys("tomsmith")
+    await sessao.quit()
+    await fabrica.encerrar()
+"""
+
+import asyncio
+import base64
+import json
+import socket
+import time
+from dataclasses import replace
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidArgumentException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    SessionNotCreatedException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from utils.browser_profile import padroes_de_bloqueio
+from utils.driver_factory import FAMILIA_CHROMIUM, montar_opcoes
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+# Chave que identifica um elemento nas mensagens do protocolo W3C
+CHAVE_ELEMENTO = "element-6066-11e4-a52f-4a4c4a4c4a4c"
+
+# Código de erro do protocolo -> a mesma exceção que o Selenium levantaria
+ERROS_W3C = {
+    "no such element": NoSuchElementException,
+    "stale element reference": StaleElementReferenceException,
+    "element click intercepted": ElementClickInterceptedException,
+    "element not interactable": ElementNotInteractableException,
+    "invalid argument": InvalidArgumentException,
+    "invalid selector": InvalidSelectorException,
+    "javascript error": JavascriptException,
+    "no such window": NoSuchWindowException,
+    "session not created": SessionNotCreatedException,
+    "script timeout": TimeoutException,
+    "timeout": TimeoutException,
+}
+
+# Prefixo dos comandos CDP no chromedriver/msedgedriver (POST /session/{id}/<prefixo>/cdp/execute)
+PREFIXOS_CDP = {"chrome": "goog", "msedge": "ms", "MicrosoftEdge": "ms"}
+
+
+def _erro_do_protocolo(status, valor):
+    """Exceção do Selenium para uma resposta de erro do driver"""
+    if not isinstance(valor, dict):
+        return WebDriverException(f"Resposta HTTP {status} sem erro do WebDriver: {valor!r}")
+    classe = ERROS_W3C.get(valor.get("error"), WebDriverException)
+    return classe(valor.get("message") or valor.get("error"), stacktrace=None)
+
+
+def _localizador_w3c(by, valor):
+    """
+    EXPLICAÇÃO:
+    O protocolo W3C só conhece css, xpath, link text e tag name.
+    By.ID, By.NAME e By.CLASS_NAME viram seletores CSS
+    (o mesmo que o Selenium faz por baixo dos panos).
+    """
+    if by == By.ID:
+        return "css selector", f'[id="{valor}"]'
+    if by == By.NAME:
+        return "css selector", f'[name="{valor}"]'
+    if by == By.CLASS_NAME:
+        return "css selector", f".{valor}"
+    return by, valor
+
+
+class ClienteWebDriver:
+    """
+    EXPLICAÇÃO:
+    Fala HTTP/1.1 com um driver (ou grid) usando conexões keep-alive.
+    As conexões livres ficam guardadas e são divididas por todas as
+    sessões: o custo de abrir conexão é pago poucas vezes.
+
+    PARÂMETROS:
+    - url: endereço do driver ou do grid (ex: http://127.0.0.1:9515;
+      https:// usa TLS, porta 443 por padrão)
+    - conexoes: máximo de requisições em andamento ao mesmo tempo
+    - tempo_limite: segundos de espera por uma resposta
+    """
+
+    def __init__(self, url, conexoes=32, tempo_limite=300):
+        partes = urlsplit(url)
+        if partes.scheme not in ("http", "https"):
+            raise ValueError(f"Endereço do driver/grid precisa ser http:// ou https://: {url}")
+        self.url = url.rstrip("/")
+        self.host = partes.hostname or "127.0.0.1"
+        self.tls = partes.scheme == "https"
+        self.porta = partes.port or (443 if self.tls else 80)
+        self.tempo_limite = tempo_limite
+        self._prefixo = partes.path.rstrip("/")
+        self._max_conexoes = max(1, conexoes)
+        self._limite = None
+        self._livres = []
+
+        self.conexoes_abertas = 0
+        self.requisicoes = 0
+
+    async def requisitar(self, metodo, caminho, corpo=None):
+        """
+        EXPLICAÇÃO:
+        Manda um comando e devolve o "value" da resposta.
+        Conexão guardada que o servidor já fechou (keep-alive expirado)
+        é trocada por uma nova, uma vez, antes de desistir.
+        """
+        if corpo is None and metodo == "POST":
+            corpo = {}  # O protocolo exige um objeto JSON em todo POST
+        dados = json.dumps(corpo).encode("utf-8") if corpo is not None else b""
+        if self._limite is None:
+            self._limite = asyncio.Semaphore(self._max_conexoes)
+
+        async with self._limite:
+            for tentativa in range(2):
+                conexao, reaproveitada = await self._conexao()
+                devolvida = False
+                try:
+                    status, manter, resposta = await asyncio.wait_for(
+                        self._trocar(conexao, metodo, self._prefixo + caminho, dados), self.tempo_limite
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    if reaproveitada and tentativa == 0:
+                        continue
+                    raise WebDriverException(f"Conexão com {self.url} caiu: {str(e)}")
+                except asyncio.TimeoutError:
+                    raise WebDriverException(f"{self.url} não respondeu {metodo} {caminho} em {self.tempo_limite}s")
+                except ValueError as e:
+                    raise WebDriverException(f"Resposta HTTP inválida de {self.url}: {e}")
+                else:
+                    if manter:
+                        self._livres.append(conexao)
+                        devolvida = True
+                finally:
+                    # Qualquer outro desfecho (erro, cancelamento): a conexão
+                    # ficou no meio de uma resposta e não pode ser reaproveitada
+                    if not devolvida:
+                        conexao[1].close()
+                break
+        self.requisicoes += 1
+
+        try:
+            carga = json.loads(resposta) if resposta else {}
+        except ValueError:
+            raise WebDriverException(f"Resposta inválida de {self.url} (HTTP {status}): {resposta[:200]!r}")
+        valor = carga.get("value") if isinstance(carga, dict) else None
+        if status >= 400:
+            raise _erro_do_protocolo(status, valor)
+        return valor
+
+    async def _conexao(self):
+        """(leitor, escritor) livre, ou uma conexão nova"""
+        while self._livres:
+            conexao = self._livres.pop()
+            if not conexao[1].is_closing() and not conexao[0].at_eof():
+                return conexao, True
+            conexao[1].close()
+        conexao = await asyncio.open_connection(self.host, self.porta, ssl=True if self.tls else None)
+        self.conexoes_abertas += 1
+        return conexao, False
+
+    async def _trocar(self, conexao, metodo, caminho, dados):
+        """Escreve a requisição e lê a resposta inteira: (status, manter conexão, corpo)"""
+        leitor, escritor = conexao
+        escritor.write(
+            (
+                f"{metodo} {caminho} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.porta}\r\n"
+                "Accept: application/json\r\n"
+                "Content-Type: application/json;charset=UTF-8\r\n"
+                f"Content-Length: {len(dados)}\r\n"
+                "Connection: keep-alive\r\n\r\n"
+            ).encode("latin-1")
+            + dados
+        )
+        await escritor.drain()
+
+        linha = await leitor.readline()
+        if not linha:
+            raise ConnectionResetError("conexão fechada pelo servidor")
+        versao, status = linha.split(None, 2)[:2]
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b"\r\n", b"\n", b""):
+                break
+            nome, _, valor = linha.decode("latin-1").partition(":")
+            cabecalhos[nome.strip().lower()] = valor.strip()
+
+        manter = cabecalhos.get("connection", "").lower() != "close" and versao == b"HTTP/1.1"
+        if "chunked" in cabecalhos.get("transfer-encoding", "").lower():
+            partes = []
+            while True:
+                tamanho = int((await leitor.readline()).split(b";")[0], 16)
+                if tamanho == 0:
+                    while (await leitor.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                partes.append(await leitor.readexactly(tamanho))
+                await leitor.readexactly(2)
+            corpo = b"".join(partes)
+        elif "content-length" in cabecalhos:
+            corpo = await leitor.readexactly(int(cabecalhos["content-length"]))
+        else:
+            corpo = await leitor.read()
+            manter = False
+        return int(status), manter, corpo
+
+    async def status(self):
+        """GET /status do driver ou do grid"""
+        return await self.requisitar("GET", "/status")
+
+    async def aguardar_pronto(self, timeout=30):
+        """Espera o driver (ou grid) responder "ready" em /status"""
+        limite = time.monotonic() + timeout
+        ultimo_erro = None
+        while True:
+            try:
+                estado = await self.status()
+                if estado.get("ready"):
+                    return
+                ultimo_erro = estado.get("message") or "não está pronto"
+            except (OSError, WebDriverException) as e:
+                ultimo_erro = str(e)
+            if time.monotonic() >= limite:
+                raise WebDriverException(f"{self.url} não ficou pronto em {timeout}s: {ultimo_erro}")
+            await asyncio.sleep(0.1)
+
+    async def nova_sessao(self, capacidades):
+        """Abre uma sessão com as capacidades W3C do navegador (ex: opcoes.to_capabilities())"""
+        valor = await self.requisitar(
+            "POST", "/session", {"capabilities": {"firstMatch": [{}], "alwaysMatch": capacidades}}
+        )
+        return SessaoAssincrona(self, valor["sessionId"], valor.get("capabilities", {}))
+
+    def fechar(self):
+        """Fecha as conexões guardadas"""
+        livres, self._livres = self._livres, []
+        for _, escritor in livres:
+            escritor.close()
+
+    def estatisticas(self):
+        return {"conexoes_abertas": self.conexoes_abertas, "requisicoes_webdriver": self.requisicoes}
+
+
+class ElementoRemoto:
+    """Um elemento da página (a referência W3C) com as ações usadas pelas páginas"""
+
+    def __init__(self, sessao, id_elemento):
+        self.sessao = sessao
+        self.id = id_elemento
+
+    def __eq__(self, outro):
+        return isinstance(outro, ElementoRemoto) and outro.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"ElementoRemoto({self.id!r})"
+
+    def para_json(self):
+        return {CHAVE_ELEMENTO: self.id}
+
+    async def _comando(self, metodo, sufixo, corpo=None):
+        return await self.sessao._comando(metodo, f"/element/{self.id}{sufixo}", corpo)
+
+    async def click(self):
+        await self._comando("POST", "/click")
+
+    async def clear(self):
+        await self._comando("POST", "/clear")
+
+    async def send_keys(self, texto):
+        await self._comando("POST", "/value", {"text": str(texto)})
+
+    async def get_text(self):
+        return await self._comando("GET", "/text")
+
+    async def get_attribute(self, nome):
+        return await self._comando("GET", f"/attribute/{nome}")
+
+    async def is_displayed(self):
+        return bool(await self._comando("GET", "/displayed"))
+
+    async def is_enabled(self):
+        return bool(await self._comando("GET", "/enabled"))
+
+
+class SessaoAssincrona:
+    """
+    EXPLICAÇÃO:
+    Uma sessão (um navegador) falando pelo ClienteWebDriver.
+    Os nomes seguem o Selenium (get, find_element, execute_script...),
+    mas tudo é "await".
+    """
+
+    def __init__(self, cliente, id_sessao, capabilities=None):
+        self.cliente = cliente
+        self.session_id = id_sessao
+        self.capabilities = capabilities or {}
+        self.servico = None  # Driver exclusivo desta sessão (geckodriver local)
+
+    async def _comando(self, metodo, sufixo="", corpo=None):
+        return self._de_json(
+            await self.cliente.requisitar(metodo, f"/session/{self.session_id}{sufixo}", corpo)
+        )
+
+    def _para_json(self, valor):
+        """Elementos viram referências W3C dentro dos argumentos dos scripts"""
+        if isinstance(valor, ElementoRemoto):
+            return valor.para_json()
+        if isinstance(valor, (list, tuple)):
+            return [self._para_json(item) for item in valor]
+        if isinstance(valor, dict):
+            return {chave: self._para_json(item) for chave, item in valor.items()}
+        return valor
+
+    def _de_json(self, valor):
+        """Referências W3C na resposta viram ElementoRemoto"""
+        if isinstance(valor, list):
+            return [self._de_json(item) for item in valor]
+        if isinstance(valor, dict):
+            if CHAVE_ELEMENTO in valor:
+                return ElementoRemoto(self, valor[CHAVE_ELEMENTO])
+            return {chave: self._de_json(item) for chave, item in valor.items()}
+        return valor
+
+    async def get(self, url):
+        await self._comando("POST", "/url", {"url": url})
+
+    async def get_current_url(self):
+        return await self._comando("GET", "/url")
+
+    async def get_title(self):
+        return await self._comando("GET", "/title")
+
+    async def find_element(self, by, valor):
+        using, valor = _localizador_w3c(by, valor)
+        return await self._comando("POST", "/element", {"using": using, "value": valor})
+
+    async def find_elements(self, by, valor):
+        using, valor = _localizador_w3c(by, valor)
+        return await self._comando("POST", "/elements", {"using": using, "value": valor})
+
+    async def execute_script(self, script, *argumentos):
+        return await self._comando(
+            "POST", "/execute/sync", {"script": script, "args": self._para_json(list(argumentos))}
+        )
+
+    async def execute_async_script(self, script, *argumentos):
+        return await self._comando(
+            "POST", "/execute/async", {"script": script, "args": self._para_json(list(argumentos))}
+        )
+
+    async def set_script_timeout(self, segundos):
+        await self._comando("POST", "/timeouts", {"script": int(segundos * 1000)})
+
+    async def get_screenshot_as_png(self):
+        return base64.b64decode(await self._comando("GET", "/screenshot"))
+
+    async def get_window_handles(self):
+        return await self._comando("GET", "/window/handles")
+
+    async def switch_to_window(self, janela):
+        await self._comando("POST", "/window", {"handle": janela})
+
+    async def close_window(self):
+        return await self._comando("DELETE", "/window")
+
+    async def maximize_window(self):
+        await self._comando("POST", "/window/maximize")
+
+    async def delete_all_cookies(self):
+        await self._comando("DELETE", "/cookie")
+
+    async def execute_cdp_cmd(self, comando, parametros):
+        """Comando CDP pelo chromedriver/msedgedriver (navegadores Chromium)"""
+        prefixo = PREFIXOS_CDP.get(self.capabilities.get("browserName"))
+        if prefixo is None:
+            raise WebDriverException(f"{self.capabilities.get('browserName')} não tem CDP")
+        return await self._comando("POST", f"/{prefixo}/cdp/execute", {"cmd": comando, "params": parametros})
+
+    async def quit(self):
+        """Fecha o navegador (e o driver exclusivo da sessão, se houver)"""
+        try:
+            await self.cliente.requisitar("DELETE", f"/session/{self.session_id}")
+        finally:
+            if self.servico is not None:
+                await self.servico.parar()
+
+
+def _porta_livre():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ServicoDriverAssincrono:
+    """
+    EXPLICAÇÃO:
+    Sobe o executável do driver (chromedriver, geckodriver, msedgedriver)
+    numa porta livre, sem bloquear o event loop
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.cliente = None
+        self._processo = None
+
+    async def iniciar(self, timeout=30):
+        porta = _porta_livre()
+        self._processo = await asyncio.create_subprocess_exec(
+            self.caminho, f"--port={porta}",
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+        )
+        self.cliente = ClienteWebDriver(f"http://127.0.0.1:{porta}")
+        await self.cliente.aguardar_pronto(timeout)
+        return self
+
+    async def parar(self):
+        if self.cliente is not None:
+            self.cliente.fechar()
+        if self._processo is not None and self._processo.returncode is None:
+            self._processo.terminate()
+            try:
+                await asyncio.wait_for(self._processo.wait(), 10)
+            except asyncio.TimeoutError:
+                self._processo.kill()
+        self._processo = None
+
+
+class FabricaSessoes:
+    """
+    EXPLICAÇÃO:
+    Cria sessões assíncronas de uma ConfiguracaoNavegador:
+    - com url_grid: todas no grid, pelo mesmo cliente
+    - Chrome/Edge locais: um driver só, iniciado na primeira sessão
+    - Firefox local: um geckodriver por sessão
+    Depois de subir, aplica o bloqueio via CDP e o sem_deteccao,
+    como utils.driver_factory.criar_driver faz com os síncronos.
+    """
+
+    def __init__(self, configuracao, caminho_driver=None, url_grid=None):
+        self.configuracao = configuracao
+        self.caminho_driver = caminho_driver
+        self.cliente = ClienteWebDriver(url_grid) if url_grid else None
+        self._servico = None
+        self._iniciando = None
+
+    async def _cliente(self):
+        """Cliente do grid, ou do driver local compartilhado (None = um driver por sessão)"""
+        if self.cliente is not None or self.configuracao.navegador not in FAMILIA_CHROMIUM:
+            return self.cliente
+        if self._iniciando is None:
+            self._iniciando = asyncio.Lock()
+        async with self._iniciando:
+            if self._servico is None:
+                self._servico = await ServicoDriverAssincrono(self.caminho_driver).iniciar()
+        return self._servico.cliente
+
+    async def criar(self):
+        configuracao = self.configuracao
+        # Sem canal de eventos (utils.event_channel) nas sessões assíncronas: sem BiDi
+        opcoes, ignorados = montar_opcoes(replace(configuracao, eventos=0))
+
+        cliente = await self._cliente()
+        servico = None
+        if cliente is None:
+            servico = await ServicoDriverAssincrono(self.caminho_driver).iniciar()
+            cliente = servico.cliente
+        try:
+            sessao = await cliente.nova_sessao(opcoes.to_capabilities())
+        except Exception:
+            if servico is not None:
+                await servico.parar()
+            raise
+        sessao.servico = servico
+
+        if configuracao.navegador in FAMILIA_CHROMIUM:
+            padroes = padroes_de_bloqueio(configuracao.bloqueio)
+            if padroes:
+                try:
+                    await sessao.execute_cdp_cmd("Network.enable", {})
+                    await sessao.execute_cdp_cmd("Network.setBlockedURLs", {"urls": padroes})
+                except WebDriverException:
+                    ignorados = [categoria for categoria in configuracao.bloqueio if categoria != "terceiros"]
+        elif configuracao.perfil == "padrao" and not configuracao.headless:
+            await sessao.maximize_window()
+
+        if ignorados:
+            log.aviso("⚠️ %s não bloqueia: %s", configuracao.navegador, ", ".join(ignorados))
+        if configuracao.sem_deteccao:
+            await sessao.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return sessao
+
+    async def encerrar(self):
+        if self._servico is not None:
+            await self._servico.parar()
+            self._servico = None
+        if self.cliente is not None:
+            self.cliente.fechar()
+
+
+class PoolAssincrono:
+    """
+    EXPLICAÇÃO:
+    O BrowserPool (utils.browser_pool) das sessões assíncronas:
+    sessões livres são limpas e reaproveitadas pelo próximo fluxo.
+
+    PARÂMETROS:
+    - fabrica: função async sem argumentos que cria uma sessão
+    - tamanho: quantas sessões livres podem ficar guardadas
+    - max_usos: depois de quantos testes a sessão é descartada
+    """
+
+    def __init__(self, fabrica, tamanho=1, max_usos=50):
+        self.fabrica = fabrica
+        self.tamanho = tamanho
+        self.max_usos = max_usos
+
+        self._livres = []
+        self._usos = {}
+
+        self.partidas_frias = 0
+        self.reutilizacoes = 0
+        self.descartes = 0
+
+    async def adquirir(self):
+        while self._livres:
+            sessao = self._livres.pop()
+            if await self._esta_viva(sessao):
+                self.reutilizacoes += 1
+                log.info("♻️ Sessão assíncrona reaproveitada do pool")
+                return sessao
+            await self._descartar(sessao)
+
+        sessao = await self.fabrica()
+        self._usos[sessao.session_id] = 0
+        self.partidas_frias += 1
+        log.info("🚀 Nova sessão assíncrona iniciada (partida a frio)")
+        return sessao
+
+    async def devolver(self, sessao):
+        usos = self._usos[sessao.session_id] = self._usos.get(sessao.session_id, 0) + 1
+        if usos >= self.max_usos:
+            log.info("🗑️ Sessão assíncrona descartada após %s usos", usos)
+            await self._descartar(sessao)
+            return
+        try:
+            await self._limpar_estado(sessao)
+        except Exception as e:
+            log.erro("💥 Sessão assíncrona descartada (falhou ao limpar): %s", e)
+            await self._descartar(sessao)
+            return
+        if len(self._livres) < self.tamanho:
+            self._livres.append(sessao)
+        else:
+            await self._descartar(sessao)
+
+    async def encerrar(self):
+        livres, self._livres = self._livres, []
+        for sessao in livres:
+            await self._descartar(sessao, contar=False)
+
+    def estatisticas(self):
+        return {
+            "partidas_frias": self.partidas_frias,
+            "partidas_evitadas": self.reutilizacoes,
+            "descartes": self.descartes,
+        }
+
+    async def _limpar_estado(self, sessao):
+        """Janelas extras, storage, cookies e about:blank - como no BrowserPool"""
+        janelas = await sessao.get_window_handles()
+        for janela in janelas[1:]:
+            await sessao.switch_to_window(janela)
+            await sessao.close_window()
+        await sessao.switch_to_window(janelas[0])
+
+        try:
+            await sessao.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+        except WebDriverException:
+            pass  # Páginas como about:blank ou data: não têm storage
+
+        try:
+            # Chromium: apaga cookies de TODOS os domínios, não só do atual
+            await sessao.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except WebDriverException:
+            await sessao.delete_all_cookies()
+
+        await sessao.get("about:blank")
+
+    async def _esta_viva(self, sessao):
+        try:
+            await sessao.get_window_handles()
+            return True
+        except Exception:
+            return False
+
+    async def _descartar(self, sessao, contar=True):
+        self._usos.pop(sessao.session_id, None)
+        if contar:
+            self.descartes += 1
+        try:
+            await sessao.quit()
+        except Exception:
+            pass  # Navegador já morreu, nada a fazer
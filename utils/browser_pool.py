@@ -0,0 +1,182 @@
+"""
+BrowserPool - Reaproveita navegadores entre testes
+
+ANALOGIA:
+Em vez de comprar um carro novo para cada viagem,
+deixamos alguns carros "ligados na garagem" e só limpamos
+o banco antes do próximo motorista.
+
+RESPONSABILIDADES:
+- Manter até N navegadores "quentes" por worker
+- Limpar o estado entre testes (cookies, storage, janelas, eventos)
+- Descartar navegadores velhos (muitos usos) ou quebrados
+- Contar quantas partidas a frio foram evitadas
+"""
+
+import threading
+
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+
+class BrowserPool:
+    """
+    EXPLICAÇÃO:
+    O pool recebe uma "fábrica" (função sem argumentos que cria um driver)
+    e controla o ciclo de vida dos navegadores criados por ela.
+
+    PARÂMETROS:
+    - fabrica: função que cria um novo driver
+    - tamanho: quantos navegadores livres podem ficar guardados
+    - max_usos: depois de quantos testes o navegador é descartado
+    """
+
+    def __init__(self, fabrica, tamanho=1, max_usos=50):
+        self.fabrica = fabrica
+        self.tamanho = tamanho
+        self.max_usos = max_usos
+
+        self._livres = []
+        self._usos = {}
+        self._lock = threading.Lock()
+
+        self.partidas_frias = 0
+        self.reutilizacoes = 0
+        self.descartes = 0
+
+    def adquirir(self):
+        """
+        EXPLICAÇÃO:
+        Entrega um navegador pronto para uso.
+        Se houver um livre e saudável, reaproveita; senão cria um novo.
+        """
+        # A trava só protege a lista: perguntar ao driver se está vivo e
+        # fechar um navegador morto acontecem fora dela (_descartar trava de novo)
+        while True:
+            with self._lock:
+                if not self._livres:
+                    break
+                driver = self._livres.pop()
+            if self._esta_vivo(driver):
+                with self._lock:
+                    self.reutilizacoes += 1
+                log.info("♻️ Navegador reaproveitado do pool")
+                self._zerar_eventos(driver)
+                return driver
+            log.aviso("💥 Navegador guardado no pool não responde mais, descartando")
+            self._descartar(driver)
+
+        driver = self.fabrica()
+        with self._lock:
+            self._usos[id(driver)] = 0
+            self.partidas_frias += 1
+        log.info("🚀 Novo navegador iniciado (partida a frio)")
+        self._zerar_eventos(driver)
+        return driver
+
+    def devolver(self, driver):
+        """
+        EXPLICAÇÃO:
+        Recebe o navegador de volta depois do teste.
+        Ele é limpo e guardado, ou fechado se já deu o que tinha que dar.
+        """
+        with self._lock:
+            self._usos[id(driver)] = self._usos.get(id(driver), 0) + 1
+            usos = self._usos[id(driver)]
+
+        if usos >= self.max_usos:
+            log.info("🗑️ Navegador descartado após %s usos", usos)
+            self._descartar(driver)
+            return
+
+        try:
+            self._limpar_estado(driver)
+        except Exception as e:
+            log.erro("💥 Navegador descartado (falhou ao limpar): %s", e)
+            self._descartar(driver)
+            return
+
+        with self._lock:
+            if len(self._livres) < self.tamanho:
+                self._livres.append(driver)
+                return
+        self._descartar(driver)
+
+    def encerrar(self):
+        """
+        EXPLICAÇÃO:
+        Fecha todos os navegadores guardados (fim da sessão de testes)
+        """
+        with self._lock:
+            livres, self._livres = self._livres, []
+        for driver in livres:
+            self._descartar(driver, contar=False)
+
+    @property
+    def partidas_evitadas(self):
+        """Quantas vezes um navegador foi reaproveitado em vez de criado"""
+        return self.reutilizacoes
+
+    def estatisticas(self):
+        """Resumo numérico do pool (usado no relatório final)"""
+        return {
+            "partidas_frias": self.partidas_frias,
+            "partidas_evitadas": self.partidas_evitadas,
+            "descartes": self.descartes,
+        }
+
+    def _zerar_eventos(self, driver):
+        """O buffer do canal de eventos (utils.event_channel) é só do teste que vai começar"""
+        canal = getattr(driver, "canal_eventos", None)
+        if canal is not None:
+            canal.limpar()
+
+    def _limpar_estado(self, driver):
+        """
+        EXPLICAÇÃO:
+        Deixa o navegador "como novo" para o próximo teste:
+        1. Fecha janelas extras
+        2. Limpa localStorage e sessionStorage da página atual
+        3. Apaga os cookies
+        4. Volta para about:blank
+        """
+        janelas = driver.window_handles
+        for janela in janelas[1:]:
+            driver.switch_to.window(janela)
+            driver.close()
+        driver.switch_to.window(janelas[0])
+
+        try:
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+        except Exception:
+            pass  # Páginas como about:blank ou data: não têm storage
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chrome: apaga cookies de TODOS os domínios, não só do atual
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+
+    def _esta_vivo(self, driver):
+        """Pergunta ao driver algo simples para ver se a sessão ainda responde"""
+        try:
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    def _descartar(self, driver, contar=True):
+        with self._lock:
+            self._usos.pop(id(driver), None)
+            if contar:
+                self.descartes += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Navegador já morreu, nada a fazer
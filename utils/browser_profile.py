@@ -0,0 +1,187 @@
+"""
+browser_profile - Perfis de inicialização do Chrome
+
+PROBLEMA:
+O Chrome "de fábrica" faz muita coisa que o teste não precisa:
+GPU, extensões, tarefas em segundo plano, janela maximizada de
+tamanho variável, e espera a página carregar TUDO (imagens,
+fontes, analytics) antes de devolver o controle.
+
+SOLUÇÃO:
+- Perfil "padrao": o navegador como sempre foi (fidelidade total)
+- Perfil "performance": headless novo, janela de tamanho fixo,
+  sem extensões/GPU/throttling de segundo plano e pageLoadStrategy
+  "eager" (ou "none") - a BasePage já espera o que precisa
+- Bloqueio opcional de requisições via CDP: imagens, fontes,
+  analytics e domínios de terceiros
+
+USO NO TESTE:
+    @pytest.mark.full_fidelity   -> este teste usa o navegador completo
+"""
+
+from urllib.parse import urlsplit
+
+PERFIS = ("padrao", "performance")
+
+ESTRATEGIAS_CARREGAMENTO = ("normal", "eager", "none")
+
+TAMANHO_JANELA = (1366, 768)
+
+ARGUMENTOS_PERFORMANCE = (
+    "--headless=new",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+)
+
+# Padrões do Network.setBlockedURLs ("*" vale qualquer trecho)
+CATEGORIAS_BLOQUEIO = {
+    "imagens": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif"],
+    "fontes": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "analytics": [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*hotjar.com*",
+        "*segment.io*",
+        "*connect.facebook.net*",
+        "*newrelic.com*",
+        "*nr-data.net*",
+    ],
+}
+
+# Firefox não tem CDP: o perfil e o bloqueio viram preferências do navegador
+PREFERENCIAS_FIREFOX_PERFORMANCE = {
+    "extensions.update.enabled": False,
+    "app.update.auto": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.page": 0,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "media.autoplay.default": 5,
+}
+
+PREFERENCIAS_FIREFOX_BLOQUEIO = {
+    "imagens": {"permissions.default.image": 2},
+    "fontes": {"browser.display.use_document_fonts": 0, "gfx.downloadable_fonts.enabled": False},
+}
+
+# "terceiros" não é uma lista de padrões: bloqueia todo domínio que não seja o do site
+CATEGORIAS_DISPONIVEIS = tuple(CATEGORIAS_BLOQUEIO) + ("terceiros",)
+
+
+def interpretar_bloqueio(texto):
+    """ "imagens,fontes" -> ["imagens", "fontes"] (erro para categoria desconhecida)"""
+    categorias = [categoria.strip() for categoria in (texto or "").split(",") if categoria.strip()]
+    desconhecidas = [categoria for categoria in categorias if categoria not in CATEGORIAS_DISPONIVEIS]
+    if desconhecidas:
+        raise ValueError(
+            f"Bloqueio desconhecido: {desconhecidas} (disponíveis: {', '.join(CATEGORIAS_DISPONIVEIS)})"
+        )
+    return categorias
+
+
+def aplicar_perfil(chrome_options, perfil, estrategia="eager"):
+    """
+    EXPLICAÇÃO:
+    Configura as opções do Chrome para o perfil escolhido
+
+    PARÂMETROS:
+    - perfil: "padrao" ou "performance"
+    - estrategia: pageLoadStrategy do perfil performance
+      ("eager" = DOM pronto, "none" = nem isso; a BasePage espera o resto)
+    """
+    if perfil not in PERFIS:
+        raise ValueError(f"Perfil de navegador desconhecido: {perfil} (disponíveis: {', '.join(PERFIS)})")
+    if perfil == "padrao":
+        chrome_options.add_argument("--start-maximized")
+        return chrome_options
+
+    for argumento in ARGUMENTOS_PERFORMANCE:
+        chrome_options.add_argument(argumento)
+    chrome_options.add_argument(f"--window-size={TAMANHO_JANELA[0]},{TAMANHO_JANELA[1]}")
+    chrome_options.page_load_strategy = estrategia
+    return chrome_options
+
+
+def aplicar_bloqueio_terceiros(chrome_options, base_url):
+    """
+    EXPLICAÇÃO:
+    Bloqueia todos os domínios que não sejam o do site testado.
+    O CDP só bloqueia por padrão de URL (não dá para dizer "tudo menos
+    este site"), então a regra vai no resolvedor de DNS do Chrome:
+    qualquer outro domínio "não existe".
+    """
+    host = urlsplit(base_url).hostname or "localhost"
+    chrome_options.add_argument(
+        f"--host-resolver-rules=MAP * ~NOTFOUND , EXCLUDE {host} , EXCLUDE localhost , EXCLUDE 127.0.0.1"
+    )
+    return chrome_options
+
+
+def padroes_de_bloqueio(categorias):
+    """Padrões de URL (Network.setBlockedURLs) das categorias pedidas"""
+    return [padrao for categoria in categorias for padrao in CATEGORIAS_BLOQUEIO.get(categoria, ())]
+
+
+def bloquear_recursos(driver, categorias):
+    """
+    EXPLICAÇÃO:
+    Pede ao Chrome (via CDP) para recusar as requisições das categorias.
+    Vale para o navegador inteiro enquanto ele viver - inclusive quando
+    volta para o pool. Navegadores sem CDP ficam sem bloqueio.
+    """
+    padroes = padroes_de_bloqueio(categorias)
+    if not padroes or not hasattr(driver, "execute_cdp_cmd"):
+        return []
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": padroes})
+    return padroes
+
+
+def aplicar_perfil_firefox(firefox_options, perfil, estrategia="eager"):
+    """
+    EXPLICAÇÃO:
+    O mesmo perfil, no Firefox: headless, janela de tamanho fixo,
+    sem atualizações/telemetria e pageLoadStrategy "eager" ou "none".
+    No perfil "padrao", quem cria o driver maximiza a janela.
+    """
+    if perfil not in PERFIS:
+        raise ValueError(f"Perfil de navegador desconhecido: {perfil} (disponíveis: {', '.join(PERFIS)})")
+    if perfil == "padrao":
+        return firefox_options
+
+    firefox_options.add_argument("-headless")
+    firefox_options.add_argument(f"--width={TAMANHO_JANELA[0]}")
+    firefox_options.add_argument(f"--height={TAMANHO_JANELA[1]}")
+    for nome, valor in PREFERENCIAS_FIREFOX_PERFORMANCE.items():
+        firefox_options.set_preference(nome, valor)
+    firefox_options.page_load_strategy = estrategia
+    return firefox_options
+
+
+def bloquear_recursos_firefox(firefox_options, categorias):
+    """
+    EXPLICAÇÃO:
+    Imagens e fontes são desligadas por preferência do Firefox.
+    Analytics e terceiros dependem do CDP/resolvedor do Chrome:
+    no Firefox, ficam de fora (devolvidas para quem quiser avisar).
+    """
+    ignoradas = []
+    for categoria in categorias:
+        if categoria not in PREFERENCIAS_FIREFOX_BLOQUEIO:
+            ignoradas.append(categoria)
+            continue
+        for nome, valor in PREFERENCIAS_FIREFOX_BLOQUEIO[categoria].items():
+            firefox_options.set_preference(nome, valor)
+    return ignoradas
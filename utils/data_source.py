@@ -0,0 +1,231 @@
+"""
+data_source - Testes orientados a dados lendo CSV, Excel ou JSONL
+
+PROBLEMA:
+Dados de teste escritos como listas no próprio código não escalam:
+uma planilha de 100 mil linhas não cabe ali, e carregar tudo num
+DataFrame do pandas só para parametrizar testes é lento e pesado.
+
+SOLUÇÃO:
+- @data_source("dados/credenciais.csv") gera uma execução por linha
+- O arquivo é lido linha a linha (csv, openpyxl read_only, JSONL),
+  sem DataFrame
+- Só as colunas que o teste usa viram parâmetros
+- As linhas já lidas ficam num cache binário (pickle), invalidado
+  quando o arquivo muda (data de modificação + tamanho)
+- --data-shard=1/4 divide as linhas entre máquinas/jobs de CI
+
+USO:
+    @data_source("dados/credenciais.csv", ids="caso", tipos={"deveria_funcionar": para_booleano})
+    def test_login(driver, username, password, deveria_funcionar):
+        ...
+
+XDIST:
+Todos os workers precisam coletar exatamente os mesmos testes, então
+o --data-shard divide as linhas entre EXECUÇÕES diferentes (ex: 4 jobs
+de CI). Dentro de uma execução, o xdist já distribui as linhas entre
+os workers, cada linha é um teste separado.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import pickle
+
+import pytest
+
+FORMATOS = (".csv", ".xlsx", ".jsonl")
+
+# Versão do formato do cache: mudar quando a estrutura gravada mudar
+_VERSAO_CACHE = 2
+
+
+def data_source(caminho, colunas=None, ids=None, aba=None, tipos=None):
+    """
+    EXPLICAÇÃO:
+    Marca o teste para receber as linhas do arquivo como parâmetros
+
+    PARÂMETROS:
+    - caminho: arquivo .csv, .xlsx ou .jsonl (relativo ao arquivo de teste)
+    - colunas: quais colunas viram parâmetros (padrão: as que o teste pede)
+    - ids: coluna usada como nome de cada execução no relatório
+    - aba: planilha do .xlsx (padrão: a primeira)
+    - tipos: conversões por coluna, ex: {"idade": int, "ativo": para_booleano}
+    """
+    return pytest.mark.data_source(caminho, colunas=colunas, ids=ids, aba=aba, tipos=tipos or {})
+
+
+def para_booleano(valor):
+    """"true", "sim", "1", "x" -> True (células de planilha/CSV chegam como texto)"""
+    if isinstance(valor, bool):
+        return valor
+    return str(valor).strip().lower() in ("true", "verdadeiro", "sim", "yes", "1", "x")
+
+
+def ler_registros(caminho, aba=None):
+    """
+    EXPLICAÇÃO:
+    Lê o arquivo aos poucos, devolvendo um dicionário por linha
+    (nunca o arquivo inteiro na memória)
+    """
+    cabecalho, linhas = _abrir(caminho, aba)
+    for linha in linhas:
+        yield {coluna: linha[indice] if indice < len(linha) else None for indice, coluna in enumerate(cabecalho) if coluna}
+
+
+def carregar_tabela(caminho, aba=None, diretorio_cache=None):
+    """
+    EXPLICAÇÃO:
+    (cabecalho, linhas) do arquivo, usando o cache binário quando
+    o arquivo não mudou desde a última leitura
+    """
+    estado = os.stat(caminho)
+    assinatura = (_VERSAO_CACHE, estado.st_mtime_ns, estado.st_size)
+
+    arquivo_cache = None
+    if diretorio_cache:
+        chave = hashlib.sha1(f"{os.path.abspath(caminho)}|{aba}".encode("utf-8")).hexdigest()
+        arquivo_cache = os.path.join(str(diretorio_cache), f"{chave}.pickle")
+        try:
+            with open(arquivo_cache, "rb") as arquivo:
+                guardado = pickle.load(arquivo)
+            if guardado["assinatura"] == assinatura:
+                return guardado["cabecalho"], guardado["linhas"]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+            pass  # Sem cache (ou cache velho/corrompido): lê o arquivo
+
+    cabecalho, linhas = _abrir(caminho, aba)
+    linhas = [tuple(linha) for linha in linhas]
+    cabecalho = list(cabecalho)  # No JSONL o cabeçalho cresce enquanto as linhas são lidas
+
+    if arquivo_cache:
+        os.makedirs(os.path.dirname(arquivo_cache), exist_ok=True)
+        temporario = f"{arquivo_cache}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as arquivo:
+            pickle.dump(
+                {"assinatura": assinatura, "cabecalho": cabecalho, "linhas": linhas},
+                arquivo,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temporario, arquivo_cache)
+    return cabecalho, linhas
+
+
+def interpretar_shard(texto):
+    """ "2/4" -> (2, 4): esta execução fica com a 2ª de 4 partes das linhas"""
+    try:
+        parte, total = (int(numero) for numero in texto.split("/"))
+    except ValueError:
+        raise ValueError(f"--data-shard deve ser 'parte/total' (ex: 1/4), recebido: {texto!r}")
+    if not 1 <= parte <= total:
+        raise ValueError(f"--data-shard: a parte deve estar entre 1 e {total}, recebido: {texto!r}")
+    return parte, total
+
+
+def parametrizar(metafunc, marcador, diretorio_cache=None, shard=None):
+    """
+    EXPLICAÇÃO:
+    Chamado pelo pytest_generate_tests do conftest: transforma as linhas
+    do arquivo marcado com @data_source em execuções do teste
+    """
+    caminho = marcador.args[0]
+    if not os.path.isabs(caminho):
+        caminho = os.path.join(os.path.dirname(str(metafunc.definition.path)), caminho)
+    opcoes = marcador.kwargs
+
+    cabecalho, linhas = carregar_tabela(caminho, opcoes.get("aba"), diretorio_cache)
+
+    colunas = opcoes.get("colunas") or [coluna for coluna in cabecalho if coluna in metafunc.fixturenames]
+    faltando = [coluna for coluna in colunas if coluna not in cabecalho]
+    if faltando:
+        existentes = [coluna for coluna in cabecalho if coluna]
+        raise ValueError(f"{os.path.basename(caminho)}: colunas inexistentes {faltando} (existem: {existentes})")
+    if not colunas:
+        raise ValueError(f"{os.path.basename(caminho)}: nenhuma coluna do arquivo é argumento de {metafunc.function.__name__}")
+
+    indices = [cabecalho.index(coluna) for coluna in colunas]
+    coluna_id = opcoes.get("ids")
+    indice_id = cabecalho.index(coluna_id) if coluna_id else None
+    tipos = opcoes.get("tipos", {})
+
+    parte, total = interpretar_shard(shard) if shard else (1, 1)
+
+    parametros = []
+    for numero, linha in enumerate(linhas):
+        if numero % total != parte - 1:
+            continue
+        valores = []
+        for coluna, indice in zip(colunas, indices):
+            valor = linha[indice] if indice < len(linha) else None
+            if coluna in tipos and valor is not None:
+                valor = tipos[coluna](valor)
+            valores.append(valor)
+        id_linha = str(linha[indice_id]) if indice_id is not None else None
+        parametros.append(pytest.param(*valores, id=id_linha))
+
+    metafunc.parametrize(colunas, parametros)
+
+
+def _abrir(caminho, aba=None):
+    """(cabecalho, gerador de linhas) conforme a extensão do arquivo"""
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".csv":
+        return _abrir_csv(caminho)
+    if extensao == ".xlsx":
+        return _abrir_xlsx(caminho, aba)
+    if extensao == ".jsonl":
+        return _abrir_jsonl(caminho)
+    raise ValueError(f"Formato não suportado: {caminho} (use {', '.join(FORMATOS)})")
+
+
+def _abrir_csv(caminho):
+    arquivo = open(caminho, newline="", encoding="utf-8-sig")
+    leitor = csv.reader(arquivo)
+    cabecalho = next(leitor, [])
+
+    def linhas():
+        with arquivo:
+            yield from leitor
+
+    return cabecalho, linhas()
+
+
+def _abrir_xlsx(caminho, aba=None):
+    from openpyxl import load_workbook  # Só quem usa planilhas precisa do openpyxl
+
+    # read_only: as linhas são lidas do arquivo conforme pedidas (sem montar a planilha inteira)
+    pasta = load_workbook(caminho, read_only=True, data_only=True)
+    planilha = pasta[aba] if aba else pasta.worksheets[0]
+    iterador = planilha.iter_rows(values_only=True)
+    # Célula de cabeçalho em branco vira "" (as linhas são lidas pela posição da coluna)
+    cabecalho = ["" if celula is None else str(celula) for celula in next(iterador, ())]
+    while cabecalho and not cabecalho[-1]:
+        cabecalho.pop()  # Colunas vazias no fim da planilha
+
+    def linhas():
+        try:
+            for linha in iterador:
+                if any(celula is not None for celula in linha):
+                    yield linha[:len(cabecalho)]
+        finally:
+            pasta.close()
+
+    return cabecalho, linhas()
+
+
+def _abrir_jsonl(caminho):
+    cabecalho = []
+
+    def linhas():
+        with open(caminho, encoding="utf-8") as arquivo:
+            for texto in arquivo:
+                if not texto.strip():
+                    continue
+                registro = json.loads(texto)
+                for chave in registro:
+                    if chave not in cabecalho:
+                        cabecalho.append(chave)
+                yield [registro.get(coluna) for coluna in cabecalho]
+
+    return cabecalho, linhas()
@@ -0,0 +1,165 @@
+"""
+driver_binary - Descobre o executável do driver (chromedriver, geckodriver, msedgedriver) uma vez só
+
+PROBLEMA:
+`ChromeDriverManager().install()` em cada teste verifica versões,
+mexe no disco e às vezes vai na internet.
+
+SOLUÇÃO:
+- Resolvemos o caminho uma vez por sessão (ou uma vez no processo
+  principal do xdist, que repassa para os workers)
+- Guardamos o resultado num "manifesto" em disco, por versão do Chrome,
+  protegido por trava de arquivo. Máquina sem internet inicia na hora.
+- Quem quiser pode fixar um chromedriver local (--chromedriver-path
+  ou variável de ambiente CHROMEDRIVER_PATH); para os outros
+  navegadores, GECKODRIVER_PATH e MSEDGEDRIVER_PATH
+"""
+
+import json
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+DIRETORIO_CACHE_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "selenium-framework")
+NOME_MANIFESTO = "manifesto_drivers.json"
+
+# navegador: (nome do driver, variável de ambiente com um caminho fixo)
+DRIVERS = {
+    "chrome": ("chromedriver", "CHROMEDRIVER_PATH"),
+    "firefox": ("geckodriver", "GECKODRIVER_PATH"),
+    "edge": ("msedgedriver", "MSEDGEDRIVER_PATH"),
+}
+
+
+class TravaArquivo:
+    """
+    EXPLICAÇÃO:
+    Trava exclusiva num arquivo, para dois workers não
+    baixarem/gravarem o manifesto ao mesmo tempo
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._arquivo = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.caminho), exist_ok=True)
+        self._arquivo = open(self.caminho, "a+")
+        if fcntl:
+            fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_EX)
+        else:
+            self._arquivo.seek(0)
+            msvcrt.locking(self._arquivo.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl:
+            fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_UN)
+        else:
+            self._arquivo.seek(0)
+            msvcrt.locking(self._arquivo.fileno(), msvcrt.LK_UNLCK, 1)
+        self._arquivo.close()
+
+
+def versao_do_chrome():
+    """Versão do Chrome instalado (ou None se não der para descobrir)"""
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def versao_do_navegador(navegador):
+    """Versão do navegador instalado (ou None se não der para descobrir)"""
+    if navegador == "chrome":
+        return versao_do_chrome()
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+        tipo = ChromeType.MSEDGE if navegador == "edge" else navegador
+        return OperationSystemManager().get_browser_version_from_os(tipo)
+    except Exception:
+        return None
+
+
+def _instalar(navegador):
+    """Baixa o driver do navegador com o webdriver-manager (pode precisar de internet)"""
+    if navegador == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    if navegador == "edge":
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager().install()
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def ler_manifesto(diretorio_cache=DIRETORIO_CACHE_PADRAO):
+    caminho = os.path.join(diretorio_cache, NOME_MANIFESTO)
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return {}
+
+
+def _gravar_manifesto(dados, diretorio_cache):
+    """Grava num arquivo temporário e troca de uma vez (nunca fica meio escrito)"""
+    caminho = os.path.join(diretorio_cache, NOME_MANIFESTO)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, sort_keys=True)
+    os.replace(temporario, caminho)
+
+
+def resolver_driver(navegador, caminho_fixo=None, diretorio_cache=DIRETORIO_CACHE_PADRAO, instalar=None):
+    """
+    EXPLICAÇÃO:
+    Devolve o caminho do driver do navegador, na seguinte ordem:
+    1. Caminho fixo (opção de linha de comando ou variável de ambiente)
+    2. Manifesto em disco para a versão atual do navegador
+    3. webdriver-manager (só aqui pode precisar de internet)
+
+    PARÂMETROS:
+    - navegador: "chrome", "firefox" ou "edge"
+    - caminho_fixo: driver local que deve ser usado sempre
+    - diretorio_cache: onde fica o manifesto
+    - instalar: função que baixa o driver (padrão: webdriver-manager)
+    """
+    if navegador not in DRIVERS:
+        raise ValueError(f"Navegador sem driver conhecido: {navegador} (disponíveis: {', '.join(DRIVERS)})")
+    nome_driver, variavel = DRIVERS[navegador]
+
+    caminho_fixo = caminho_fixo or os.environ.get(variavel)
+    if caminho_fixo:
+        if not os.path.isfile(caminho_fixo):
+            raise FileNotFoundError(f"{nome_driver} fixo não encontrado: {caminho_fixo}")
+        return caminho_fixo
+
+    chave = f"{navegador}-{versao_do_navegador(navegador) or 'desconhecida'}"
+
+    with TravaArquivo(os.path.join(diretorio_cache, f"{NOME_MANIFESTO}.lock")):
+        manifesto = ler_manifesto(diretorio_cache)
+        caminho = manifesto.get(chave)
+        if caminho and os.path.isfile(caminho):
+            log.info("📦 %s do manifesto (%s): %s", nome_driver, chave, caminho)
+            return caminho
+
+        caminho = instalar() if instalar else _instalar(navegador)
+        manifesto[chave] = caminho
+        _gravar_manifesto(manifesto, diretorio_cache)
+        log.info("⬇️ %s resolvido e salvo no manifesto (%s): %s", nome_driver, chave, caminho)
+        return caminho
+
+
+def resolver_chromedriver(caminho_fixo=None, diretorio_cache=DIRETORIO_CACHE_PADRAO, instalar=None):
+    """Atalho do resolver_driver para o Chrome"""
+    return resolver_driver("chrome", caminho_fixo, diretorio_cache, instalar)
@@ -0,0 +1,180 @@
+"""
+driver_factory - Uma receita só para criar Chrome, Firefox e Edge
+
+PROBLEMA:
+Cada fixture montava as opções do Chrome do seu jeito, e qualquer
+outro navegador dava "não suportado ainda" - enquanto o CI rodava
+uma matriz [chrome, firefox] que nunca chegava a usar o Firefox.
+
+SOLUÇÃO:
+- ConfiguracaoNavegador descreve O QUE se quer (navegador, headless,
+  perfil, bloqueios, argumentos extras), igual para todos
+- montar_opcoes() traduz isso para as opções de cada navegador
+  (Chrome e Edge são da família Chromium e usam as mesmas opções)
+- criar_driver() sobe o navegador com o driver já resolvido
+  (utils.driver_binary), ou pede uma sessão a um grid remoto
+  (utils.remote_grid), e aplica o que só dá para fazer depois
+- Com "eventos", o navegador sobe com WebDriver BiDi e ganha um canal
+  de eventos (utils.event_channel) com buffer desse tamanho
+
+USO:
+    configuracao = ConfiguracaoNavegador("firefox", headless=True)
+    driver = criar_driver(configuracao, "/caminho/do/geckodriver")
+    driver = criar_driver(configuracao, grid=GridRemoto("http://localhost:4444"))
+"""
+
+from dataclasses import dataclass, field
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from utils.browser_profile import (
+    aplicar_bloqueio_terceiros,
+    aplicar_perfil,
+    aplicar_perfil_firefox,
+    bloquear_recursos,
+    bloquear_recursos_firefox,
+)
+from utils.event_channel import conectar_canal
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+NAVEGADORES = ("chrome", "firefox", "edge")
+
+# Navegadores baseados no Chromium: mesmas opções, CDP disponível
+FAMILIA_CHROMIUM = ("chrome", "edge")
+
+_CLASSES = {
+    "chrome": (ChromeOptions, ChromeService, webdriver.Chrome),
+    "firefox": (FirefoxOptions, FirefoxService, webdriver.Firefox),
+    "edge": (EdgeOptions, EdgeService, webdriver.Edge),
+}
+
+
+@dataclass
+class ConfiguracaoNavegador:
+    """
+    EXPLICAÇÃO:
+    Tudo o que define "como" um navegador sobe.
+    Duas configurações iguais podem dividir o mesmo pool.
+    """
+
+    navegador: str = "chrome"
+    headless: bool = False
+    perfil: str = "padrao"
+    estrategia: str = "eager"
+    bloqueio: list = field(default_factory=list)
+    argumentos: list = field(default_factory=list)
+    base_url: str = ""
+    sem_deteccao: bool = False
+    eventos: int = 0  # Tamanho do buffer do canal de eventos (0 = sem canal)
+
+    def chave(self):
+        """Nome curto e estável da configuração (ex: nome de pool)"""
+        partes = [self.navegador, self.perfil]
+        if self.headless:
+            partes.append("headless")
+        if self.bloqueio:
+            partes.append("bloqueio=" + "+".join(self.bloqueio))
+        if self.sem_deteccao:
+            partes.append("sem-deteccao")
+        if self.eventos:
+            partes.append("eventos")
+        return "-".join(partes)
+
+
+def interpretar_navegadores(texto):
+    """ "chrome, firefox" -> ["chrome", "firefox"] (erro para navegador desconhecido)"""
+    navegadores = []
+    for navegador in (texto or "").split(","):
+        navegador = navegador.strip().lower()
+        if navegador and navegador not in navegadores:
+            navegadores.append(navegador)
+    desconhecidos = [navegador for navegador in navegadores if navegador not in NAVEGADORES]
+    if desconhecidos or not navegadores:
+        raise ValueError(
+            f"Navegador desconhecido: {desconhecidos or texto!r} (disponíveis: {', '.join(NAVEGADORES)})"
+        )
+    return navegadores
+
+
+def montar_opcoes(configuracao):
+    """
+    EXPLICAÇÃO:
+    Opções do Selenium para a configuração pedida.
+    Devolve (opções, bloqueios que este navegador não consegue fazer).
+    """
+    if configuracao.navegador not in _CLASSES:
+        raise ValueError(
+            f"Navegador {configuracao.navegador} não suportado (disponíveis: {', '.join(NAVEGADORES)})"
+        )
+    opcoes = _CLASSES[configuracao.navegador][0]()
+    ignorados = []
+
+    if configuracao.navegador in FAMILIA_CHROMIUM:
+        aplicar_perfil(opcoes, configuracao.perfil, configuracao.estrategia)
+        if configuracao.headless:
+            opcoes.add_argument("--headless=new")
+        if "terceiros" in configuracao.bloqueio:
+            aplicar_bloqueio_terceiros(opcoes, configuracao.base_url)
+        if configuracao.sem_deteccao:
+            opcoes.add_argument("--disable-blink-features=AutomationControlled")
+            opcoes.add_experimental_option("excludeSwitches", ["enable-automation"])
+            opcoes.add_experimental_option("useAutomationExtension", False)
+    else:
+        aplicar_perfil_firefox(opcoes, configuracao.perfil, configuracao.estrategia)
+        if configuracao.headless and "-headless" not in opcoes.arguments:
+            opcoes.add_argument("-headless")
+        ignorados = bloquear_recursos_firefox(opcoes, configuracao.bloqueio)
+        if configuracao.sem_deteccao:
+            opcoes.set_preference("dom.webdriver.enabled", False)
+            opcoes.set_preference("useAutomationExtension", False)
+
+    if configuracao.eventos:
+        opcoes.enable_bidi = True  # Capability webSocketUrl: o driver abre o canal BiDi
+
+    for argumento in configuracao.argumentos:
+        opcoes.add_argument(argumento)
+    return opcoes, ignorados
+
+
+def criar_driver(configuracao, caminho_driver=None, grid=None):
+    """
+    EXPLICAÇÃO:
+    Sobe o navegador da configuração com o driver em caminho_driver
+    (ou numa sessão do grid, se houver um).
+    Depois de subir: bloqueio via CDP (família Chromium local), janela
+    maximizada (Firefox no perfil padrão) e navigator.webdriver
+    escondido (sem_deteccao) e canal de eventos (eventos).
+    """
+    opcoes, ignorados = montar_opcoes(configuracao)
+
+    if grid is not None:
+        driver = grid.criar_sessao(opcoes)
+    else:
+        _, classe_servico, classe_driver = _CLASSES[configuracao.navegador]
+        driver = classe_driver(service=classe_servico(caminho_driver), options=opcoes)
+
+    if configuracao.navegador in FAMILIA_CHROMIUM:
+        if not hasattr(driver, "execute_cdp_cmd"):
+            # Sessões remotas não têm CDP: só o bloqueio de terceiros (argumento do navegador) vale
+            ignorados = [categoria for categoria in configuracao.bloqueio if categoria != "terceiros"]
+        bloquear_recursos(driver, configuracao.bloqueio)
+    elif configuracao.perfil == "padrao" and not configuracao.headless:
+        driver.maximize_window()
+
+    if ignorados:
+        log.aviso("⚠️ %s não bloqueia: %s", configuracao.navegador, ", ".join(ignorados))
+
+    if configuracao.sem_deteccao:
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    if configuracao.eventos:
+        conectar_canal(driver, configuracao.eventos)
+    return driver
@@ -0,0 +1,217 @@
+"""
+duration_history - Histórico de durações dos testes (SQLite)
+
+PROBLEMA:
+Sem memória das execuções anteriores, não dá para saber se um teste
+ficou mais lento, nem distribuir os testes lentos primeiro entre os
+workers. Um JSON com "a última duração" de cada teste é pouco: uma
+execução ruim bagunça a ordem, e não existe tendência.
+
+SOLUÇÃO:
+Um banco SQLite em reports/ com uma linha por teste por execução:
+setup, call e teardown separados, por navegador. Com ele:
+- a ordem "mais lentos primeiro" usa a MEDIANA das últimas execuções
+- testes que ficaram X% mais lentos que a própria mediana geram aviso
+- --durations-trend mostra a tendência dos testes mais lentos
+- os marcadores slow/smoke/critical_path ficam gravados junto, para
+  somar o tempo de cada grupo e sugerir quem deveria ser "slow"
+
+Só o processo principal grava (no fim da sessão); os workers do
+xdist só leem, todos o mesmo banco, então coletam na mesma ordem.
+"""
+
+import os
+import sqlite3
+import statistics
+import time
+
+ARQUIVO_HISTORICO = os.path.join("reports", "historico_duracoes.sqlite")
+
+# Marcadores do pytest.ini que interessam ao histórico
+MARCADORES_RASTREADOS = ("slow", "smoke", "critical_path")
+
+FASES = ("setup", "call", "teardown")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    inicio REAL NOT NULL,
+    ambiente TEXT
+);
+CREATE TABLE IF NOT EXISTS duracoes (
+    execucao INTEGER NOT NULL REFERENCES execucoes(id),
+    nodeid TEXT NOT NULL,
+    browser TEXT NOT NULL,
+    setup REAL NOT NULL DEFAULT 0,
+    call REAL NOT NULL DEFAULT 0,
+    teardown REAL NOT NULL DEFAULT 0,
+    resultado TEXT NOT NULL,
+    marcadores TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_duracoes_teste ON duracoes (nodeid, browser, execucao);
+"""
+
+_ULTIMAS = """
+SELECT nodeid, setup + call + teardown, marcadores FROM (
+    SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY execucao DESC) AS ordem
+    FROM duracoes
+    WHERE browser = ? AND resultado = 'passed'
+)
+WHERE ordem <= ?
+ORDER BY nodeid, execucao
+"""
+
+
+class HistoricoDuracoes:
+    """
+    EXPLICAÇÃO:
+    Lê e grava o histórico de durações
+
+    PARÂMETROS:
+    - caminho: arquivo SQLite
+    - janela: quantas execuções recentes entram na mediana
+    - manter: quantas execuções guardar por teste (as mais velhas são apagadas)
+    """
+
+    def __init__(self, caminho=ARQUIVO_HISTORICO, janela=10, manter=50):
+        self.caminho = caminho
+        self.janela = janela
+        self.manter = manter
+
+    def _conectar(self):
+        os.makedirs(os.path.dirname(self.caminho) or ".", exist_ok=True)
+        conexao = sqlite3.connect(self.caminho, timeout=30)
+        conexao.executescript(_ESQUEMA)
+        return conexao
+
+    def gravar(self, registros, browser, ambiente=None):
+        """
+        EXPLICAÇÃO:
+        Grava uma execução inteira de uma vez (uma transação)
+
+        registros: {nodeid: {"setup": s, "call": s, "teardown": s,
+                             "resultado": "passed", "marcadores": [...],
+                             "navegador": "firefox"}}
+        browser: navegador dos registros que não dizem qual usaram
+        """
+        if not registros:
+            return None
+        conexao = self._conectar()
+        try:
+            with conexao:
+                execucao = conexao.execute(
+                    "INSERT INTO execucoes (inicio, ambiente) VALUES (?, ?)", (time.time(), ambiente)
+                ).lastrowid
+                conexao.executemany(
+                    "INSERT INTO duracoes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            execucao,
+                            nodeid,
+                            registro.get("navegador", browser),
+                            *(registro.get(fase, 0.0) for fase in FASES),
+                            registro.get("resultado", "passed"),
+                            ",".join(registro.get("marcadores", ())),
+                        )
+                        for nodeid, registro in registros.items()
+                    ],
+                )
+                conexao.execute(
+                    """
+                    DELETE FROM duracoes WHERE rowid IN (
+                        SELECT rowid FROM (
+                            SELECT rowid, ROW_NUMBER() OVER (PARTITION BY nodeid, browser ORDER BY execucao DESC) AS ordem
+                            FROM duracoes
+                        ) WHERE ordem > ?
+                    )
+                    """,
+                    (self.manter,),
+                )
+            return execucao
+        finally:
+            conexao.close()
+
+    def _ultimas(self, browser, janela):
+        """{nodeid: ([totais das últimas execuções, da mais velha à mais nova], marcadores)}"""
+        if not os.path.exists(self.caminho):
+            return {}
+        conexao = self._conectar()
+        try:
+            historico = {}
+            for nodeid, total, marcadores in conexao.execute(_ULTIMAS, (browser, janela)):
+                totais, _ = historico.setdefault(nodeid, ([], marcadores))
+                totais.append(total)
+                historico[nodeid] = (totais, marcadores)
+            return historico
+        finally:
+            conexao.close()
+
+    def medianas(self, browser):
+        """Mediana (setup + call + teardown) das últimas execuções que passaram: {nodeid: segundos}"""
+        return {
+            nodeid: statistics.median(totais)
+            for nodeid, (totais, _) in self._ultimas(browser, self.janela).items()
+        }
+
+    def regressoes(self, registros, browser, limite_pct=50, minimo_segundos=0.5):
+        """
+        EXPLICAÇÃO:
+        Testes desta execução que ficaram mais de limite_pct% mais lentos
+        que a própria mediana. Chamar ANTES de gravar a execução atual.
+        Testes muito rápidos (mediana < minimo_segundos) são ignorados:
+        neles, qualquer oscilação vira "regressão".
+        Cada teste é comparado com o histórico do próprio navegador.
+
+        Devolve [(nodeid, atual, mediana, percentual, marcadores)], piores primeiro
+        """
+        historicos = {}
+        encontradas = []
+        for nodeid, registro in registros.items():
+            navegador = registro.get("navegador", browser)
+            if navegador not in historicos:
+                historicos[navegador] = self._ultimas(navegador, self.janela)
+            historico = historicos[navegador]
+            if registro.get("resultado") != "passed" or nodeid not in historico:
+                continue
+            totais, _ = historico[nodeid]
+            mediana = statistics.median(totais)
+            if mediana < minimo_segundos:
+                continue
+            atual = sum(registro.get(fase, 0.0) for fase in FASES)
+            percentual = 100.0 * (atual - mediana) / mediana
+            if percentual > limite_pct:
+                encontradas.append((nodeid, atual, mediana, percentual, registro.get("marcadores", [])))
+        return sorted(encontradas, key=lambda regressao: regressao[3], reverse=True)
+
+    def tendencia(self, browser, limite=15):
+        """
+        EXPLICAÇÃO:
+        Os testes mais lentos (pela mediana) com as últimas durações,
+        para mostrar se estão melhorando ou piorando
+
+        Devolve [(nodeid, mediana, [últimas durações], marcadores)]
+        """
+        historico = self._ultimas(browser, self.janela)
+        linhas = [
+            (nodeid, statistics.median(totais), totais, [m for m in marcadores.split(",") if m])
+            for nodeid, (totais, marcadores) in historico.items()
+        ]
+        return sorted(linhas, key=lambda linha: linha[1], reverse=True)[:limite]
+
+    def tempo_por_marcador(self, browser):
+        """Soma das medianas por marcador (slow/smoke/critical_path): quanto custa cada grupo"""
+        somas = {}
+        for totais, marcadores in self._ultimas(browser, self.janela).values():
+            for marcador in (m for m in marcadores.split(",") if m):
+                somas[marcador] = somas.get(marcador, 0.0) + statistics.median(totais)
+        return somas
+
+
+def mini_grafico(valores):
+    """[1, 2, 8, 3] -> "▁▂█▃" (tendência das durações num texto curto)"""
+    barras = "▁▂▃▄▅▆▇█"
+    if not valores:
+        return ""
+    menor, maior = min(valores), max(valores)
+    faixa = (maior - menor) or 1.0
+    return "".join(barras[min(int((valor - menor) / faixa * len(barras)), len(barras) - 1)] for valor in valores)
@@ -0,0 +1,71 @@
+"""
+environment - Perfis de ambiente (para onde e como os testes rodam)
+
+EXPLICAÇÃO:
+Cada ambiente do arquivo config/ambientes.json define:
+- base_url: endereço do site ("local" sobe a cópia local)
+- timeout / timeout_curto: esperas padrão das páginas
+- navegador: headless e argumentos extras do Chrome
+- grid_url (opcional): Selenium Grid onde os navegadores sobem
+
+USO:
+    pytest --env=local
+    pytest --env=ci --env-file=outro_arquivo.json
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+
+ARQUIVO_AMBIENTES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "ambientes.json")
+
+
+@dataclass
+class Ambiente:
+    nome: str
+    base_url: str
+    timeout: float = 15
+    timeout_curto: float = 5
+    headless: bool = False
+    argumentos_navegador: list = field(default_factory=list)
+    descricao: str = ""
+    grid_url: str = None
+
+    def resumo(self):
+        """Dados do ambiente para o relatório"""
+        return {
+            "ambiente": self.nome,
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "timeout_curto": self.timeout_curto,
+            "headless": self.headless,
+        }
+
+
+def carregar_ambiente(nome=None, caminho=ARQUIVO_AMBIENTES):
+    """
+    EXPLICAÇÃO:
+    Lê o arquivo de ambientes e devolve o perfil pedido
+    (ou o perfil "padrao" do arquivo, se nenhum nome for passado)
+    """
+    with open(caminho, encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+
+    nome = nome or dados.get("padrao")
+    ambientes = dados.get("ambientes", {})
+    if nome not in ambientes:
+        disponiveis = ", ".join(sorted(ambientes))
+        raise ValueError(f"Ambiente '{nome}' não existe em {caminho} (disponíveis: {disponiveis})")
+
+    perfil = ambientes[nome]
+    navegador = perfil.get("navegador", {})
+    return Ambiente(
+        nome=nome,
+        base_url=perfil["base_url"],
+        timeout=perfil.get("timeout", 15),
+        timeout_curto=perfil.get("timeout_curto", 5),
+        headless=navegador.get("headless", False),
+        argumentos_navegador=list(navegador.get("argumentos", [])),
+        descricao=perfil.get("descricao", ""),
+        grid_url=perfil.get("grid_url"),
+    )
@@ -0,0 +1,283 @@
+"""
+event_channel - Eventos do navegador (WebDriver BiDi) sem ficar perguntando
+
+PROBLEMA:
+Para saber se a página trocou ou se a rede acalmou, o Python
+pergunta ao navegador de tempos em tempos (execute_script num laço).
+E quando um teste falha, não sabemos que requisições deram erro nem
+o que apareceu no console antes da falha.
+
+SOLUÇÃO:
+- Cada navegador abre um canal WebDriver BiDi (o protocolo de eventos
+  padrão: Chrome, Edge e Firefox, local ou no grid) e assina os eventos
+  de ciclo da página, de rede e de console
+- Os eventos chegam sozinhos e vão para um buffer circular (deque com
+  tamanho máximo): memória limitada, os mais antigos vão saindo
+- As esperas "assinam" o canal: dormem até o evento certo chegar
+  (threading.Condition), sem nenhuma ida ao navegador
+- O buffer é zerado a cada teste; na falha, os últimos N eventos vão
+  para o disco junto do screenshot (utils.artifacts, tipo "eventos")
+
+USO:
+    canal = conectar_canal(driver)          # driver criado com enable_bidi
+    cursor = canal.marcar()
+    driver.find_element(...).click()
+    canal.aguardar(("browsingContext.load",), desde=cursor, timeout=10)
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+from functools import partial
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.websocket_connection import WebSocketConnection
+
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+# Eventos assinados, por categoria
+EVENTOS_BIDI = {
+    "ciclo": (
+        "browsingContext.navigationStarted",
+        "browsingContext.domContentLoaded",
+        "browsingContext.load",
+    ),
+    "rede": (
+        "network.beforeRequestSent",
+        "network.responseCompleted",
+        "network.fetchError",
+    ),
+    "console": ("log.entryAdded",),
+}
+
+# Textos e URLs maiores que isso são cortados (memória do buffer limitada)
+TAMANHO_MAXIMO_TEXTO = 500
+
+# sequencia: ordem de chegada no canal (cursor das esperas)
+# instante: time.time() da chegada
+# tipo: nome BiDi do evento (ex: "network.responseCompleted")
+# dados: resumo do evento (url, status, texto...)
+Evento = namedtuple("Evento", ["sequencia", "instante", "tipo", "dados"])
+
+
+class _TipoEvento:
+    """O que o WebSocketConnection do Selenium espera em add_callback: nome e conversão"""
+
+    def __init__(self, nome):
+        self.event_class = nome
+
+    def from_json(self, parametros):
+        return parametros
+
+
+def _cortar(texto):
+    if isinstance(texto, str) and len(texto) > TAMANHO_MAXIMO_TEXTO:
+        return texto[:TAMANHO_MAXIMO_TEXTO] + "…"
+    return texto
+
+
+def resumir(tipo, parametros):
+    """
+    EXPLICAÇÃO:
+    Só o que interessa de cada evento (os eventos de rede vêm com
+    todos os cabeçalhos e tempos: guardar tudo encheria a memória)
+    """
+    if tipo.startswith("browsingContext."):
+        return {
+            "url": _cortar(parametros.get("url")),
+            "contexto": parametros.get("context"),
+            "navegacao": parametros.get("navigation"),
+        }
+    if tipo.startswith("network."):
+        requisicao = parametros.get("request") or {}
+        dados = {
+            "id": requisicao.get("request"),
+            "metodo": requisicao.get("method"),
+            "url": _cortar(requisicao.get("url")),
+            "navegacao": parametros.get("navigation"),
+        }
+        if tipo == "network.responseCompleted":
+            resposta = parametros.get("response") or {}
+            dados.update(status=resposta.get("status"), mime=resposta.get("mimeType"),
+                         bytes=resposta.get("bytesReceived"))
+        elif tipo == "network.fetchError":
+            dados["erro"] = parametros.get("errorText")
+        return dados
+    if tipo == "log.entryAdded":
+        return {
+            "nivel": parametros.get("level"),
+            "origem": parametros.get("type"),
+            "texto": _cortar(parametros.get("text")),
+        }
+    return {}
+
+
+class CanalEventos:
+    """
+    EXPLICAÇÃO:
+    Recebe os eventos de um navegador e guarda os últimos num buffer circular
+
+    PARÂMETROS:
+    - conexao: WebSocketConnection BiDi (do Selenium) do navegador
+    - capacidade: quantos eventos o buffer guarda
+    - categorias: quais categorias de EVENTOS_BIDI assinar
+    """
+
+    def __init__(self, conexao, capacidade=500, categorias=tuple(EVENTOS_BIDI)):
+        self.conexao = conexao
+        self.capacidade = capacidade
+        self.tipos = tuple(tipo for categoria in categorias for tipo in EVENTOS_BIDI[categoria])
+
+        self._buffer = deque(maxlen=max(1, capacidade))
+        self._condicao = threading.Condition()
+        self._sequencia = 0
+        self._pendentes = {}  # Requisições sem resposta ainda: {id: url}
+        self._ultima_atividade_rede = time.monotonic()
+        self._callbacks = []
+
+        self.recebidos = 0
+        self.descartados = 0
+
+    def assinar(self):
+        """Registra os callbacks e pede ao navegador para mandar os eventos"""
+        for tipo in self.tipos:
+            evento = _TipoEvento(tipo)
+            id_callback = self.conexao.add_callback(evento, partial(self.receber, tipo))
+            self._callbacks.append((evento, id_callback))
+        try:
+            self.conexao.execute(_comando("session.subscribe", {"events": list(self.tipos)}))
+        except WebDriverException as e:
+            self.encerrar()
+            raise WebDriverException(f"session.subscribe recusado: {e.msg}") from e
+        return self
+
+    def receber(self, tipo, parametros):
+        """Chamado (em outra thread) a cada evento que chega"""
+        dados = resumir(tipo, parametros or {})
+        with self._condicao:
+            self._sequencia += 1
+            if len(self._buffer) == self._buffer.maxlen:
+                self.descartados += 1
+            self._buffer.append(Evento(self._sequencia, time.time(), tipo, dados))
+            self.recebidos += 1
+            if tipo.startswith("network."):
+                self._ultima_atividade_rede = time.monotonic()
+                if tipo == "network.beforeRequestSent":
+                    self._pendentes[dados["id"]] = dados["url"]
+                else:
+                    self._pendentes.pop(dados["id"], None)
+            self._condicao.notify_all()
+
+    def marcar(self):
+        """Cursor: as esperas com "desde" só olham eventos que chegarem depois dele"""
+        with self._condicao:
+            return self._sequencia
+
+    def aguardar(self, tipos, desde=0, timeout=10, condicao=None):
+        """
+        EXPLICAÇÃO:
+        Dorme até chegar um evento de um dos "tipos" (depois do cursor
+        "desde" e que satisfaça "condicao"). Devolve o evento, ou None
+        se o tempo acabar. Quem acorda a espera é o próprio evento.
+        """
+        def _procurar():
+            for evento in self._buffer:
+                if evento.sequencia > desde and evento.tipo in tipos and (condicao is None or condicao(evento)):
+                    return evento
+            return None
+
+        with self._condicao:
+            return self._condicao.wait_for(_procurar, timeout)
+
+    def aguardar_rede_ociosa(self, janela_ms=500, timeout=10):
+        """
+        EXPLICAÇÃO:
+        Espera "janela_ms" sem nenhuma requisição pendente nem evento
+        de rede novo. Devolve False se o tempo acabar antes.
+        """
+        limite = time.monotonic() + timeout
+        janela = janela_ms / 1000
+        with self._condicao:
+            while True:
+                agora = time.monotonic()
+                sossego = agora - self._ultima_atividade_rede
+                if not self._pendentes and sossego >= janela:
+                    return True
+                if agora >= limite:
+                    return False
+                espera = janela - sossego if not self._pendentes else limite - agora
+                self._condicao.wait(max(0.001, min(espera, limite - agora)))
+
+    def pendentes(self):
+        """URLs das requisições que ainda não terminaram"""
+        with self._condicao:
+            return list(self._pendentes.values())
+
+    def eventos(self, desde=0, tipos=None, ultimos=None):
+        """Eventos do buffer como dicionários (para artefatos e asserts)"""
+        with self._condicao:
+            selecionados = [
+                evento for evento in self._buffer
+                if evento.sequencia > desde and (tipos is None or evento.tipo in tipos)
+            ]
+        if ultimos is not None:
+            selecionados = selecionados[-ultimos:] if ultimos else []
+        return [
+            {"seq": evento.sequencia, "instante": round(evento.instante, 3), "tipo": evento.tipo, **evento.dados}
+            for evento in selecionados
+        ]
+
+    def limpar(self):
+        """Começo de um teste novo: o buffer é só dele"""
+        with self._condicao:
+            self._buffer.clear()
+            self._pendentes.clear()
+            self._ultima_atividade_rede = time.monotonic()
+
+    def encerrar(self):
+        """Para de receber eventos (o navegador continua vivo)"""
+        for evento, id_callback in self._callbacks:
+            self.conexao.remove_callback(evento, id_callback)
+        self._callbacks = []
+
+    def estatisticas(self):
+        return {"eventos_recebidos": self.recebidos, "eventos_descartados": self.descartados}
+
+
+def _comando(metodo, parametros):
+    """Comando BiDi no formato do WebSocketConnection.execute (gerador: manda o pedido, recebe o resultado)"""
+    resultado = yield {"method": metodo, "params": parametros}
+    return resultado
+
+
+def conectar_canal(driver, capacidade=500, timeout=30, intervalo=0.1):
+    """
+    EXPLICAÇÃO:
+    Liga o canal de eventos num driver criado com enable_bidi.
+    A conexão BiDi é a mesma que o Selenium usa (driver.script,
+    driver.network...) e é fechada por ele no quit().
+    Navegador sem BiDi: avisa e devolve None (as páginas voltam
+    às esperas por script).
+    """
+    url = getattr(driver, "capabilities", {}).get("webSocketUrl")
+    if not isinstance(url, str):
+        log.aviso("⚠️ Navegador sem WebDriver BiDi (capability webSocketUrl não veio na sessão): sem canal de eventos")
+        return None
+    try:
+        conexao = getattr(driver, "_websocket_connection", None)
+        if conexao is None:
+            conexao = WebSocketConnection(url, timeout, intervalo)
+            driver._websocket_connection = conexao
+        canal = CanalEventos(conexao, capacidade).assinar()
+    except Exception as e:
+        log.aviso("⚠️ Canal de eventos indisponível, esperas voltam aos scripts (%s: %s)", type(e).__name__, e)
+        return None
+    driver.canal_eventos = canal
+    return canal
+
+
+def canal_do_driver(driver):
+    """Canal de eventos do driver (None se ele não tiver um)"""
+    return getattr(driver, "canal_eventos", None)
@@ -0,0 +1,341 @@
+"""
+impact - Roda só os testes afetados por uma mudança (seleção por impacto)
+
+PROBLEMA:
+Mexer em pages/login_page.py não deveria exigir rodar os testes de
+exploração do Google. Mas ninguém mantém à mão uma lista de "qual
+teste usa qual página" - e ela ficaria desatualizada.
+
+SOLUÇÃO:
+1. Durante os testes, a BasePage anota quais páginas e quais locators
+   cada teste usou de verdade (mapa em reports/mapa_impacto.json)
+2. Com --impacted, o git diff diz o que mudou:
+   - arquivo de teste alterado -> roda os testes daquele arquivo
+   - página alterada -> roda quem usou a página
+   - só constantes de locator alteradas -> roda quem usou aqueles locators
+   - testes que não estão no mapa (novos) -> rodam sempre
+3. Na dúvida, roda tudo: sem mapa, sem git, mudança em conftest,
+   utils/, configuração, dados de teste, em módulo de pages/ sem classe
+   (ex: pages/scripts.py) ou em página que nenhum teste do mapa usou
+
+CUSTO:
+Sem teste rodando, registrar é só um "if". Com teste, é um add num set.
+"""
+
+import ast
+import contextvars
+import fnmatch
+import inspect
+import json
+import os
+import re
+import subprocess
+from collections import namedtuple
+
+from utils.parallel import nodeid_sem_grupo
+
+ARQUIVO_MAPA = os.path.join("reports", "mapa_impacto.json")
+
+# Mudanças que não alteram o comportamento dos testes
+IGNORADOS = ("*.md", "LICENSE", ".gitignore", ".github/*", "reports/*")
+
+# arquivos_teste: arquivos de teste alterados
+# paginas: páginas alteradas por inteiro
+# locators: locators alterados ("pages/login_page.py::CAMPO_USERNAME")
+# motivo_completo: por que rodar tudo (None = seleção por impacto)
+Analise = namedtuple("Analise", ["arquivos_teste", "paginas", "locators", "motivo_completo"])
+
+# Registro do teste que está rodando agora (None = não registra nada).
+# ContextVar: fluxos async rodando juntos (utils.async_flows) têm cada um o seu
+_registro_atual = contextvars.ContextVar("registro_impacto", default=None)
+
+# {classe: {locator: nome}} para não procurar o nome do locator toda vez
+_nomes_de_locators = {}
+
+
+def iniciar_registro():
+    """Começa a anotar o que o novo teste usa (devolve o conjunto de anotações)"""
+    registro = set()
+    _registro_atual.set(registro)
+    return registro
+
+
+def encerrar_registro(raiz):
+    """
+    EXPLICAÇÃO:
+    Para de anotar e devolve o que o teste usou:
+    {"arquivos": [páginas, com as classes-base], "locators": [...]}
+    Caminhos relativos a "raiz" (a raiz do projeto)
+    """
+    registro = _registro_atual.get()
+    _registro_atual.set(None)
+    arquivos, locators = set(), set()
+    for entrada in registro or ():
+        if entrada[0] == "pagina":
+            for classe in entrada[1].__mro__:
+                arquivo = _arquivo_do_projeto(classe, raiz)
+                if arquivo:
+                    arquivos.add(arquivo)
+        else:
+            locators.add(entrada[1])
+    return {"arquivos": sorted(arquivos), "locators": sorted(_relativos(locators, raiz))}
+
+
+def incorporar_registro(entradas):
+    """Junta ao teste atual o que foi anotado em outro registro (ex: um fluxo async)"""
+    registro = _registro_atual.get()
+    if registro is not None:
+        registro.update(entradas or ())
+
+
+def registrar_pagina(classe):
+    registro = _registro_atual.get()
+    if registro is not None:
+        registro.add(("pagina", classe))
+
+
+def registrar_locator(classe, locator):
+    """Anota o locator pelo nome da constante (ex: CAMPO_USERNAME), se ele tiver uma"""
+    registro = _registro_atual.get()
+    if registro is None:
+        return
+    nome = _nome_do_locator(classe, locator)
+    if nome:
+        registro.add(("locator", nome))
+
+
+def _nome_do_locator(classe, locator):
+    """(arquivo absoluto, NOME) da constante de classe que guarda este locator"""
+    nomes = _nomes_de_locators.get(classe)
+    if nomes is None:
+        nomes = {}
+        for definidora in reversed(classe.__mro__):
+            for atributo, valor in vars(definidora).items():
+                if isinstance(valor, tuple) and len(valor) == 2 and atributo.isupper():
+                    try:
+                        nomes[valor] = (inspect.getsourcefile(definidora), atributo)
+                    except TypeError:
+                        pass  # Classe sem arquivo (criada dinamicamente)
+        _nomes_de_locators[classe] = nomes
+    try:
+        return nomes.get(tuple(locator))
+    except TypeError:
+        return None
+
+
+def _relativos(locators, raiz):
+    return {f"{_relativo(arquivo, raiz)}::{nome}" for arquivo, nome in locators}
+
+
+def _relativo(arquivo, raiz):
+    return os.path.relpath(arquivo, raiz).replace(os.sep, "/")
+
+
+def _arquivo_do_projeto(classe, raiz):
+    """Arquivo da classe, se for do projeto (selenium, object etc. ficam de fora)"""
+    try:
+        arquivo = inspect.getsourcefile(classe)
+    except TypeError:
+        return None
+    if not arquivo:
+        return None
+    relativo = _relativo(arquivo, raiz)
+    if relativo.startswith("..") or "site-packages" in relativo:
+        return None
+    return relativo
+
+
+def carregar_mapa(caminho=ARQUIVO_MAPA):
+    """{nodeid: {"arquivos": [...], "locators": [...]}} das execuções anteriores"""
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return {}
+
+
+def salvar_mapa(novos, caminho=ARQUIVO_MAPA):
+    """Atualiza o mapa com os testes desta execução (os outros ficam como estavam)"""
+    mapa = carregar_mapa(caminho)
+    mapa.update(novos)
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(mapa, arquivo, indent=2, sort_keys=True)
+    os.replace(temporario, caminho)
+
+
+def _git(raiz, *argumentos):
+    return subprocess.run(
+        ["git", *argumentos], cwd=raiz, capture_output=True, text=True, check=True, timeout=60
+    ).stdout
+
+
+def linhas_alteradas(ref, raiz):
+    """
+    EXPLICAÇÃO:
+    Arquivos alterados desde "ref" (commits + mudanças não commitadas + arquivos novos):
+    {arquivo: conjunto de linhas alteradas no arquivo novo, ou None se
+    houve remoção de linhas/arquivo (não dá para apontar a linha)}
+
+    Com uma branch (ex: origin/main), compara com o ponto onde ela e o HEAD se separaram.
+    """
+    topo = _git(raiz, "rev-parse", "--show-toplevel").strip()
+    try:
+        base = _git(topo, "merge-base", ref, "HEAD").strip()
+    except subprocess.CalledProcessError:
+        base = ref
+
+    alterados = {}
+    arquivo = None
+    no_cabecalho = False  # "--- " e "+++ " só são nomes de arquivo antes do primeiro "@@"
+    for linha in _git(topo, "diff", "--no-renames", "-U0", base, "--").splitlines():
+        if linha.startswith("diff --git "):
+            no_cabecalho, arquivo = True, None
+        elif no_cabecalho and linha.startswith("--- "):
+            arquivo = linha[6:] if linha.startswith("--- a/") else None
+        elif no_cabecalho and linha.startswith("+++ "):
+            if linha.startswith("+++ b/"):
+                arquivo = linha[6:]
+            alterados.setdefault(arquivo, set())
+        elif linha.startswith("@@") and arquivo is not None:
+            no_cabecalho = False
+            trecho = re.match(r"@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", linha)
+            removidas = int(trecho.group(1) or 1)
+            inicio, quantidade = int(trecho.group(2)), int(trecho.group(3) or 1)
+            if removidas and not quantidade or alterados[arquivo] is None:
+                alterados[arquivo] = None
+            else:
+                alterados[arquivo].update(range(inicio, inicio + quantidade))
+
+    # Arquivos binários (sem linhas no diff) e arquivos novos ainda fora do git
+    for outro in _git(topo, "diff", "--no-renames", "--name-only", base, "--").splitlines():
+        alterados.setdefault(outro, None)
+    for novo in _git(topo, "ls-files", "--others", "--exclude-standard").splitlines():
+        alterados.setdefault(novo, None)
+
+    return {_relativo(os.path.join(topo, arquivo), raiz): linhas for arquivo, linhas in alterados.items()}
+
+
+def _eh_locator(valor):
+    """(By.ALGUMA_COISA, ...) - outras tuplas (ex: RESULTADOS_SUCESSO) são lógica da página"""
+    return (
+        isinstance(valor, ast.Tuple) and len(valor.elts) == 2
+        and isinstance(valor.elts[0], ast.Attribute)
+        and isinstance(valor.elts[0].value, ast.Name) and valor.elts[0].value.id == "By"
+    )
+
+
+def locators_alterados(caminho, linhas, relativo):
+    """
+    EXPLICAÇÃO:
+    Se TODAS as linhas alteradas de uma página são constantes de
+    locator (CAMPO = (By.ID, "x")), devolve os nomes delas.
+    Só conta como locator a tupla de dois itens que começa com By.*
+    Qualquer outra mudança (métodos, imports...) devolve None:
+    a página inteira conta como alterada.
+    """
+    if not linhas:
+        return None
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            arvore = ast.parse(arquivo.read())
+    except (OSError, SyntaxError):
+        return None
+
+    constantes = {}
+    for classe in (no for no in arvore.body if isinstance(no, ast.ClassDef)):
+        for no in classe.body:
+            if (isinstance(no, ast.Assign) and len(no.targets) == 1 and isinstance(no.targets[0], ast.Name)
+                    and _eh_locator(no.value)):
+                for numero in range(no.lineno, no.end_lineno + 1):
+                    constantes[numero] = f"{relativo}::{no.targets[0].id}"
+
+    if not all(numero in constantes for numero in linhas):
+        return None
+    return {constantes[numero] for numero in linhas}
+
+
+def _define_classe(caminho):
+    """
+    Módulos de pages/ sem classe (scripts.py, __init__.py) não entram no
+    __mro__ de página nenhuma: o mapa nunca liga um teste a eles
+    """
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            arvore = ast.parse(arquivo.read())
+    except OSError:
+        return True  # Arquivo removido: quem usava a página continua no mapa
+    except SyntaxError:
+        return False
+    return any(isinstance(no, ast.ClassDef) for no in arvore.body)
+
+
+def analisar_mudancas(ref, raiz):
+    """Classifica o que mudou desde "ref" (ver Analise)"""
+    try:
+        alterados = linhas_alteradas(ref, raiz)
+    except (OSError, subprocess.SubprocessError) as e:
+        return Analise(set(), set(), set(), f"git diff falhou ({e.__class__.__name__})")
+
+    arquivos_teste, paginas, locators = set(), set(), set()
+    for arquivo, linhas in sorted(alterados.items()):
+        if any(fnmatch.fnmatch(arquivo, padrao) for padrao in IGNORADOS):
+            continue
+        nome = os.path.basename(arquivo)
+        if arquivo.startswith("tests/") and nome.startswith("test_") and nome.endswith(".py"):
+            arquivos_teste.add(arquivo)
+        elif arquivo.startswith("pages/") and nome.endswith(".py"):
+            if not _define_classe(os.path.join(raiz, arquivo)):
+                return Analise(set(), set(), set(), f"{arquivo} alterado")
+            nomes = locators_alterados(os.path.join(raiz, arquivo), linhas, arquivo)
+            if nomes is None:
+                paginas.add(arquivo)
+            else:
+                locators.update(nomes)
+        else:
+            return Analise(set(), set(), set(), f"{arquivo} alterado")
+    return Analise(arquivos_teste, paginas, locators, None)
+
+
+def conferir_mapa(analise, mapa):
+    """
+    EXPLICAÇÃO:
+    Página alterada que nenhum teste do mapa usou não dá para ligar a
+    teste nenhum (ex: um componente usado por composição, fora do
+    __mro__). Na dúvida, a análise passa a mandar rodar tudo.
+    """
+    if analise.motivo_completo:
+        return analise
+    usados = {arquivo for usado in mapa.values() for arquivo in usado.get("arquivos", ())}
+    alterados = analise.paginas | {locator.split("::")[0] for locator in analise.locators}
+    fora_do_mapa = sorted(alterados - usados)
+    if fora_do_mapa:
+        return analise._replace(motivo_completo=f"{fora_do_mapa[0]} alterado (nenhum teste do mapa usa)")
+    return analise
+
+
+def selecionar(items, mapa, analise):
+    """
+    EXPLICAÇÃO:
+    Separa os testes em (afetados, não afetados).
+    Teste sem registro no mapa conta como afetado.
+    Se a análise (conferida com o mapa) manda rodar tudo, todos são afetados.
+    """
+    if conferir_mapa(analise, mapa).motivo_completo:
+        return list(items), []
+    afetados, nao_afetados = [], []
+    for item in items:
+        nodeid = nodeid_sem_grupo(item.nodeid)
+        usado = mapa.get(nodeid)
+        arquivo_teste = nodeid.split("::")[0]
+        if (
+            usado is None
+            or arquivo_teste in analise.arquivos_teste
+            or analise.paginas.intersection(usado.get("arquivos", ()))
+            or analise.locators.intersection(usado.get("locators", ()))
+        ):
+            afetados.append(item)
+        else:
+            nao_afetados.append(item)
+    return afetados, nao_afetados
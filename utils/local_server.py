@@ -0,0 +1,252 @@
+"""
+local_server - Cópia local das páginas de login do the-internet.herokuapp.com
+
+PROBLEMA:
+Os testes dependem da internet (latência, instabilidade) e não rodam
+em máquinas sem acesso externo.
+
+SOLUÇÃO:
+Um servidor HTTP pequeno, sem dependências, que reproduz a home,
+o login, a área segura e o logout com o mesmo HTML e as mesmas
+mensagens "flash". Sobe numa porta livre e roda numa thread.
+
+USO:
+    servidor = ServidorLocal().iniciar()
+    print(servidor.url)   # http://127.0.0.1:54321
+    servidor.parar()
+"""
+
+import html
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+USUARIO_VALIDO = "tomsmith"
+SENHA_VALIDA = "SuperSecretPassword!"
+COOKIE_SESSAO = "rack.session"
+
+MODELO = """<!DOCTYPE html>
+<html class="no-js" lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>The Internet</title>
+</head>
+<body>
+  <div class="row">
+    <div id="flash-messages" class="large-12 columns">{flash}</div>
+  </div>
+  <div class="row">
+    <div id="content" class="large-12 columns">
+{conteudo}
+    </div>
+  </div>
+  <div id="page-footer" class="row">
+    <div class="large-4 large-centered columns">
+      <hr>
+      <div style="text-align: center;">Powered by <a target="_blank" href="http://elementalselenium.com/">Elemental Selenium</a></div>
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+FLASH = """
+      <div data-alert id="flash" class="flash {tipo}">
+        {mensagem}
+        <a href="#" class="close">×</a>
+      </div>"""
+
+PAGINA_HOME = """
+      <h1 class="heading">Welcome to the-internet</h1>
+      <h2>Available Examples</h2>
+      <ul>
+        <li><a href="/login">Form Authentication</a></li>
+      </ul>"""
+
+PAGINA_LOGIN = """
+      <div class="example">
+        <h2>Login Page</h2>
+        <h4 class="subheader">This is where you can log into the secure area. Enter <em>tomsmith</em> for the username and <em>SuperSecretPassword!</em> for the password. If the information is wrong you should see error messages.</h4>
+        <form name="login" id="login" action="/authenticate" method="post">
+          <div class="row">
+            <div class="large-6 small-12 columns">
+              <label for="username">Username</label>
+              <input type="text" name="username" id="username">
+            </div>
+          </div>
+          <div class="row">
+            <div class="large-6 small-12 columns">
+              <label for="password">Password</label>
+              <input type="password" name="password" id="password">
+            </div>
+          </div>
+          <button class="radius" type="submit"><i class="fa fa-2x fa-sign-in"> Login</i></button>
+        </form>
+      </div>"""
+
+PAGINA_SEGURA = """
+      <div class="example">
+        <h2><i class="icon-lock"></i> Secure Area</h2>
+        <h4 class="subheader">Welcome to the Secure Area. When you are done click logout below.</h4>
+        <a class="button secondary radius" href="/logout"><i class="icon-2x icon-signout"> Logout</i></a>
+      </div>"""
+
+
+class _Sessoes:
+    """Sessões em memória: {id: {"logado": bool, "flash": (tipo, mensagem)}}"""
+
+    def __init__(self):
+        self._dados = {}
+        self._lock = threading.Lock()
+
+    def obter(self, id_sessao):
+        with self._lock:
+            if id_sessao not in self._dados:
+                id_sessao = secrets.token_hex(16)
+                self._dados[id_sessao] = {"logado": False, "flash": None}
+            return id_sessao, self._dados[id_sessao]
+
+
+class _Manipulador(BaseHTTPRequestHandler):
+    """Responde às rotas do site (uma instância por requisição)"""
+
+    server_version = "ServidorLocal/1.0"
+
+    def do_GET(self):
+        rotas = {
+            "/": self._home,
+            "/login": self._login,
+            "/secure": self._secure,
+            "/logout": self._logout,
+        }
+        rota = rotas.get(self.path.split("?")[0])
+        if rota is None:
+            self._responder(404, "<h1>Not Found</h1>")
+            return
+        rota()
+
+    def do_POST(self):
+        if self.path.split("?")[0] != "/authenticate":
+            self._responder(404, "<h1>Not Found</h1>")
+            return
+        self._authenticate()
+
+    def log_message(self, formato, *args):
+        pass  # Silencioso: o log de cada requisição só atrapalharia a saída do pytest
+
+    # --- rotas ---
+
+    def _home(self):
+        self._responder(200, self._pagina(PAGINA_HOME))
+
+    def _login(self):
+        self._responder(200, self._pagina(PAGINA_LOGIN))
+
+    def _secure(self):
+        if not self.sessao["logado"]:
+            self.sessao["flash"] = ("error", "You must login to view the secure area!")
+            self._redirecionar("/login")
+            return
+        self._responder(200, self._pagina(PAGINA_SEGURA))
+
+    def _logout(self):
+        self.sessao["logado"] = False
+        self.sessao["flash"] = ("success", "You logged out of the secure area!")
+        self._redirecionar("/login")
+
+    def _authenticate(self):
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        campos = parse_qs(self.rfile.read(tamanho).decode("utf-8"), keep_blank_values=True)
+        usuario = campos.get("username", [""])[0]
+        senha = campos.get("password", [""])[0]
+
+        if usuario != USUARIO_VALIDO:
+            self.sessao["flash"] = ("error", "Your username is invalid!")
+            self._redirecionar("/login")
+        elif senha != SENHA_VALIDA:
+            self.sessao["flash"] = ("error", "Your password is invalid!")
+            self._redirecionar("/login")
+        else:
+            self.sessao["logado"] = True
+            self.sessao["flash"] = ("success", "You logged into a secure area!")
+            self._redirecionar("/secure")
+
+    # --- auxiliares ---
+
+    @property
+    def sessao(self):
+        if not hasattr(self, "_sessao"):
+            cookies = SimpleCookie(self.headers.get("Cookie", ""))
+            recebido = cookies[COOKIE_SESSAO].value if COOKIE_SESSAO in cookies else None
+            self._id_sessao, self._sessao = self.server.sessoes.obter(recebido)
+        return self._sessao
+
+    def _pagina(self, conteudo):
+        flash, self.sessao["flash"] = self.sessao["flash"], None
+        bloco_flash = ""
+        if flash:
+            tipo, mensagem = flash
+            bloco_flash = FLASH.format(tipo=tipo, mensagem=html.escape(mensagem))
+        return MODELO.format(flash=bloco_flash, conteudo=conteudo)
+
+    def _cabecalho_sessao(self):
+        self.sessao  # Garante que a sessão exista antes de responder
+        self.send_header("Set-Cookie", f"{COOKIE_SESSAO}={self._id_sessao}; Path=/; HttpOnly")
+
+    def _responder(self, status, corpo):
+        dados = corpo.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html;charset=utf-8")
+        self.send_header("Content-Length", str(len(dados)))
+        self._cabecalho_sessao()
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def _redirecionar(self, destino):
+        self.send_response(302)
+        self.send_header("Location", destino)
+        self.send_header("Content-Length", "0")
+        self._cabecalho_sessao()
+        self.end_headers()
+
+
+class ServidorLocal:
+    """
+    EXPLICAÇÃO:
+    Liga e desliga a cópia local do site.
+    Porta 0 = o sistema operacional escolhe uma porta livre.
+    """
+
+    def __init__(self, host="127.0.0.1", porta=0):
+        self.host = host
+        self.porta = porta
+        self._servidor = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.porta}"
+
+    def iniciar(self):
+        self._servidor = ThreadingHTTPServer((self.host, self.porta), _Manipulador)
+        self._servidor.daemon_threads = True
+        self._servidor.sessoes = _Sessoes()
+        self.porta = self._servidor.server_address[1]
+
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        log.info("🏠 Site local no ar em %s", self.url)
+        return self
+
+    def parar(self):
+        if self._servidor:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
+            log.info("🏠 Site local desligado")
@@ -0,0 +1,234 @@
+"""
+logger - Log estruturado e silencioso das páginas e utilitários
+
+PROBLEMA:
+Cada ação da BasePage (encontrar, clicar, digitar...) fazia um print.
+Com milhares de ações e o xdist capturando a saída, isso é I/O e
+memória gastos à toa: quase ninguém lê o log de um teste que passou.
+
+SOLUÇÃO:
+- Níveis: debug (cada ação), info (passos), aviso, erro
+- Formatação preguiçosa: log.debug("Clicou em: %s", locator) só monta
+  o texto se alguém for ler
+- Cada teste tem um buffer em memória (com limite) com as linhas
+  ainda cruas: só viram texto se o teste falhar, no relatório
+- Modo padrão silencioso: emitir uma linha é um append num deque
+- Contexto do teste em cada linha: nodeid, worker e navegador
+- Saída JSON Lines opcional (--log-jsonl) para analisar depois
+
+USO:
+    from utils.logger import obter_logger
+    log = obter_logger(__name__)
+    log.debug("🖱️ Clicou em: %s", locator)
+    log.aviso("⚠️ Fila cheia: %s", nome, descartados=3)   # campos extras vão para o JSONL
+"""
+
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+AVISO = 30
+ERRO = 40
+SILENCIOSO = 100
+
+NIVEIS = {"debug": DEBUG, "info": INFO, "aviso": AVISO, "erro": ERRO, "silencioso": SILENCIOSO}
+_NOMES = {valor: nome for nome, valor in NIVEIS.items()}
+
+
+class ContextoTeste:
+    """
+    EXPLICAÇÃO:
+    O teste que está rodando: identificação e o buffer das suas linhas.
+    Cada linha é guardada crua: (instante, nível, logger, mensagem, args, campos)
+    """
+
+    __slots__ = ("nodeid", "campos", "linhas")
+
+    def __init__(self, nodeid, capacidade, **campos):
+        self.nodeid = nodeid
+        self.campos = campos
+        self.linhas = deque(maxlen=capacidade)
+
+
+class _Configuracao:
+    nivel_console = SILENCIOSO
+    nivel_saida = SILENCIOSO  # Menor nível que vai para algum lugar além do buffer
+    capacidade = 1000
+    worker = "principal"
+    arquivo = None  # JSON Lines aberto (None = sem saída em arquivo)
+    lock = threading.Lock()
+
+
+_configuracao = _Configuracao()
+
+# Teste atual (None = fora de um teste). ContextVar: fluxos async têm cada um o seu
+_teste_atual = contextvars.ContextVar("teste_atual_log", default=None)
+
+
+class Logger:
+    """Um logger por módulo (obter_logger(__name__)); não guarda nada além do nome"""
+
+    __slots__ = ("nome",)
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def _emitir(self, nivel, mensagem, args, campos):
+        contexto = _teste_atual.get()
+        publicar = nivel >= _configuracao.nivel_saida
+        if contexto is None and not publicar:
+            return
+        linha = (time.time(), nivel, self.nome, mensagem, args, campos)
+        if contexto is not None:
+            contexto.linhas.append(linha)
+        if publicar:
+            _publicar(contexto, linha)
+
+    def debug(self, mensagem, *args, **campos):
+        self._emitir(DEBUG, mensagem, args, campos)
+
+    def info(self, mensagem, *args, **campos):
+        self._emitir(INFO, mensagem, args, campos)
+
+    def aviso(self, mensagem, *args, **campos):
+        self._emitir(AVISO, mensagem, args, campos)
+
+    def erro(self, mensagem, *args, **campos):
+        self._emitir(ERRO, mensagem, args, campos)
+
+
+_loggers = {}
+
+
+def obter_logger(nome):
+    """O logger de um módulo (sempre o mesmo objeto para o mesmo nome)"""
+    if nome not in _loggers:
+        _loggers[nome] = Logger(nome)
+    return _loggers[nome]
+
+
+def interpretar_nivel(texto):
+    """ "aviso" -> 30 (erro para nível desconhecido)"""
+    nivel = NIVEIS.get((texto or "").strip().lower())
+    if nivel is None:
+        raise ValueError(f"Nível de log desconhecido: {texto!r} (disponíveis: {', '.join(NIVEIS)})")
+    return nivel
+
+
+def configurar(nivel_console="silencioso", capacidade=1000, arquivo_jsonl=None, worker="principal"):
+    """
+    EXPLICAÇÃO:
+    Liga as saídas do processo:
+    - nivel_console: a partir de qual nível as linhas aparecem na hora
+      (na saída capturada do pytest, ou no terminal com -s)
+    - capacidade: quantas linhas cada teste guarda para o caso de falhar
+    - arquivo_jsonl: todas as linhas, de todos os níveis, em JSON Lines
+    """
+    encerrar()
+    _configuracao.nivel_console = interpretar_nivel(nivel_console)
+    _configuracao.capacidade = capacidade
+    _configuracao.worker = worker
+    if arquivo_jsonl:
+        os.makedirs(os.path.dirname(arquivo_jsonl) or ".", exist_ok=True)
+        _configuracao.arquivo = open(arquivo_jsonl, "a", encoding="utf-8")
+    _configuracao.nivel_saida = DEBUG if _configuracao.arquivo else _configuracao.nivel_console
+
+
+def encerrar():
+    """Fecha o arquivo JSON Lines (fim da sessão)"""
+    with _configuracao.lock:
+        if _configuracao.arquivo is not None:
+            _configuracao.arquivo.close()
+            _configuracao.arquivo = None
+    _configuracao.nivel_saida = _configuracao.nivel_console
+
+
+def arquivo_do_worker(caminho, worker):
+    """ "reports/log.jsonl" no worker gw1 -> "reports/log.gw1.jsonl" (cada processo no seu arquivo)"""
+    if worker == "principal":
+        return caminho
+    base, extensao = os.path.splitext(caminho)
+    return f"{base}.{worker}{extensao}"
+
+
+def iniciar_teste(nodeid, **campos):
+    """Começa o buffer de um novo teste (campos: navegador, ...)"""
+    contexto = ContextoTeste(nodeid, _configuracao.capacidade, **campos)
+    _teste_atual.set(contexto)
+    return contexto
+
+
+def encerrar_teste():
+    """Fim do teste: devolve o contexto dele (com o buffer)"""
+    contexto = _teste_atual.get()
+    _teste_atual.set(None)
+    return contexto
+
+
+def teste_atual():
+    return _teste_atual.get()
+
+
+def anotar_contexto(**campos):
+    """Acrescenta campos ao contexto do teste atual (ex: navegador, descoberto pela fixture)"""
+    contexto = _teste_atual.get()
+    if contexto is not None:
+        contexto.campos.update(campos)
+
+
+def incorporar_linhas(linhas):
+    """Junta no teste atual linhas registradas em outro contexto (ex: fluxo do lote assíncrono)"""
+    contexto = _teste_atual.get()
+    if contexto is not None:
+        contexto.linhas.extend(linhas)
+
+
+def formatar_mensagem(mensagem, args):
+    """A formatação preguiçosa acontece aqui (e só aqui)"""
+    if not args:
+        return mensagem
+    try:
+        return mensagem % args
+    except (TypeError, ValueError):
+        return f"{mensagem} {args!r}"
+
+
+def formatar_linhas(contexto):
+    """As linhas do teste como texto (para o relatório de uma falha)"""
+    if contexto is None:
+        return ""
+    return "\n".join(
+        f"{time.strftime('%H:%M:%S', time.localtime(instante))}.{int(instante * 1000) % 1000:03d} "
+        f"{_NOMES[nivel].upper():<6} {nome}: {formatar_mensagem(mensagem, args)}"
+        for instante, nivel, nome, mensagem, args, _ in contexto.linhas
+    )
+
+
+def _publicar(contexto, linha):
+    """Saídas imediatas: console (nivel_console) e JSON Lines (todas as linhas)"""
+    instante, nivel, nome, mensagem, args, campos = linha
+    texto = formatar_mensagem(mensagem, args)
+    if nivel >= _configuracao.nivel_console:
+        sys.stdout.write(texto + "\n")
+    arquivo = _configuracao.arquivo
+    if arquivo is None:
+        return
+    registro = {
+        "instante": round(instante, 3),
+        "nivel": _NOMES[nivel],
+        "logger": nome,
+        "mensagem": texto,
+        "worker": _configuracao.worker,
+        "nodeid": contexto.nodeid if contexto is not None else None,
+        **(contexto.campos if contexto is not None else {}),
+        **campos,
+    }
+    with _configuracao.lock:
+        if _configuracao.arquivo is not None:
+            _configuracao.arquivo.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
@@ -0,0 +1,177 @@
+"""
+page_metrics - Métricas de carregamento de cada página e orçamentos
+
+PROBLEMA:
+A suíte passa pelas mesmas páginas em todo build, mas só anotamos a
+URL. Se o login começar a demorar o dobro para carregar, ou a baixar
+3 MB a mais, ninguém fica sabendo até um usuário reclamar.
+
+SOLUÇÃO:
+- A cada navegação, a BasePage lê do próprio navegador (Navigation
+  Timing, Paint Timing, LCP e Resource Timing): tempo até o primeiro
+  byte, DOM pronto, load, primeira pintura, LCP, requisições e bytes
+- As medidas ficam anotadas por página (LoginPage, HomePage...) e por teste
+- Cada página pode declarar orçamentos na classe:
+      class LoginPage(BasePage):
+          LOAD_BUDGET_MS = 3000
+  Estourou: aviso ou falha do teste (--budget=warn|fail)
+- No fim, cada navegação vira uma linha de um JSONL que só cresce
+  (reports/metricas_paginas.jsonl): a série temporal entre builds
+
+CUSTO:
+Um execute_script por navegação (e só com --page-metrics ou orçamento
+declarado). Sem coleta ativa, anotar é só um "if".
+
+LIMITES:
+Recursos de outros domínios sem Timing-Allow-Origin aparecem com 0 bytes.
+Firefox e navegadores antigos podem não ter LCP (fica None).
+"""
+
+import json
+import os
+import statistics
+import time
+
+ARQUIVO_SERIE = os.path.join("reports", "metricas_paginas.jsonl")
+
+METRICAS = (
+    "ttfb_ms",
+    "dom_pronto_ms",
+    "carregamento_ms",
+    "primeira_pintura_ms",
+    "fcp_ms",
+    "lcp_ms",
+    "requisicoes",
+    "bytes_transferidos",
+)
+
+# Atributo de orçamento na página -> (métrica, quanto vale uma unidade do orçamento)
+ORCAMENTOS = {
+    "LOAD_BUDGET_MS": ("carregamento_ms", 1),
+    "LCP_BUDGET_MS": ("lcp_ms", 1),
+    "TRANSFER_BUDGET_KB": ("bytes_transferidos", 1024),
+    "REQUEST_BUDGET": ("requisicoes", 1),
+}
+
+MODOS_ORCAMENTO = ("warn", "fail", "off")
+
+# Variáveis de ambiente do CI que identificam o build (a primeira que existir)
+VARIAVEIS_BUILD = ("BUILD_ID", "GITHUB_RUN_ID", "CI_PIPELINE_ID", "BUILD_NUMBER")
+
+# Navegações do teste que está rodando agora (None = não anota nada)
+_coleta_atual = None
+
+
+class OrcamentoExcedido(AssertionError):
+    """Página acima do orçamento com --budget=fail (o teste falha como num assert)"""
+
+
+def iniciar_coleta():
+    """Começa a anotar as navegações de um novo teste"""
+    global _coleta_atual
+    _coleta_atual = []
+    return _coleta_atual
+
+
+def encerrar_coleta():
+    """Para de anotar e devolve as navegações do teste que terminou"""
+    global _coleta_atual
+    coleta, _coleta_atual = _coleta_atual, None
+    return coleta or []
+
+
+def orcamentos_da_pagina(classe):
+    """Orçamentos declarados na classe da página (ou herdados): {atributo: limite}"""
+    return {
+        atributo: getattr(classe, atributo)
+        for atributo in ORCAMENTOS
+        if getattr(classe, atributo, None) is not None
+    }
+
+
+def verificar_orcamentos(classe, metricas):
+    """
+    EXPLICAÇÃO:
+    Compara as métricas com os orçamentos da página.
+    Métrica que o navegador não mediu (None) não estoura nada.
+
+    Devolve [(atributo, métrica, valor, limite na unidade da métrica)]
+    """
+    estouros = []
+    for atributo, limite in orcamentos_da_pagina(classe).items():
+        metrica, unidade = ORCAMENTOS[atributo]
+        valor = metricas.get(metrica)
+        if valor is not None and valor > limite * unidade:
+            estouros.append((atributo, metrica, valor, limite * unidade))
+    return estouros
+
+
+def descrever_estouros(estouros):
+    return "; ".join(f"{metrica} {valor} > {limite} ({atributo})" for atributo, metrica, valor, limite in estouros)
+
+
+def registrar_navegacao(pagina, metricas, estouros=()):
+    """Anota uma navegação medida no teste atual (se houver coleta ativa)"""
+    coleta = _coleta_atual
+    if coleta is None:
+        return
+    coleta.append({
+        "pagina": pagina,
+        **{metrica: metricas.get(metrica) for metrica in ("url",) + METRICAS},
+        "orcamento_excedido": [atributo for atributo, *_ in estouros],
+    })
+
+
+def resumir_por_pagina(registros):
+    """
+    EXPLICAÇÃO:
+    Mediana de cada métrica por página, com o número de navegações
+    e de orçamentos estourados: {pagina: {"navegacoes": n, ...}}
+    """
+    por_pagina = {}
+    for registro in registros:
+        por_pagina.setdefault(registro["pagina"], []).append(registro)
+    resumo = {}
+    for pagina, navegacoes in sorted(por_pagina.items()):
+        linha = {
+            "navegacoes": len(navegacoes),
+            "estouros": sum(1 for navegacao in navegacoes if navegacao.get("orcamento_excedido")),
+        }
+        for metrica in METRICAS:
+            valores = [navegacao[metrica] for navegacao in navegacoes if navegacao.get(metrica) is not None]
+            linha[metrica] = statistics.median(valores) if valores else None
+        resumo[pagina] = linha
+    return resumo
+
+
+def identificar_build():
+    """Identificador do build no CI (None rodando na máquina de alguém)"""
+    for variavel in VARIAVEIS_BUILD:
+        if os.environ.get(variavel):
+            return os.environ[variavel]
+    return None
+
+
+def exportar_serie(registros, caminho=ARQUIVO_SERIE, **contexto):
+    """
+    EXPLICAÇÃO:
+    Acrescenta as navegações desta execução no fim do JSONL
+    (uma linha por navegação, com instante, build e o que vier em "contexto").
+    O arquivo nunca é reescrito: cada build soma as suas linhas.
+    """
+    if not registros:
+        return 0
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    comum = {"instante": round(time.time(), 3), "build": identificar_build(), **contexto}
+    with open(caminho, "a", encoding="utf-8") as arquivo:
+        for registro in registros:
+            arquivo.write(json.dumps({**comum, **registro}, ensure_ascii=False) + "\n")
+    return len(registros)
+
+
+def ler_serie(caminho=ARQUIVO_SERIE):
+    """Todas as linhas do JSONL (para gráficos e comparações entre builds)"""
+    if not os.path.exists(caminho):
+        return []
+    with open(caminho, encoding="utf-8") as arquivo:
+        return [json.loads(linha) for linha in arquivo if linha.strip()]
@@ -0,0 +1,101 @@
+"""
+parallel - Utilidades para rodar a suíte em paralelo com pytest-xdist
+
+RESPONSABILIDADES:
+- Saber qual worker está rodando (gw0, gw1... ou "principal")
+- Dar a cada worker sua própria pasta de artefatos
+- Ordenar os mais lentos primeiro (durações vêm do utils.duration_history)
+- Juntar, no final, o que cada worker produziu num índice único
+"""
+
+import json
+import os
+import re
+
+DIRETORIO_ARTEFATOS = os.path.join("reports", "artefatos")
+
+
+def id_do_worker(config):
+    """
+    EXPLICAÇÃO:
+    No xdist cada worker recebe um nome (gw0, gw1...).
+    Sem paralelismo, o processo é o "principal".
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput:
+        return workerinput["workerid"]
+    return "principal"
+
+
+def eh_processo_principal(config):
+    """True no processo que coordena os workers (ou numa execução sem xdist)"""
+    return not hasattr(config, "workerinput")
+
+
+def modo_paralelo(config):
+    """True quando a execução está distribuída entre workers do xdist"""
+    return hasattr(config, "workerinput") or getattr(config.option, "dist", "no") != "no"
+
+
+def nodeid_sem_grupo(nodeid):
+    """
+    EXPLICAÇÃO:
+    Com --dist loadgroup, o xdist acrescenta o grupo ao nodeid
+    ("test_x[chrome]@chrome-0"). Histórico e mapa de impacto
+    usam o nodeid sem o grupo, que não muda entre execuções.
+    """
+    return re.sub(r"(?<=\])@[\w.-]+$", "", nodeid)
+
+
+def diretorio_do_worker(config, base=DIRETORIO_ARTEFATOS):
+    """
+    EXPLICAÇÃO:
+    Pasta exclusiva do worker: dois processos nunca escrevem no mesmo arquivo.
+    A pasta só é criada por quem for gravar algo nela.
+    """
+    return os.path.join(base, id_do_worker(config))
+
+
+def ordenar_mais_lentos_primeiro(items, duracoes):
+    """
+    EXPLICAÇÃO:
+    Coloca os testes mais demorados no começo da fila.
+    Assim eles começam cedo e não ficam "sobrando" sozinhos
+    num worker enquanto os outros já terminaram.
+
+    Testes sem histórico vão para o começo também (não sabemos
+    quanto demoram, melhor não deixar para o final) - entre eles,
+    os marcados como @pytest.mark.slow vão antes dos outros.
+    A ordenação é estável: todos os workers chegam na mesma ordem.
+    """
+    desconhecido = float("inf")
+    items.sort(
+        key=lambda item: (
+            -duracoes.get(nodeid_sem_grupo(item.nodeid), desconhecido),
+            item.get_closest_marker("slow") is None,
+        )
+    )
+
+
+def indexar_artefatos(base=DIRETORIO_ARTEFATOS):
+    """
+    EXPLICAÇÃO:
+    Junta os artefatos de todos os workers num único índice
+    (indice.json na pasta da execução), para o relatório final
+    """
+    indice = {}
+    if not os.path.isdir(base):
+        return indice
+
+    for worker in sorted(os.listdir(base)):
+        pasta = os.path.join(base, worker)
+        if not os.path.isdir(pasta):
+            continue
+        arquivos = []
+        for raiz, _, nomes in os.walk(pasta):
+            arquivos.extend(os.path.relpath(os.path.join(raiz, nome), base) for nome in sorted(nomes))
+        indice[worker] = arquivos
+
+    with open(os.path.join(base, "indice.json"), "w", encoding="utf-8") as arquivo:
+        json.dump(indice, arquivo, indent=2)
+    return indice
@@ -0,0 +1,175 @@
+"""
+remote_grid - Navegadores num Selenium Grid (ou standalone) remoto
+
+PROBLEMA:
+Todos os navegadores sobem na mesma máquina dos testes: o limite de
+paralelismo é a CPU/memória de um computador só. Num grid, cada
+sessão nova abre conexões HTTP novas, e quando todos os nós estão
+ocupados o grid recusa sessões ("session not created").
+
+SOLUÇÃO:
+- Um pool de conexões HTTP keep-alive por processo, dividido por
+  todas as sessões (em vez de um pool novo por navegador)
+- No máximo N sessões sendo CRIADAS ao mesmo tempo (criar é o caro:
+  o grid precisa achar um nó e subir um navegador lá)
+- Grid cheio ou fora do ar: tenta de novo, esperando cada vez mais
+  (1s, 2s, 4s... com um pouco de sorteio para os workers não voltarem
+  todos juntos)
+
+USO:
+    grid = GridRemoto("http://localhost:4444")
+    driver = grid.criar_sessao(ChromeOptions())
+    ...
+    grid.encerrar()
+
+GRID LOCAL (substituto do grid de verdade):
+    docker compose -f docker-compose.grid.yml up -d
+    pytest --grid-url=http://localhost:4444
+"""
+
+import json
+import random
+import threading
+import time
+
+import urllib3
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from utils.logger import obter_logger
+
+log = obter_logger(__name__)
+
+# Erros que valem uma nova tentativa: grid cheio (fila de sessões estourou)
+# ou grid inacessível por um instante (reiniciando, rede)
+ERROS_TEMPORARIOS = (SessionNotCreatedException, urllib3.exceptions.HTTPError)
+
+
+class _ConexaoCompartilhada(RemoteConnection):
+    """
+    EXPLICAÇÃO:
+    RemoteConnection do Selenium que usa o pool de conexões do grid
+    em vez de criar um pool próprio para cada navegador
+    """
+
+    def __init__(self, client_config, pool):
+        self._pool_compartilhado = pool
+        super().__init__(client_config=client_config)
+
+    def _get_connection_manager(self):
+        return self._pool_compartilhado
+
+    def close(self):
+        pass  # O pool é de todas as sessões: quem fecha é o GridRemoto.encerrar()
+
+
+class GridRemoto:
+    """
+    EXPLICAÇÃO:
+    Cria sessões webdriver.Remote num grid, dividindo as conexões HTTP
+
+    PARÂMETROS:
+    - url: endereço do grid (ex: http://localhost:4444)
+    - max_criacoes: quantas sessões podem estar sendo criadas ao mesmo tempo
+    - tentativas: quantas novas tentativas quando o grid recusa a sessão
+    - espera_inicial / espera_maxima: segundos entre tentativas (dobra a cada uma)
+    - conexoes: conexões keep-alive guardadas no pool
+    - tempo_limite: segundos de espera por uma resposta do grid
+      (criar sessão num grid ocupado pode demorar: ela fica na fila)
+    """
+
+    def __init__(self, url, max_criacoes=4, tentativas=5, espera_inicial=1.0, espera_maxima=30.0,
+                 conexoes=8, tempo_limite=300):
+        self.url = url.rstrip("/")
+        self.tentativas = tentativas
+        self.espera_inicial = espera_inicial
+        self.espera_maxima = espera_maxima
+
+        self._config = ClientConfig(remote_server_addr=self.url, keep_alive=True, timeout=tempo_limite)
+        self._pool = urllib3.PoolManager(num_pools=2, maxsize=conexoes, block=False)
+        self._criacoes = threading.BoundedSemaphore(max(1, max_criacoes))
+        self._lock = threading.Lock()
+        self._pronto = False
+
+        self.sessoes_criadas = 0
+        self.novas_tentativas = 0
+        self.segundos_esperando = 0.0
+
+    def aguardar_pronto(self, timeout=60):
+        """
+        EXPLICAÇÃO:
+        Espera o grid responder (GET /status) - útil logo depois de subir
+        o container. Grid que responde mas está ocupado não trava aqui:
+        a criação da sessão já espera na fila do próprio grid.
+        """
+        limite = time.monotonic() + timeout
+        respondeu, ultimo_erro = False, None
+        while True:
+            try:
+                resposta = self._pool.request("GET", f"{self.url}/status", timeout=5.0, retries=False)
+                estado = json.loads(resposta.data.decode("utf-8")).get("value", {})
+                respondeu = True
+                if estado.get("ready"):
+                    break
+                ultimo_erro = estado.get("message") or "grid não está pronto"
+            except (urllib3.exceptions.HTTPError, ValueError) as e:
+                ultimo_erro = str(e)
+            if time.monotonic() >= limite:
+                if not respondeu:
+                    raise RuntimeError(f"Grid {self.url} não respondeu em {timeout}s: {ultimo_erro}")
+                log.aviso("⚠️ Grid %s ainda não está pronto (%s): as sessões vão esperar na fila", self.url, ultimo_erro)
+                break
+            time.sleep(1.0)
+        self._pronto = True
+
+    def criar_sessao(self, opcoes):
+        """
+        EXPLICAÇÃO:
+        Abre uma sessão no grid com as opções do navegador.
+        Respeita o limite de criações simultâneas e tenta de novo
+        (com espera crescente) quando o grid está cheio.
+        """
+        with self._lock:
+            pronto = self._pronto
+        if not pronto:
+            self.aguardar_pronto()
+
+        for tentativa in range(self.tentativas + 1):
+            with self._criacoes:
+                try:
+                    driver = webdriver.Remote(
+                        command_executor=_ConexaoCompartilhada(self._config, self._pool), options=opcoes
+                    )
+                    with self._lock:
+                        self.sessoes_criadas += 1
+                    return driver
+                except ERROS_TEMPORARIOS as e:
+                    if tentativa == self.tentativas:
+                        raise
+                    erro = e
+
+            # Espera FORA do semáforo: outra criação pode tentar enquanto isso
+            espera = self._espera(tentativa)
+            with self._lock:
+                self.novas_tentativas += 1
+                self.segundos_esperando += espera
+            log.info("⏳ Grid recusou a sessão (%s), nova tentativa em %.1fs", erro.__class__.__name__, espera)
+            time.sleep(espera)
+
+    def _espera(self, tentativa):
+        """1x, 2x, 4x... a espera inicial, até a máxima, com sorteio entre 50% e 100%"""
+        return min(self.espera_maxima, self.espera_inicial * 2 ** tentativa) * random.uniform(0.5, 1.0)
+
+    def encerrar(self):
+        """Fecha as conexões guardadas (fim da sessão de testes)"""
+        self._pool.clear()
+
+    def estatisticas(self):
+        """Resumo numérico do grid (somado às estatísticas do pool de navegadores)"""
+        return {
+            "sessoes_remotas": self.sessoes_criadas,
+            "novas_tentativas_grid": self.novas_tentativas,
+            "segundos_esperando_grid": round(self.segundos_esperando, 1),
+        }
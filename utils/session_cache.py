@@ -0,0 +1,151 @@
+"""
+session_cache - Reaproveita sessões já autenticadas entre testes
+
+PROBLEMA:
+Testes que só precisam "estar logados" passam pelo formulário
+de login toda vez (navegar, digitar, clicar, esperar).
+
+SOLUÇÃO:
+- Faz o login de verdade UMA vez por conjunto de credenciais (por worker)
+- Guarda cookies, localStorage e sessionStorage
+- Nos próximos testes, injeta esse estado num navegador limpo
+  e vai direto para a página desejada
+- Sessões expiram (TTL) e as mais antigas saem quando o cache enche
+- Se o site recusar a sessão guardada, quem chamou faz login de verdade
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+CAPTURAR_STORAGE = """
+var copiar = function (storage) {
+    var dados = {};
+    try {
+        for (var i = 0; i < storage.length; i++) {
+            var chave = storage.key(i);
+            dados[chave] = storage.getItem(chave);
+        }
+    } catch (e) {}
+    return dados;
+};
+return {local: copiar(window.localStorage), sessao: copiar(window.sessionStorage)};
+"""
+
+RESTAURAR_STORAGE = """
+var local = arguments[0], sessao = arguments[1];
+Object.keys(local).forEach(function (chave) { window.localStorage.setItem(chave, local[chave]); });
+Object.keys(sessao).forEach(function (chave) { window.sessionStorage.setItem(chave, sessao[chave]); });
+"""
+
+
+@dataclass
+class SessaoSalva:
+    """Tudo o que o navegador precisa para "continuar logado" """
+    origem: str
+    cookies: list
+    local_storage: dict = field(default_factory=dict)
+    session_storage: dict = field(default_factory=dict)
+    criada_em: float = field(default_factory=time.monotonic)
+
+
+def origem_de(url):
+    """https://site.com/login -> https://site.com"""
+    partes = urlsplit(url)
+    return f"{partes.scheme}://{partes.netloc}"
+
+
+def capturar_sessao(driver):
+    """
+    EXPLICAÇÃO:
+    Tira uma "foto" da sessão logada: cookies + storages da página atual
+    """
+    storage = driver.execute_script(CAPTURAR_STORAGE) or {}
+    return SessaoSalva(
+        origem=origem_de(driver.current_url),
+        cookies=driver.get_cookies(),
+        local_storage=storage.get("local", {}),
+        session_storage=storage.get("sessao", {}),
+    )
+
+
+def restaurar_sessao(driver, sessao, url_destino):
+    """
+    EXPLICAÇÃO:
+    Coloca a sessão salva num navegador e abre url_destino.
+
+    No Chrome os cookies entram via DevTools, sem precisar abrir
+    nenhuma página antes. Nos outros navegadores é preciso estar no
+    domínio para adicionar cookies, então abrimos a origem primeiro.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        cookies = []
+        for cookie in sessao.cookies:
+            cookie = dict(cookie, url=sessao.origem)
+            cookie.pop("expiry", None)  # O CDP usa "expires"; sem ele vira cookie de sessão
+            cookie.pop("domain", None)  # Com "url" o domínio vem dela (inclusive host-only)
+            cookies.append(cookie)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+    else:
+        driver.get(sessao.origem + "/")
+        for cookie in sessao.cookies:
+            driver.add_cookie(cookie)
+
+    driver.get(url_destino)
+
+    if sessao.local_storage or sessao.session_storage:
+        driver.execute_script(RESTAURAR_STORAGE, sessao.local_storage, sessao.session_storage)
+
+
+class CacheSessoes:
+    """
+    EXPLICAÇÃO:
+    Guarda sessões por chave (ex: site + usuário + senha)
+
+    PARÂMETROS:
+    - ttl: segundos até uma sessão ser considerada velha
+    - max_sessoes: quantas sessões guardar (as mais antigas saem primeiro)
+    """
+
+    def __init__(self, ttl=600, max_sessoes=20):
+        self.ttl = ttl
+        self.max_sessoes = max_sessoes
+        self._sessoes = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.acertos = 0
+        self.falhas = 0
+        self.rejeicoes = 0
+
+    def obter(self, chave):
+        """Sessão guardada e ainda válida (ou None)"""
+        with self._lock:
+            sessao = self._sessoes.get(chave)
+            if sessao is None:
+                self.falhas += 1
+                return None
+            if time.monotonic() - sessao.criada_em > self.ttl:
+                del self._sessoes[chave]
+                self.falhas += 1
+                return None
+            self._sessoes.move_to_end(chave)
+            self.acertos += 1
+            return sessao
+
+    def guardar(self, chave, sessao):
+        with self._lock:
+            self._sessoes[chave] = sessao
+            self._sessoes.move_to_end(chave)
+            while len(self._sessoes) > self.max_sessoes:
+                self._sessoes.popitem(last=False)
+
+    def rejeitar(self, chave):
+        """O site não aceitou a sessão guardada: descarta para não tentar de novo"""
+        with self._lock:
+            self._sessoes.pop(chave, None)
+            self.rejeicoes += 1
+
+    def estatisticas(self):
+        return {"acertos": self.acertos, "falhas": self.falhas, "rejeicoes": self.rejeicoes}
@@ -0,0 +1,159 @@
+"""
+timing - Gravador de "spans" (trechos cronometrados) de cada teste
+
+PROBLEMA:
+Um teste lento pode ser lento por causa do navegador subindo,
+da navegação, das esperas ou das verificações. Sem medir, é chute.
+
+SOLUÇÃO:
+Cada ação da BasePage e cada fase do teste vira um span:
+{nome, início, duração, profundidade}. Os spans de um teste
+formam um "flame graph" simples e são exportados em JSON.
+No final, somamos tudo numa tabela dos maiores "ralos de tempo".
+
+CUSTO:
+Sem gravação ativa, um span é só um "if" - praticamente zero.
+Com gravação, são duas leituras de relógio e um append numa lista.
+"""
+
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# Gravador do teste que está rodando agora (None = não grava nada)
+_gravador_atual = None
+
+
+class GravadorSpans:
+    """
+    EXPLICAÇÃO:
+    Guarda os spans de UM teste, na ordem em que terminaram
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.spans = []
+        self._profundidade = 0
+
+    @contextmanager
+    def span(self, nome, detalhe=None):
+        inicio = time.perf_counter()
+        self._profundidade += 1
+        try:
+            yield
+        finally:
+            self._profundidade -= 1
+            self.spans.append((nome, detalhe, inicio, time.perf_counter() - inicio, self._profundidade))
+
+    def exportar(self):
+        """Spans em formato JSON (tempos em milissegundos desde o início do teste)"""
+        return [
+            {
+                "nome": nome,
+                "detalhe": None if detalhe is None else str(detalhe),
+                "inicio_ms": round((inicio - self.inicio) * 1000, 3),
+                "duracao_ms": round(duracao * 1000, 3),
+                "profundidade": profundidade,
+            }
+            for nome, detalhe, inicio, duracao, profundidade in sorted(self.spans, key=lambda span: span[2])
+        ]
+
+    def totais(self):
+        """
+        EXPLICAÇÃO:
+        Soma o tempo por nome de span: {nome: [chamadas, segundos]}.
+        Só contamos o tempo "próprio" (sem os spans filhos), para que
+        um clicar() dentro de fazer_login() não seja contado duas vezes.
+        """
+        ordenados = sorted(self.spans, key=lambda span: (span[2], span[4]))
+        totais = {}
+        for indice, (nome, _, inicio, duracao, profundidade) in enumerate(ordenados):
+            filhos = 0.0
+            fim = inicio + duracao
+            for outro in ordenados[indice + 1:]:
+                if outro[2] >= fim:
+                    break
+                if outro[4] == profundidade + 1:
+                    filhos += outro[3]
+            chamadas, segundos = totais.get(nome, (0, 0.0))
+            totais[nome] = (chamadas + 1, segundos + max(duracao - filhos, 0.0))
+        return {nome: list(valores) for nome, valores in totais.items()}
+
+
+def iniciar_gravacao():
+    """Começa a gravar os spans de um novo teste"""
+    global _gravador_atual
+    _gravador_atual = GravadorSpans()
+    return _gravador_atual
+
+
+def encerrar_gravacao():
+    """Para de gravar e devolve o gravador do teste que terminou"""
+    global _gravador_atual
+    gravador, _gravador_atual = _gravador_atual, None
+    return gravador
+
+
+@contextmanager
+def span(nome, detalhe=None):
+    """
+    EXPLICAÇÃO:
+    Cronometra o bloco "with" - se não houver gravação ativa, não faz nada
+
+    USO:
+        with span("login.preencher"):
+            ...
+    """
+    gravador = _gravador_atual
+    if gravador is None:
+        yield
+        return
+    with gravador.span(nome, detalhe):
+        yield
+
+
+def medido(metodo):
+    """
+    EXPLICAÇÃO:
+    Decorator que transforma cada chamada do método num span.
+    O primeiro argumento (locator, URL...) vai como detalhe.
+    """
+    nome = metodo.__name__
+
+    @functools.wraps(metodo)
+    def envoltorio(self, *args, **kwargs):
+        gravador = _gravador_atual
+        if gravador is None:
+            return metodo(self, *args, **kwargs)
+        with gravador.span(nome, args[0] if args else None):
+            return metodo(self, *args, **kwargs)
+
+    return envoltorio
+
+
+def somar_totais(acumulado, totais):
+    """Junta totais de vários testes (ou de vários workers) em "acumulado" """
+    for nome, (chamadas, segundos) in totais.items():
+        atual = acumulado.setdefault(nome, [0, 0.0])
+        atual[0] += chamadas
+        atual[1] += segundos
+    return acumulado
+
+
+def maiores_ralos(totais, limite=10):
+    """Os spans que mais somaram tempo: [(nome, chamadas, segundos, % do total)]"""
+    tempo_total = sum(segundos for _, segundos in totais.values()) or 1.0
+    ordenados = sorted(totais.items(), key=lambda item: item[1][1], reverse=True)[:limite]
+    return [
+        (nome, chamadas, segundos, 100.0 * segundos / tempo_total)
+        for nome, (chamadas, segundos) in ordenados
+    ]
+
+
+def salvar_spans(gravador, caminho):
+    """Grava os spans de um teste em JSON"""
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(gravador.exportar(), arquivo, indent=2, ensure_ascii=False)